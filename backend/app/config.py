@@ -1,6 +1,7 @@
 import os
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -10,6 +11,8 @@ backend_dir = Path(__file__).resolve().parent.parent
 dotenv_path = backend_dir / ".env"
 
 # 💡 계산된 절대 경로를 사용하여 .env 파일을 명시적으로 로드합니다.
+# Settings 기본값과 다른 모듈의 import 시점 os.getenv(DATABASE_URL 등)가
+# .env 값을 보도록 import 시점에 로드해 둡니다. (모듈 import는 프로세스당 한 번)
 load_dotenv(dotenv_path=dotenv_path)
 
 def _getenv(name: str, default: str | None = None) -> str | None:
@@ -23,6 +26,7 @@ def _parse_bool(value: str | None, default: bool = False) -> bool:
     return value.lower() in ("1", "true", "yes")
 
 
+@cache
 def _norm_openai_base(url: str | None) -> str | None:
     if not url:
         return None
@@ -33,7 +37,26 @@ def _norm_openai_base(url: str | None) -> str | None:
     return u
 
 
-@dataclass(frozen=True)
+# API 키 풀 (라운드로빈용) - P0-7
+# OPENAI_API_KEYS 환경변수로 콤마 구분 키 지정 가능
+# 예: OPENAI_API_KEYS=sk-key1,sk-key2,sk-key3
+_OPENAI_API_KEYS: tuple[str, ...] = tuple(
+    key.strip()
+    for key in (os.getenv("OPENAI_API_KEYS") or "").split(",")
+    if key.strip()
+) or (os.getenv("OPENAI_API_KEY", ""),)  # 폴백: 기존 단일 키
+
+# 내부 메일 도메인(회원가입 허용 도메인) — 콤마로 여러 개 지정 가능
+# 예: INTERNAL_EMAIL_DOMAIN=soosan.com,soosan.co.kr
+# 멤버십 검사(domain in internal_email_domains) 용도이므로 frozenset
+_INTERNAL_EMAIL_DOMAINS: frozenset[str] = frozenset(
+    d.strip().lower()
+    for d in (os.getenv("INTERNAL_EMAIL_DOMAIN") or "soosan.com,soosan.co.kr").split(",")
+    if d.strip()
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Settings:
     # App
     app_env: str = _getenv("APP_ENV", "dev") or "dev"
@@ -42,15 +65,7 @@ class Settings:
     openai_api_key: str = _getenv("OPENAI_API_KEY", "")
 
     # API 키 풀 (라운드로빈용) - P0-7
-    # OPENAI_API_KEYS 환경변수로 콤마 구분 키 지정 가능
-    # 예: OPENAI_API_KEYS=sk-key1,sk-key2,sk-key3
-    openai_api_keys: list[str] = field(
-        default_factory=lambda: [
-            key.strip()
-            for key in (os.getenv("OPENAI_API_KEYS") or "").split(",")
-            if key.strip()
-        ] or [os.getenv("OPENAI_API_KEY", "")]  # 폴백: 기존 단일 키
-    )
+    openai_api_keys: tuple[str, ...] = _OPENAI_API_KEYS
 
     # 새 이름(권장)과 구 이름 둘 다 허용
     openai_base_url: str | None = _norm_openai_base(
@@ -80,17 +95,8 @@ class Settings:
         else (int(_expire_minutes_env) * 60 if _expire_minutes_env else 3600)
     )
 
-    # 내부 메일 도메인(회원가입 허용 도메인) — 콤마로 여러 개 지정 가능
-    # 예: INTERNAL_EMAIL_DOMAIN=soosan.com,soosan.co.kr
-    internal_email_domains: list[str] = field(
-        default_factory=lambda: [
-            d.strip().lower()
-            for d in (
-                os.getenv("INTERNAL_EMAIL_DOMAIN") or "soosan.com,soosan.co.kr"
-            ).split(",")
-            if d.strip()
-        ]
-    )
+    # 내부 메일 도메인(회원가입 허용 도메인)
+    internal_email_domains: frozenset[str] = _INTERNAL_EMAIL_DOMAINS
 
     # CORS
     cors_allow_origins: str = (
@@ -100,6 +106,12 @@ class Settings:
 
     require_auth_upload: bool = _parse_bool(_getenv("REQUIRE_AUTH_UPLOAD"), default=False)
 
+    # 업로드 작업 상태 저장 파일 (SQLite). 비우면 인메모리 저장 (재시작 시 소실)
+    job_store_path: str | None = _getenv("JOB_STORE_PATH") or None
+
+    # Vision API 응답 캐시 파일 (SQLite). 비우면 인메모리 LRU (재시작 시 소실)
+    vision_cache_path: str | None = _getenv("VISION_CACHE_PATH") or None
+
 
 settings = Settings()
 
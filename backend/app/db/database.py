@@ -23,12 +23,30 @@ if not DATABASE_URL:
 # SQLAlchemy Engine 옵션
 engine_args: dict = dict(pool_pre_ping=True)
 
+# 서버 DB일 때 커넥션 풀 크기 조정 (SQLite는 단일 writer라 기본값 유지)
+# LIFO 재사용으로 최근 사용한 커넥션을 계속 쓰고, 유휴 커넥션은 자연스럽게 정리되도록 함
+if not DATABASE_URL.startswith("sqlite"):
+    engine_args.update(
+        pool_size=20,
+        max_overflow=40,
+        pool_recycle=1800,
+        pool_use_lifo=True,
+    )
+
 # MSSQL(pyodbc)일 때 대량 insert 성능옵션(선택)
 if DATABASE_URL.startswith("mssql+pyodbc://"):
     engine_args["fast_executemany"] = True
 
 engine: Engine = create_engine(DATABASE_URL, **engine_args)
 
+if DATABASE_URL.startswith("mssql+pyodbc://"):
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _enable_fast_executemany(conn, cursor, statement, params, context, executemany):
+        # 안전망: 다이얼렉트 옵션이 적용되지 않은 커서에도 executemany는 배치 전송
+        if executemany:
+            cursor.fast_executemany = True
+
 # SQLite일 때만 PRAGMA 안전성 설정
 if DATABASE_URL.startswith("sqlite:///"):
 
@@ -36,7 +54,10 @@ if DATABASE_URL.startswith("sqlite:///"):
     def _set_sqlite_pragma(dbapi_conn, _):
         cur = dbapi_conn.cursor()
         cur.execute("PRAGMA journal_mode=WAL;")
-        cur.execute("PRAGMA synchronous=FULL;")
+        # WAL에서는 NORMAL로도 크래시 내구성이 보장되고, fsync는 체크포인트 때만 발생
+        cur.execute("PRAGMA synchronous=NORMAL;")
+        cur.execute("PRAGMA cache_size=-64000;")  # 64MB 페이지 캐시
+        cur.execute("PRAGMA temp_store=MEMORY;")
         cur.execute("PRAGMA busy_timeout=30000;")
         cur.execute("PRAGMA foreign_keys=ON;")
         cur.close()
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
 from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Index, func, ForeignKey
-from sqlalchemy.schema import UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.db.database import Base
 
+# 모델 정의는 이 파일 하나만 유지합니다.
+# 같은 모델이 다른 모듈(복사본/다른 import 경로)에서 다시 선언되면 테이블이 이중 등록되므로 조기에 실패시킴
+if "users" in Base.metadata.tables:
+    raise RuntimeError(
+        "ORM models already registered on Base.metadata; "
+        "app.db.models must be the single source of model definitions"
+    )
+
 
 # ─────────────────────────────────────────────────────────
 # Team: 팀별 문서 격리를 위한 팀 테이블
@@ -34,7 +41,13 @@ class Team(Base):
 class User(Base):
     __tablename__ = "users"
     __table_args__ = (
-        UniqueConstraint("username", name="UX_users_username"),
+        # 로그인 조회(username) 시 필요한 컬럼을 MSSQL에서는 인덱스에 포함 → 키 룩업 없이 한 번의 seek
+        Index(
+            "UX_users_username",
+            "username",
+            unique=True,
+            mssql_include=["password_hash", "security_level", "is_active", "team_id"],
+        ),
         Index("idx_users_team_id", "team_id"),
     )
 
@@ -69,8 +82,10 @@ class QueryLog(Base):
     """
     __tablename__ = "query_logs"
     __table_args__ = (
-        Index('idx_query_logs_created_at', 'created_at'),
-        Index('idx_query_logs_user_id', 'user_id'),
+        # FAQ 윈도우 스캔(created_at 범위 + 정렬): MSSQL에서는 question까지 포함한 커버링 인덱스
+        Index('idx_query_logs_created_at', 'created_at', mssql_include=['question']),
+        # 사용자별 최근 질문 조회: 필터와 정렬을 한 번의 seek로 처리
+        Index('idx_query_logs_user_created', 'user_id', 'created_at'),
     )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
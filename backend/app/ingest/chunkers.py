@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import Iterable, List, Tuple, Optional, Dict
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Iterable, Iterator, List, Tuple, Optional, Dict
 from pathlib import Path
 
 # Import structure analyzer (conditional)
@@ -23,62 +25,86 @@ def merge_blocks_to_chunks(
     min_chars: int = 500,
     max_chars: int = 1200,
     overlap: int = 150,
-) -> List[str]:
+) -> Iterator[str]:
     """
-    문단 리스트를 받아 길이 범위에 맞춰 청크로 병합.
+    문단 리스트를 받아 길이 범위에 맞춰 청크로 병합 (제너레이터).
     - 너무 짧은 것은 이전/다음과 합치고, 너무 긴 것은 적당히 잘라서 겹침(overlap) 부여.
+    - 긴 청크를 자를 때는 가능한 한 문단 경계에 맞춰 자름 (문단 하나가 너무 길면 글자 수로 자름).
+    - 완성된 청크는 바로 yield 하므로 메모리는 문서 전체가 아니라 현재 청크 크기에 비례.
+      리스트가 필요하면 list(merge_blocks_to_chunks(...))로 사용.
     """
-    chunks: List[str] = []
     buf: List[str] = []
     size = 0
 
-    def flush():
-        nonlocal buf, size
-        if buf:
-            text = "\n".join(buf).strip()
-            if text:
-                chunks.append(text)
-            buf, size = [], 0
-
     for block in blocks:
         b = block.strip()
         if not b:
             continue
-        if size + len(b) + 1 <= max_chars:
+        n = len(b)
+        if size + n + 1 <= max_chars:
             buf.append(b)
-            size += len(b) + 1
+            size += n + 1
             continue
 
         # 현재 buf를 청크로 내보내기
         if size >= min_chars:
-            flush()
-            buf.append(b)
-            size = len(b)
+            if buf:
+                yield from _split_with_overlap(buf, min_chars, max_chars, overlap)
+            buf = [b]
+            size = n
         else:
             # 최소 길이 미달이면 조금 오버해도 합치기
             buf.append(b)
-            size += len(b) + 1
-            flush()
+            yield from _split_with_overlap(buf, min_chars, max_chars, overlap)
+            buf, size = [], 0
 
-    flush()
+    if buf:
+        yield from _split_with_overlap(buf, min_chars, max_chars, overlap)
 
-    # 긴 청크는 잘라서 overlap 부여
-    final: List[str] = []
-    for ch in chunks:
-        if len(ch) <= max_chars:
-            final.append(ch)
-            continue
-        start = 0
-        while start < len(ch):
-            end = min(len(ch), start + max_chars)
-            part = ch[start:end]
-            final.append(part.strip())
-            if end == len(ch):
-                break
-            start = end - overlap  # 겹침
-            if start < 0:
-                start = 0
-    return [c for c in final if c]
+
+def _split_with_overlap(
+    parts: List[str],
+    min_chars: int,
+    max_chars: int,
+    overlap: int,
+) -> Iterator[str]:
+    """
+    병합된 문단 묶음을 max_chars 이하 조각으로 잘라 yield (overlap 부여).
+
+    문단 시작 오프셋을 누적합으로 한 번 계산해 두고, 자를 위치는 bisect로
+    직전 문단 경계에 맞춤. 슬라이싱은 조각마다 한 번만 수행.
+    """
+    text = "\n".join(parts)
+    total = len(text)
+    if total <= max_chars:
+        yield text
+        return
+
+    # offsets[i] = i번째 문단의 시작 오프셋 (마지막 원소는 total + 1)
+    offsets = list(accumulate((len(p) + 1 for p in parts), initial=0))
+    min_piece = max(min_chars, 1)
+    cur = 0
+    while True:
+        end = min(total, cur + max_chars)
+        if end < total:
+            # end 이전의 마지막 문단 경계(문단 앞 개행 위치)로 스냅
+            boundary = offsets[bisect_right(offsets, end + 1) - 1] - 1
+            if boundary - cur >= min_piece:
+                end = boundary
+        piece = text[cur:end].strip()
+        if piece:
+            yield piece
+        if end == total:
+            break
+        nxt = end - overlap  # 겹침
+        if nxt <= cur:
+            nxt = end
+        else:
+            # 겹침 시작점도 문단 시작에 맞출 수 있으면 맞춤
+            j = bisect_left(offsets, nxt)
+            if offsets[j] < end:
+                nxt = offsets[j]
+        cur = nxt
 
 
 # =============================================================================
@@ -195,43 +221,46 @@ def _split_article_by_items(
 
     Returns:
         List of dicts with keys: text, page_range, metadata
+        (같은 조항의 청크들은 metadata dict 하나를 공유하므로 호출 측에서 수정하지 말 것)
     """
     chunks = []
 
     # 조항 제목 + 본문을 헤더로
-    header = ""
-    if article.full_title:
-        header = article.full_title + "\n"
-    if article.content:
-        header += article.content + "\n"
+    header = "".join(
+        part + "\n" for part in (article.full_title, article.content) if part
+    )
+    header_len = len(header)
+    page_range = (article.page_num, article.page_num)
+    base_meta = {
+        "section_title": article.full_title,
+        "article_number": article.number,
+        "hierarchy_level": article.hierarchy_level,
+        "parent_article": None,
+        "is_complete_article": False,  # 부분 조항
+    }
+
+    # 항목 텍스트는 한 번만 만들어 두고 루프에서는 길이 계산만 수행
+    item_texts = [f"{item.number}. {item.content}" for item in article.items]
 
     # 항목들을 그룹으로 묶기
-    current_group = []
-    current_size = len(header)
+    current_group: List[str] = []
+    current_size = header_len
 
-    for item in article.items:
-        item_text = f"{item.number}. {item.content}"
+    for item_text in item_texts:
         item_size = len(item_text)
 
         # 현재 그룹에 추가하면 max_chars 초과하는 경우
         if current_size + item_size + 1 > max_chars and current_group:
             # 현재 그룹을 청크로 저장
-            chunk_text = header + "\n".join(current_group)
             chunks.append({
-                "text": chunk_text.strip(),
-                "page_range": (article.page_num, article.page_num),
-                "metadata": {
-                    "section_title": article.full_title,
-                    "article_number": article.number,
-                    "hierarchy_level": article.hierarchy_level,
-                    "parent_article": None,
-                    "is_complete_article": False,  # 부분 조항
-                }
+                "text": (header + "\n".join(current_group)).strip(),
+                "page_range": page_range,
+                "metadata": base_meta,
             })
 
             # 새 그룹 시작
             current_group = [item_text]
-            current_size = len(header) + item_size
+            current_size = header_len + item_size
         else:
             # 현재 그룹에 추가
             current_group.append(item_text)
@@ -239,17 +268,10 @@ def _split_article_by_items(
 
     # 마지막 그룹
     if current_group:
-        chunk_text = header + "\n".join(current_group)
         chunks.append({
-            "text": chunk_text.strip(),
-            "page_range": (article.page_num, article.page_num),
-            "metadata": {
-                "section_title": article.full_title,
-                "article_number": article.number,
-                "hierarchy_level": article.hierarchy_level,
-                "parent_article": None,
-                "is_complete_article": False,
-            }
+            "text": (header + "\n".join(current_group)).strip(),
+            "page_range": page_range,
+            "metadata": base_meta,
         })
 
     return chunks
@@ -1,15 +1,17 @@
 from __future__ import annotations
+import os
 from pathlib import Path
 
+# 확장자 -> 파서 타입 (새 형식은 여기에 추가)
+_EXT_MAP: dict[str, str] = {
+    ".pdf": "pdf",
+    ".docx": "docx",
+    ".txt": "txt",
+    ".html": "html",
+    ".htm": "html",
+}
 
-def detect_type(p: Path) -> str:
-    ext = p.suffix.lower()
-    if ext in {".pdf"}:
-        return "pdf"
-    if ext in {".docx"}:
-        return "docx"
-    if ext in {".txt"}:
-        return "txt"
-    if ext in {".html", ".htm"}:
-        return "html"
-    return "unknown"
+
+def detect_type(p: Path | str) -> str:
+    ext = p.suffix if isinstance(p, Path) else os.path.splitext(p)[1]
+    return _EXT_MAP.get(ext.lower(), "unknown")
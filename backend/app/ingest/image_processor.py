@@ -20,9 +20,9 @@ except ImportError:
 
 # Vision API 처리
 try:
-    from app.ingest.parsers.vision_processor import batch_process_images
+    from app.ingest.parsers.vision_processor import batch_process_image_stream
 except ImportError:
-    batch_process_images = None
+    batch_process_image_stream = None
 
 
 async def process_pdf_images(
@@ -46,35 +46,42 @@ async def process_pdf_images(
       - image_data: 이미지 바이너리 데이터 (저장용)
       - image_format: 이미지 포맷 (png, jpeg 등)
     """
-    if not extract_images_with_full_tables or not batch_process_images:
+    if not extract_images_with_full_tables or not batch_process_image_stream:
         log.warning("[IMAGE] Image processing modules not available")
         return []
 
     try:
         # 1) 이미지 추출 (표 이미지는 전체 영역으로 확장 캡처)
         log.info(f"[IMAGE] Extracting images from {file_path.name}")
-        extracted_images = extract_images_with_full_tables(file_path)
+        # 제너레이터를 배치 단위로 소비하므로 전체 이미지 목록을 한 번에 메모리에 올리지 않음
+        counts = {"total": 0, "kept": 0}
+
+        def _target_images():
+            for img in extract_images_with_full_tables(file_path):
+                counts["total"] += 1
+                # skip_tables 옵션: 표 이미지 제외 (pdfplumber로 이미 처리한 경우)
+                if skip_tables and img.image_type == "table":
+                    continue
+                counts["kept"] += 1
+                yield img
+
+        # 2) Vision API로 배치 처리 (추출과 처리를 IMAGE_STREAM_BATCH_SIZE개씩 번갈아 수행)
+        log.info(f"[IMAGE] Processing images with Vision API...")
+        results = await batch_process_image_stream(_target_images(), max_concurrent=3)
 
-        if not extracted_images:
+        if not counts["total"]:
             log.info(f"[IMAGE] No images found in {file_path.name}")
             return []
 
-        # skip_tables 옵션: 표 이미지 제외 (pdfplumber로 이미 처리한 경우)
         if skip_tables:
-            original_count = len(extracted_images)
-            extracted_images = [img for img in extracted_images if img.image_type != "table"]
             log.info(
-                f"[IMAGE] Skipping table images: {original_count} -> {len(extracted_images)} images"
+                f"[IMAGE] Skipping table images: {counts['total']} -> {counts['kept']} images"
             )
 
-        if not extracted_images:
+        if not counts["kept"]:
             return []
 
-        log.info(f"[IMAGE] Found {len(extracted_images)} images in {file_path.name}")
-
-        # 2) Vision API로 배치 처리
-        log.info(f"[IMAGE] Processing images with Vision API...")
-        results = await batch_process_images(extracted_images, max_concurrent=3)
+        log.info(f"[IMAGE] Found {counts['kept']} images in {file_path.name}")
 
         # 3) 결과 변환 (이미지 바이너리 데이터 포함)
         image_chunks = []
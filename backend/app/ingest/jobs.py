@@ -1,22 +1,64 @@
 from __future__ import annotations
+from collections import deque
 from dataclasses import dataclass, field
-from threading import Lock
-from typing import Dict, List, Optional
-from datetime import datetime
+from pathlib import Path
+from threading import Lock, local
+from typing import Deque, Dict, List, Optional, Set
+import sqlite3
+import time
+from datetime import datetime, timezone
+from app.config import settings
 from app.models.schemas import IngestJobStatus
 from app.services.logging import get_logger
 
 log = get_logger("app.ingest.jobs")
 
 
+class _Counter:
+    """job별 진행 카운터 (job마다 자체 Lock → 서로 다른 job끼리 경합 없음)"""
+
+    __slots__ = ("_value", "_lock")
+
+    def __init__(self, value: int = 0):
+        self._value = value
+        self._lock = Lock()
+
+    def inc(self, n: int = 1) -> int:
+        with self._lock:
+            self._value += n
+            return self._value
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+
+def _to_iso(ts: float) -> str:
+    """epoch 초 → UTC ISO 문자열 (기존 datetime.utcnow().isoformat()과 같은 naive 형식)"""
+    return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None).isoformat()
+
+
+_SHARD_COUNT = 16  # 2의 거듭제곱 (hash & (N-1)로 샤드 선택)
+
+
+class _Shard:
+    """job dict 샤드 (샤드마다 자체 Lock → 서로 다른 샤드의 등록/정리는 경합 없음)"""
+
+    __slots__ = ("jobs", "lock")
+
+    def __init__(self):
+        self.jobs: Dict[str, _Job] = {}
+        self.lock = Lock()
+
+
 @dataclass
 class _Job:
     status: str = "pending"  # pending | running | succeeded | failed
-    processed: int = 0
+    processed: _Counter = field(default_factory=_Counter)
     total: int = 0
-    errors: List[str] = field(default_factory=list)
+    errors: Deque[str] = field(default_factory=deque)  # append는 스레드 안전
     owner_id: Optional[int] = None  # 업로드한 사용자 ID
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: float = field(default_factory=time.time)  # epoch 초 (응답 시에만 ISO 변환)
 
 
 class JobStore:
@@ -25,75 +67,70 @@ class JobStore:
 
     특징:
     - 사용자별 진행 중인 job 추적
-    - 스레드 안전 (Lock 사용)
+    - 스레드 안전: 진행 카운터는 job별 Lock, 에러는 deque 사용
+      job dict는 job_id 해시로 16개 샤드에 나눠 등록/정리 시 해당 샤드만 Lock
+      사용자별 job 매핑은 별도 Lock으로 보호하고 단일 job 조회는 Lock 없이 수행
     - 서버 재시작 시 소실됨 (영구 저장 필요 시 Redis/DB 사용)
     """
 
     def __init__(self):
-        self._jobs: Dict[str, _Job] = {}
-        self._user_jobs: Dict[int, List[str]] = {}  # owner_id -> [job_id, ...]
-        self._lock = Lock()
+        self._shards: List[_Shard] = [_Shard() for _ in range(_SHARD_COUNT)]
+        self._user_jobs: Dict[int, Set[str]] = {}  # owner_id -> {job_id, ...}
+        self._user_lock = Lock()
+
+    def _shard(self, job_id: str) -> _Shard:
+        return self._shards[hash(job_id) & (_SHARD_COUNT - 1)]
+
+    def _get_job(self, job_id: str) -> Optional[_Job]:
+        return self._shard(job_id).jobs.get(job_id)
 
     def start(self, job_id: str, total: int, owner_id: Optional[int] = None):
         """새 작업 시작"""
-        with self._lock:
-            self._jobs[job_id] = _Job(
+        shard = self._shard(job_id)
+        with shard.lock:
+            shard.jobs[job_id] = _Job(
                 status="running",
-                processed=0,
                 total=total,
-                errors=[],
                 owner_id=owner_id,
-                created_at=datetime.utcnow(),
             )
-            # 사용자별 job 매핑 추가
-            if owner_id is not None:
-                if owner_id not in self._user_jobs:
-                    self._user_jobs[owner_id] = []
-                self._user_jobs[owner_id].append(job_id)
+        # 사용자별 job 매핑 추가
+        if owner_id is not None:
+            with self._user_lock:
+                self._user_jobs.setdefault(owner_id, set()).add(job_id)
         log.info("job start job_id=%s total=%d owner_id=%s", job_id, total, owner_id)
 
-    def inc(self, job_id: str):
-        """진행률 증가"""
-        with self._lock:
-            j = self._jobs.get(job_id)
-            if j:
-                j.processed += 1
-                cur = j.processed
-        log.debug(
-            "job progress job_id=%s processed=%s",
-            job_id,
-            cur if "cur" in locals() else "?",
-        )
+    def inc(self, job_id: str, n: int = 1):
+        """진행률 증가 (여러 항목을 처리한 워커는 n으로 한 번에 반영)"""
+        j = self._get_job(job_id)
+        cur = j.processed.inc(n) if j else "?"
+        log.debug("job progress job_id=%s processed=%s", job_id, cur)
 
     def add_error(self, job_id: str, msg: str):
         """에러 추가"""
-        with self._lock:
-            j = self._jobs.get(job_id)
-            if j:
-                j.errors.append(msg)
+        j = self._get_job(job_id)
+        if j:
+            j.errors.append(msg)
         log.error("job error job_id=%s %s", job_id, msg)
 
     def finish(self, job_id: str):
         """작업 완료 처리"""
-        with self._lock:
-            j = self._jobs.get(job_id)
-            status = "failed"
-            if j and not j.errors:
-                j.status = "succeeded"
-                status = "succeeded"
-            elif j:
-                j.status = "failed"
+        j = self._get_job(job_id)
+        status = "failed"
+        if j and not j.errors:
+            j.status = "succeeded"
+            status = "succeeded"
+        elif j:
+            j.status = "failed"
         log.info("job finish job_id=%s status=%s", job_id, status)
 
     def get(self, job_id: str) -> IngestJobStatus:
-        """특정 job 상태 조회"""
-        with self._lock:
-            j = self._jobs.get(job_id)
-            if not j:
-                return IngestJobStatus(status="pending", processed=0, total=0, errors=[])
-            return IngestJobStatus(
-                status=j.status, processed=j.processed, total=j.total, errors=list(j.errors)
-            )
+        """특정 job 상태 조회 (Lock 없이 스냅샷)"""
+        j = self._get_job(job_id)
+        if not j:
+            return IngestJobStatus(status="pending", processed=0, total=0, errors=[])
+        return IngestJobStatus(
+            status=j.status, processed=j.processed.value, total=j.total, errors=list(j.errors)
+        )
 
     def get_active_jobs_for_user(self, owner_id: int) -> List[Dict]:
         """
@@ -102,22 +139,28 @@ class JobStore:
         Returns:
             [{"job_id": str, "status": str, "processed": int, "total": int}, ...]
         """
-        with self._lock:
-            job_ids = self._user_jobs.get(owner_id, [])
-            active_jobs = []
-
-            for job_id in job_ids:
-                j = self._jobs.get(job_id)
-                if j and j.status in ("pending", "running"):
-                    active_jobs.append({
-                        "job_id": job_id,
-                        "status": j.status,
-                        "processed": j.processed,
-                        "total": j.total,
-                        "created_at": j.created_at.isoformat() if j.created_at else None,
-                    })
-
-            return active_jobs
+        with self._user_lock:
+            job_ids = list(self._user_jobs.get(owner_id, ()))
+
+        active = []
+        for job_id in job_ids:
+            j = self._get_job(job_id)
+            if j and j.status in ("pending", "running"):
+                active.append((job_id, j))
+
+        # 매핑이 set이므로 시작 순서는 created_at으로 복원
+        active.sort(key=lambda item: item[1].created_at)
+
+        return [
+            {
+                "job_id": job_id,
+                "status": j.status,
+                "processed": j.processed.value,
+                "total": j.total,
+                "created_at": _to_iso(j.created_at),
+            }
+            for job_id, j in active
+        ]
 
     def cleanup_old_jobs(self, max_age_hours: int = 24):
         """
@@ -126,24 +169,216 @@ class JobStore:
         Args:
             max_age_hours: 이보다 오래된 완료 job 삭제
         """
-        from datetime import timedelta
-        cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
+        cutoff = time.time() - max_age_hours * 3600
 
-        with self._lock:
-            to_delete = []
-            for job_id, j in self._jobs.items():
-                if j.status in ("succeeded", "failed") and j.created_at < cutoff:
-                    to_delete.append(job_id)
+        removed: List[tuple] = []  # (job_id, owner_id)
+        for shard in self._shards:
+            with shard.lock:
+                to_delete = [
+                    job_id for job_id, j in shard.jobs.items()
+                    if j.status in ("succeeded", "failed") and j.created_at < cutoff
+                ]
+                for job_id in to_delete:
+                    j = shard.jobs.pop(job_id)
+                    removed.append((job_id, j.owner_id))
+
+        if not removed:
+            return
+
+        with self._user_lock:
+            for job_id, owner_id in removed:
+                if owner_id is None:
+                    continue
+                user_jobs = self._user_jobs.get(owner_id)
+                if user_jobs is not None:
+                    user_jobs.discard(job_id)
+                    if not user_jobs:
+                        del self._user_jobs[owner_id]
 
-            for job_id in to_delete:
-                j = self._jobs.pop(job_id, None)
-                if j and j.owner_id is not None:
-                    user_jobs = self._user_jobs.get(j.owner_id, [])
-                    if job_id in user_jobs:
-                        user_jobs.remove(job_id)
+        log.info("cleanup_old_jobs: removed %d jobs", len(removed))
+
+
+class SqliteJobStore:
+    """
+    업로드 작업 상태 관리 (SQLite 파일, JobStore와 같은 인터페이스)
+
+    특징:
+    - JOB_STORE_PATH가 설정되면 사용
+    - 서버 재시작 후에도 job 상태/에러 유지
+      (재시작 시점에 진행 중이던 job은 이어서 처리할 수 없으므로 failed로 정리)
+    - WAL 모드: 상태 폴링(읽기)이 진행률 갱신(쓰기)을 막지 않음
+    - 스레드마다 별도 커넥션 사용, 진행률은 UPDATE processed = processed + n 으로 원자적 증가
+    - 단일 서버 프로세스 기준 (여러 워커가 공유하면 재시작 정리가 다른 워커의 job까지 실패 처리함)
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            processed INTEGER NOT NULL DEFAULT 0,
+            total INTEGER NOT NULL DEFAULT 0,
+            owner_id INTEGER,
+            created_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_jobs_owner_status ON jobs (owner_id, status);
+        CREATE TABLE IF NOT EXISTS job_errors (
+            job_id TEXT NOT NULL,
+            msg TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_job_errors_job_id ON job_errors (job_id);
+    """
+
+    def __init__(self, path: Path):
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = local()
+
+        conn = self._conn()
+        conn.executescript(self._SCHEMA)
+        self._fail_interrupted(conn)
+
+    def _conn(self) -> sqlite3.Connection:
+        """현재 스레드 전용 커넥션 (autocommit, 트랜잭션은 BEGIN으로 명시)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self._path), timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL;")
+            conn.execute("PRAGMA synchronous=NORMAL;")
+            self._local.conn = conn
+        return conn
+
+    def _fail_interrupted(self, conn: sqlite3.Connection):
+        """재시작 전에 끝나지 못한 job을 failed로 정리"""
+        conn.execute("BEGIN")
+        try:
+            conn.execute(
+                "INSERT INTO job_errors (job_id, msg) "
+                "SELECT id, 'interrupted by server restart' FROM jobs "
+                "WHERE status IN ('pending', 'running')"
+            )
+            cur = conn.execute(
+                "UPDATE jobs SET status = 'failed' WHERE status IN ('pending', 'running')"
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        if cur.rowcount:
+            log.warning("job store: marked %d interrupted jobs as failed", cur.rowcount)
+
+    def start(self, job_id: str, total: int, owner_id: Optional[int] = None):
+        """새 작업 시작"""
+        conn = self._conn()
+        conn.execute("BEGIN")
+        try:
+            # 같은 job_id 재시작 시 이전 에러는 제거 (인메모리 JobStore와 동일)
+            conn.execute("DELETE FROM job_errors WHERE job_id = ?", (job_id,))
+            conn.execute(
+                "INSERT OR REPLACE INTO jobs (id, status, processed, total, owner_id, created_at) "
+                "VALUES (?, 'running', 0, ?, ?, ?)",
+                (job_id, total, owner_id, time.time()),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        log.info("job start job_id=%s total=%d owner_id=%s", job_id, total, owner_id)
+
+    def inc(self, job_id: str, n: int = 1):
+        """진행률 증가 (여러 항목을 처리한 워커는 n으로 한 번에 반영)"""
+        row = self._conn().execute(
+            "UPDATE jobs SET processed = processed + ? WHERE id = ? RETURNING processed",
+            (n, job_id),
+        ).fetchone()
+        log.debug("job progress job_id=%s processed=%s", job_id, row[0] if row else "?")
+
+    def add_error(self, job_id: str, msg: str):
+        """에러 추가"""
+        self._conn().execute(
+            "INSERT INTO job_errors (job_id, msg) "
+            "SELECT ?, ? WHERE EXISTS (SELECT 1 FROM jobs WHERE id = ?)",
+            (job_id, msg, job_id),
+        )
+        log.error("job error job_id=%s %s", job_id, msg)
+
+    def finish(self, job_id: str):
+        """작업 완료 처리"""
+        row = self._conn().execute(
+            "UPDATE jobs SET status = CASE "
+            "WHEN EXISTS (SELECT 1 FROM job_errors WHERE job_id = jobs.id) THEN 'failed' "
+            "ELSE 'succeeded' END "
+            "WHERE id = ? RETURNING status",
+            (job_id,),
+        ).fetchone()
+        status = row[0] if row else "failed"
+        log.info("job finish job_id=%s status=%s", job_id, status)
+
+    def get(self, job_id: str) -> IngestJobStatus:
+        """특정 job 상태 조회"""
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT status, processed, total FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        if not row:
+            return IngestJobStatus(status="pending", processed=0, total=0, errors=[])
+        errors = [
+            msg for (msg,) in conn.execute(
+                "SELECT msg FROM job_errors WHERE job_id = ? ORDER BY rowid", (job_id,)
+            )
+        ]
+        return IngestJobStatus(status=row[0], processed=row[1], total=row[2], errors=errors)
+
+    def get_active_jobs_for_user(self, owner_id: int) -> List[Dict]:
+        """
+        특정 사용자의 진행 중인 job 목록 조회
+
+        Returns:
+            [{"job_id": str, "status": str, "processed": int, "total": int}, ...]
+        """
+        rows = self._conn().execute(
+            "SELECT id, status, processed, total, created_at FROM jobs "
+            "WHERE owner_id = ? AND status IN ('pending', 'running') "
+            "ORDER BY created_at",
+            (owner_id,),
+        )
+        return [
+            {
+                "job_id": job_id,
+                "status": status,
+                "processed": processed,
+                "total": total,
+                "created_at": _to_iso(created_at),
+            }
+            for job_id, status, processed, total, created_at in rows
+        ]
+
+    def cleanup_old_jobs(self, max_age_hours: int = 24):
+        """
+        오래된 완료 job 정리
+
+        Args:
+            max_age_hours: 이보다 오래된 완료 job 삭제
+        """
+        cutoff = time.time() - max_age_hours * 3600
+        conn = self._conn()
+        conn.execute("BEGIN")
+        try:
+            conn.execute(
+                "DELETE FROM job_errors WHERE job_id IN ("
+                "SELECT id FROM jobs WHERE status IN ('succeeded', 'failed') AND created_at < ?)",
+                (cutoff,),
+            )
+            cur = conn.execute(
+                "DELETE FROM jobs WHERE status IN ('succeeded', 'failed') AND created_at < ?",
+                (cutoff,),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
 
-            if to_delete:
-                log.info("cleanup_old_jobs: removed %d jobs", len(to_delete))
+        if cur.rowcount:
+            log.info("cleanup_old_jobs: removed %d jobs", cur.rowcount)
 
 
-job_store = JobStore()
+job_store = SqliteJobStore(Path(settings.job_store_path)) if settings.job_store_path else JobStore()
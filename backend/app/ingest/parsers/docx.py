@@ -1,10 +1,86 @@
 from __future__ import annotations
+import zipfile
 from pathlib import Path
 from typing import List
-import docx  # python-docx
+from lxml import etree
+
+# WordprocessingML 네임스페이스 태그
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_BODY = _W + "body"
+_P = _W + "p"
+_R = _W + "r"
+_HYPERLINK = _W + "hyperlink"
+_T = _W + "t"
+_BR = _W + "br"
+
+# 런 내부 요소 → 텍스트 (python-docx Run.text와 동일한 매핑, w:br은 따로 처리)
+_RUN_SPECIAL = {
+    _W + "tab": "\t",
+    _W + "ptab": "\t",
+    _W + "cr": "\n",
+    _W + "noBreakHyphen": "-",
+}
+
+_OFFICE_DOCUMENT_REL = "/officeDocument"
+_DEFAULT_MAIN_PART = "word/document.xml"
+
+
+def _main_part_name(zf: zipfile.ZipFile) -> str:
+    """패키지 관계(_rels/.rels)에서 본문 파트 경로 확인 (없으면 word/document.xml)"""
+    try:
+        rels = etree.fromstring(zf.read("_rels/.rels"))
+    except (KeyError, etree.XMLSyntaxError):
+        return _DEFAULT_MAIN_PART
+    for rel in rels:
+        if rel.get("Type", "").endswith(_OFFICE_DOCUMENT_REL):
+            return rel.get("Target", _DEFAULT_MAIN_PART).lstrip("/")
+    return _DEFAULT_MAIN_PART
+
+
+def _run_text(r: etree._Element) -> str:
+    parts = []
+    for e in r:
+        if e.tag == _T:
+            parts.append(e.text or "")
+        elif e.tag == _BR:
+            # 줄바꿈만 텍스트로 (페이지/단 나누기는 빈 문자열)
+            if e.get(_W + "type", "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            parts.append(_RUN_SPECIAL.get(e.tag, ""))
+    return "".join(parts)
+
+
+def _paragraph_text(p: etree._Element) -> str:
+    parts = []
+    for child in p:
+        if child.tag == _R:
+            parts.append(_run_text(child))
+        elif child.tag == _HYPERLINK:
+            parts.extend(_run_text(r) for r in child.iterchildren(_R))
+    return "".join(parts)
+
 
 def parse_docx(path: Path) -> List[str]:
-    """문단 단위 텍스트 리스트."""
-    d = docx.Document(str(path))
-    paras = [p.text.strip() for p in d.paragraphs if p.text and p.text.strip()]
+    """
+    문단 단위 텍스트 리스트.
+
+    python-docx DOM 대신 본문 XML을 iterparse로 스트리밍합니다.
+    python-docx Document.paragraphs와 같이 본문 최상위 문단만 대상입니다 (표/텍스트박스 안 문단 제외).
+    """
+    paras: List[str] = []
+    with zipfile.ZipFile(path) as zf, zf.open(_main_part_name(zf)) as f:
+        for _, p in etree.iterparse(f, tag=_P):
+            parent = p.getparent()
+            if parent is None or parent.tag != _BODY:
+                continue
+
+            text = _paragraph_text(p).strip()
+            if text:
+                paras.append(text)
+
+            # 처리한 문단과 앞선 형제(표 등)를 해제해 메모리를 일정하게 유지
+            p.clear()
+            while p.getprevious() is not None:
+                del parent[0]
     return paras
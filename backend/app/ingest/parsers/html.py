@@ -1,14 +1,24 @@
 from __future__ import annotations
 from pathlib import Path
 from typing import List
-from bs4 import BeautifulSoup
+from lxml import etree
+
+# 주석은 파싱 단계에서 제거 (BeautifulSoup get_text와 동일하게 본문에서 제외)
+_HTML_PARSER = etree.HTMLParser(encoding="utf-8", remove_comments=True)
+
 
 def parse_html(path: Path) -> List[str]:
     html = path.read_text(encoding="utf-8", errors="ignore")
-    soup = BeautifulSoup(html, "html.parser")
-    # 스크립트/스타일 제거
-    for tag in soup(["script", "style", "noscript"]):
-        tag.decompose()
-    text = soup.get_text(separator="\n")
+    if not html.strip():
+        return []
+    # 유효한 UTF-8 바이트로 넘겨 인코딩 선언/meta charset과 무관하게 파싱
+    root = etree.fromstring(html.encode("utf-8"), _HTML_PARSER)
+    if root is None:
+        return []
+    # 스크립트/스타일 내용 제거 (요소 자리는 남겨 앞뒤 텍스트가 한 줄로 붙지 않게 함)
+    for tag in list(root.iter("script", "style", "noscript")):
+        tag.clear(keep_tail=True)
+    # 텍스트 노드마다 줄바꿈으로 구분 (get_text(separator="\n")과 동일)
+    text = "\n".join(root.itertext())
     blocks = [b.strip() for b in text.splitlines() if b.strip()]
     return blocks
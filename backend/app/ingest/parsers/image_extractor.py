@@ -10,8 +10,9 @@ PDF 문서에서 이미지를 추출하고 메타데이터를 수집합니다.
 from __future__ import annotations
 
 import fitz  # PyMuPDF
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional
 from dataclasses import dataclass
 from io import BytesIO
 from PIL import Image
@@ -20,10 +21,20 @@ from app.services.logging import get_logger
 
 log = get_logger("app.ingest.parsers.image_extractor")
 
+# save_extracted_images 병렬 쓰기 스레드 수
+SAVE_WORKERS = 8
 
-@dataclass
+# 표 영역 렌더링 시 최대 긴 변 (px)
+# Vision API(detail=high)는 짧은 변 768px 기준으로 축소하므로 이보다 큰 렌더링은 비용만 늘림
+RENDER_MAX_EDGE = 1600
+
+# 표로 볼 수 있는 최대 색상 수 (축소 이미지 기준, 이 값 이상이면 figure)
+_MAX_TABLE_COLORS = 500
+
+
+@dataclass(frozen=True, slots=True)
 class ExtractedImage:
-    """추출된 이미지 메타데이터"""
+    """추출된 이미지 메타데이터 (이미지가 많은 PDF에서 인스턴스별 __dict__ 오버헤드 제거)"""
     page_num: int           # 페이지 번호 (1-based)
     image_index: int        # 페이지 내 이미지 인덱스 (0-based)
     image_type: str         # "table" | "figure" | "unknown"
@@ -34,23 +45,24 @@ class ExtractedImage:
     image_format: str       # "png" | "jpeg" | "jpg"
 
 
-def _classify_image_type(img: Image.Image) -> str:
+def _classify_image_type(width: int, height: int) -> str:
     """
-    이미지 타입 분류 (개선된 휴리스틱)
+    이미지 타입 1차 분류 (크기/비율만 사용, 디코딩 없음)
+
+    page.get_images()가 주는 이미지 스트림 크기만으로 판단하므로
+    extract_image/PIL 디코딩 전에 호출할 수 있습니다.
 
-    표 특징:
-    - 충분히 큰 크기 (width > 400, height > 200)
+    표 후보 특징:
+    - 충분히 큰 크기 (width > 300, height > 150)
     - 가로로 넓은 비율 (0.8 < ratio < 4.0)
-    - 색상이 단순함 (주로 흑백 + 선)
 
     Args:
-        img: PIL Image 객체
+        width: 이미지 너비 (px)
+        height: 이미지 높이 (px)
 
     Returns:
-        "table" | "figure" | "unknown"
+        "table" (표 후보) | "figure" | "unknown"
     """
-    width, height = img.size
-
     # 너무 작은 이미지는 무시 (아이콘, 불릿 등)
     if width < 150 or height < 80:
         log.debug(f"[CLASSIFY] unknown (too small): {width}x{height}")
@@ -63,45 +75,69 @@ def _classify_image_type(img: Image.Image) -> str:
         log.debug(f"[CLASSIFY] unknown (extreme ratio): {aspect_ratio:.2f}")
         return "unknown"
 
-    # 색상 복잡도 분석 (표는 주로 단순한 색상)
+    if width > 300 and height > 150 and 0.8 < aspect_ratio < 4.0:
+        return "table"
+
+    log.debug(f"[CLASSIFY] figure (size/ratio): {width}x{height}, ratio={aspect_ratio:.2f}")
+    return "figure"
+
+
+def _peek_size(image_bytes: bytes) -> Tuple[int, int]:
+    """이미지 크기만 확인 (헤더만 파싱, 픽셀 디코딩 없음)"""
+    with Image.open(BytesIO(image_bytes)) as img:
+        return img.size
+
+
+def _confirm_table_colors(image_bytes: bytes, width: int, height: int) -> str:
+    """
+    표 후보의 색상 복잡도 확인 (표는 주로 흑백 + 선)
+
+    _classify_image_type이 "table"로 분류한 이미지에만 호출합니다.
+
+    Args:
+        image_bytes: 원본 이미지 바이트
+        width: 이미지 너비 (px)
+        height: 이미지 높이 (px)
+
+    Returns:
+        "table" | "figure"
+    """
     try:
+        img = Image.open(BytesIO(image_bytes))
+        # JPEG은 DCT 단계에서 축소 디코딩 (100x100 이상 유지, 다른 포맷은 영향 없음)
+        img.draft("RGB", (100, 100))
+
         # RGB로 변환
         if img.mode != 'RGB':
-            img_rgb = img.convert('RGB')
-        else:
-            img_rgb = img
+            img = img.convert('RGB')
 
         # 색상 수 계산 (축소 후 분석하여 속도 향상)
-        small_img = img_rgb.resize((100, 100)) if width > 100 and height > 100 else img_rgb
-        colors = small_img.getcolors(maxcolors=5000)  # 최대 5000개 색상
+        # 판정 기준(500색) 이상이면 getcolors가 스캔 도중 None을 반환하므로 끝까지 셀 필요 없음
+        small_img = img.resize((100, 100)) if width > 100 and height > 100 else img
+        colors = small_img.getcolors(maxcolors=_MAX_TABLE_COLORS - 1)
 
         if colors:
             num_colors = len(colors)
         else:
-            # 색상이 너무 많으면 (>5000) 복잡한 이미지로 판단
+            # 색상이 너무 많으면 (>=500) 복잡한 이미지로 판단
             num_colors = 10000
 
         # 표 판단 기준:
-        # 1) 충분히 큰 크기 (표는 보통 큼)
-        # 2) 적절한 비율 (표는 보통 가로로 넓음)
-        # 3) 색상이 단순함 (표는 주로 흑백, 선, 텍스트)
+        # 1) 큰 표: 색상이 단순함 (표는 주로 흑백, 선, 텍스트)
+        # 2) 중간 크기 표: 매우 단순한 색상
         is_large_enough = width > 400 and height > 200
-        is_table_ratio = 0.8 < aspect_ratio < 4.0
-        is_simple_colors = num_colors < 500  # 표는 색상이 단순
+        is_simple_colors = num_colors < _MAX_TABLE_COLORS  # 표는 색상이 단순
 
         log.debug(
-            f"[CLASSIFY] {width}x{height}, ratio={aspect_ratio:.2f}, "
-            f"colors={num_colors}, large={is_large_enough}, "
-            f"ratio_ok={is_table_ratio}, simple={is_simple_colors}"
+            f"[CLASSIFY] {width}x{height}, colors={num_colors}, "
+            f"large={is_large_enough}, simple={is_simple_colors}"
         )
 
-        # 표로 분류하려면: 큰 크기 + 적절한 비율 + 단순한 색상
-        if is_large_enough and is_table_ratio and is_simple_colors:
+        if is_large_enough and is_simple_colors:
             log.debug(f"[CLASSIFY] table (large, good ratio, simple colors)")
             return "table"
 
-        # 중간 크기 + 매우 단순한 색상 (작은 표)
-        if width > 300 and height > 150 and is_table_ratio and num_colors < 200:
+        if num_colors < 200:
             log.debug(f"[CLASSIFY] table (medium size, very simple colors)")
             return "table"
 
@@ -113,23 +149,80 @@ def _classify_image_type(img: Image.Image) -> str:
     return "figure"
 
 
-def extract_images_from_pdf(pdf_path: Path) -> List[ExtractedImage]:
+def _extract_xref(
+    doc: fitz.Document,
+    xref: int,
+    width: int,
+    height: int,
+    img_type: str,
+    cache: Dict[int, Optional[Tuple[bytes, str, str]]],
+) -> Optional[Tuple[bytes, str, str]]:
+    """
+    xref 이미지 스트림 추출 + 표 후보 확정 (문서 단위 캐시)
+
+    반복 로고처럼 같은 xref가 여러 번 배치되어도 스트림 추출/색상 분석은 한 번만 수행합니다.
+
+    Returns:
+        (image_bytes, image_ext, img_type) 또는 추출 실패 시 None
+    """
+    if xref in cache:
+        return cache[xref]
+
+    extracted = None
+    base_image = doc.extract_image(xref)
+    if base_image:
+        image_bytes = base_image["image"]
+        # 표 후보만 색상 분석으로 확정
+        if img_type == "table":
+            img_type = _confirm_table_colors(image_bytes, width, height)
+        extracted = (image_bytes, base_image["ext"], img_type)
+
+    cache[xref] = extracted
+    return extracted
+
+
+def _image_bbox(page: fitz.Page, img_info: tuple) -> Optional[fitz.Rect]:
+    """
+    get_images(full=True) 항목의 배치 위치
+
+    content stream의 이미지 배치(Do) 연산만 추적하고 리소스 이름으로 매칭하므로 이미지를 디코딩하지 않습니다.
+    (get_image_rects는 위치 매칭용 해시를 위해 이미지를 Pixmap으로 디코딩함)
+    같은 xref가 여러 이름으로 배치된 경우에도 항목마다 자신의 위치를 받습니다.
+
+    Returns:
+        배치 영역, 찾지 못하면 None
+    """
+    rect = page.get_image_bbox(img_info)
+    if rect.is_empty or rect.is_infinite:
+        return None
+    return rect
+
+
+def extract_images_from_pdf(pdf_path: Path) -> Iterator[ExtractedImage]:
     """
-    PDF에서 모든 이미지 추출
+    PDF에서 모든 이미지 추출 (페이지 순서대로 yield)
+
+    문서 전체 이미지를 리스트로 모아 두지 않으므로, 호출 측에서 이미지를
+    저장/처리한 뒤 바로 해제할 수 있습니다. 리스트가 필요하면 list(...)로 감싸세요.
 
     Args:
         pdf_path: PDF 파일 경로
 
-    Returns:
-        추출된 이미지 리스트
+    Yields:
+        추출된 이미지 ("unknown"으로 분류된 아이콘/구분선 등은 제외)
 
     Raises:
-        Exception: PDF 파일 열기 실패 또는 이미지 추출 실패
+        Exception: PDF 파일 열기 실패 또는 이미지 추출 실패 (순회 중 발생)
     """
-    extracted_images: List[ExtractedImage] = []
-
     try:
         doc = fitz.open(pdf_path)
+    except Exception as e:
+        log.error(f"Failed to open or process PDF: {pdf_path}, error={e}")
+        raise
+
+    count = 0
+    xref_cache: Dict[int, Optional[Tuple[bytes, str, str]]] = {}
+    try:
         log.info(f"Opened PDF: {pdf_path.name}, pages={len(doc)}")
 
         for page_num in range(len(doc)):
@@ -140,27 +233,23 @@ def extract_images_from_pdf(pdf_path: Path) -> List[ExtractedImage]:
 
             for img_index, img_info in enumerate(image_list):
                 try:
-                    # 이미지 참조 추출
-                    xref = img_info[0]
-                    base_image = doc.extract_image(xref)
+                    # 이미지 참조 + 스트림 크기 (디코딩 없이 get_images 결과 사용)
+                    xref, _, width, height = img_info[:4]
 
-                    if not base_image:
+                    # 이미지 타입 1차 분류 - unknown(아이콘/구분선 등)은 추출하지 않음
+                    img_type = _classify_image_type(width, height)
+                    if img_type == "unknown":
                         continue
 
-                    image_bytes = base_image["image"]
-                    image_ext = base_image["ext"]  # "png", "jpeg", etc.
-
-                    # PIL Image로 변환하여 메타데이터 추출
-                    pil_image = Image.open(BytesIO(image_bytes))
-                    width, height = pil_image.size
+                    extracted = _extract_xref(doc, xref, width, height, img_type, xref_cache)
+                    if not extracted:
+                        continue
 
-                    # 이미지 타입 분류
-                    img_type = _classify_image_type(pil_image)
+                    image_bytes, image_ext, img_type = extracted  # ext: "png", "jpeg", etc.
 
                     # 이미지가 페이지 내에서 차지하는 영역 (바운딩 박스) 추출
-                    # get_image_rects는 이미지의 모든 출현 위치를 반환
-                    rects = page.get_image_rects(xref)
-                    bbox = rects[0] if rects else (0, 0, width, height)
+                    rect = _image_bbox(page, img_info)
+                    bbox = rect if rect is not None else (0, 0, width, height)
 
                     extracted_img = ExtractedImage(
                         page_num=page_num + 1,  # 1-based
@@ -173,7 +262,6 @@ def extract_images_from_pdf(pdf_path: Path) -> List[ExtractedImage]:
                         image_format=image_ext,
                     )
 
-                    extracted_images.append(extracted_img)
                     log.debug(
                         f"Extracted image: page={page_num + 1}, index={img_index}, "
                         f"type={img_type}, size={width}x{height}, format={image_ext}"
@@ -185,18 +273,20 @@ def extract_images_from_pdf(pdf_path: Path) -> List[ExtractedImage]:
                     )
                     continue
 
-        doc.close()
-        log.info(f"Extracted {len(extracted_images)} images from {pdf_path.name}")
+                count += 1
+                yield extracted_img
+
+        log.info(f"Extracted {count} images from {pdf_path.name}")
 
     except Exception as e:
         log.error(f"Failed to open or process PDF: {pdf_path}, error={e}")
         raise
-
-    return extracted_images
+    finally:
+        doc.close()
 
 
 def save_extracted_images(
-    images: List[ExtractedImage],
+    images: Iterable[ExtractedImage],
     output_dir: Path,
     doc_id: str,
 ) -> List[Path]:
@@ -204,7 +294,7 @@ def save_extracted_images(
     추출된 이미지를 파일로 저장
 
     Args:
-        images: 추출된 이미지 리스트
+        images: 추출된 이미지 (리스트 또는 extract_images_* 제너레이터)
         output_dir: 저장할 디렉토리
         doc_id: 문서 ID (파일명에 사용)
 
@@ -212,25 +302,33 @@ def save_extracted_images(
         저장된 이미지 파일 경로 리스트
     """
     output_dir.mkdir(parents=True, exist_ok=True)
-    saved_paths: List[Path] = []
 
-    for img in images:
-        # 파일명 생성: doc_id_p{page}_i{index}_{type}.{ext}
-        filename = f"{doc_id}_p{img.page_num:03d}_i{img.image_index:02d}_{img.image_type}.{img.image_format}"
-        output_path = output_dir / filename
+    # 파일 쓰기는 GIL을 놓으므로 스레드로 병렬 처리 (제너레이터면 추출과 저장이 겹쳐 진행됨)
+    with ThreadPoolExecutor(max_workers=SAVE_WORKERS, thread_name_prefix="image_save") as executor:
+        futures = []
+        for img in images:
+            # 파일명 생성: doc_id_p{page}_i{index}_{type}.{ext}
+            filename = f"{doc_id}_p{img.page_num:03d}_i{img.image_index:02d}_{img.image_type}.{img.image_format}"
+            futures.append(executor.submit(_write_image, output_dir / filename, img.image_data))
 
-        try:
-            output_path.write_bytes(img.image_data)
-            saved_paths.append(output_path)
-            log.debug(f"Saved image: {output_path}")
-        except Exception as e:
-            log.warning(f"Failed to save image: {filename}, error={e}")
-            continue
+    # 입력 순서 유지
+    saved_paths: List[Path] = [path for path in (f.result() for f in futures) if path is not None]
 
     log.info(f"Saved {len(saved_paths)} images to {output_dir}")
     return saved_paths
 
 
+def _write_image(output_path: Path, image_data: bytes) -> Optional[Path]:
+    """이미지 파일 하나 저장 (실패 시 None)"""
+    try:
+        output_path.write_bytes(image_data)
+        log.debug(f"Saved image: {output_path}")
+        return output_path
+    except Exception as e:
+        log.warning(f"Failed to save image: {output_path.name}, error={e}")
+        return None
+
+
 def filter_images_by_type(
     images: List[ExtractedImage],
     image_type: str,
@@ -248,41 +346,29 @@ def filter_images_by_type(
     return [img for img in images if img.image_type == image_type]
 
 
-def capture_table_region_by_rendering(
-    pdf_path: Path,
-    page_num: int,
+def _capture_region(
+    page: fitz.Page,
     bbox: Tuple[float, float, float, float],
     dpi: int = 200,
     padding: int = 20,
     extend_to_bottom: bool = True,
+    max_edge: int = RENDER_MAX_EDGE,
 ) -> Optional[bytes]:
     """
-    페이지 렌더링을 통해 표 영역 캡처 (임베드 이미지 대체)
-
-    PDF에 삽입된 이미지가 표의 일부분만 포함할 경우,
-    페이지를 렌더링하여 전체 표 영역을 캡처합니다.
+    이미 열린 페이지에서 표 영역을 렌더링하여 PNG로 캡처
 
     Args:
-        pdf_path: PDF 파일 경로
-        page_num: 페이지 번호 (1-based)
+        page: PyMuPDF 페이지
         bbox: 기준 영역 (x0, y0, x1, y1)
-        dpi: 렌더링 해상도
+        dpi: 렌더링 해상도 (상한)
         padding: 여백 (points)
         extend_to_bottom: True면 페이지 하단까지 확장
+        max_edge: 결과 이미지의 최대 긴 변 (px), 넘으면 해상도를 낮춤
 
     Returns:
         PNG 이미지 바이너리, 실패 시 None
     """
     try:
-        doc = fitz.open(pdf_path)
-        page_idx = page_num - 1
-
-        if page_idx < 0 or page_idx >= len(doc):
-            log.warning(f"[RENDER] Invalid page number: {page_num}")
-            doc.close()
-            return None
-
-        page = doc[page_idx]
         x0, y0, x1, y1 = bbox
 
         # 여백 적용
@@ -299,18 +385,20 @@ def capture_table_region_by_rendering(
 
         clip_rect = fitz.Rect(x0, y0, x1, y1)
 
-        # 고해상도 렌더링
+        # 고해상도 렌더링 (긴 변이 max_edge를 넘지 않도록 배율 제한)
         zoom = dpi / 72.0
+        long_side = max(clip_rect.width, clip_rect.height)
+        if long_side > 0:
+            zoom = min(zoom, max_edge / long_side)
         matrix = fitz.Matrix(zoom, zoom)
         pix = page.get_pixmap(matrix=matrix, clip=clip_rect)
 
         image_data = pix.tobytes("png")
-        doc.close()
 
         log.info(
-            f"[RENDER] Captured table region: page={page_num}, "
+            f"[RENDER] Captured table region: page={page.number + 1}, "
             f"bbox=({x0:.0f},{y0:.0f},{x1:.0f},{y1:.0f}), "
-            f"size={len(image_data)} bytes"
+            f"pixels={pix.width}x{pix.height}, size={len(image_data)} bytes"
         )
         return image_data
 
@@ -319,23 +407,79 @@ def capture_table_region_by_rendering(
         return None
 
 
-def extract_images_with_full_tables(pdf_path: Path) -> List[ExtractedImage]:
+def capture_table_region_by_rendering(
+    pdf_path: Path,
+    page_num: int,
+    bbox: Tuple[float, float, float, float],
+    dpi: int = 200,
+    padding: int = 20,
+    extend_to_bottom: bool = True,
+    max_edge: int = RENDER_MAX_EDGE,
+) -> Optional[bytes]:
     """
-    PDF에서 이미지 추출 + 표 영역 전체 캡처
+    페이지 렌더링을 통해 표 영역 캡처 (임베드 이미지 대체)
 
-    임베드된 이미지가 표의 일부만 포함할 경우,
-    페이지 렌더링으로 전체 표 영역을 캡처하여 대체합니다.
+    PDF에 삽입된 이미지가 표의 일부분만 포함할 경우,
+    페이지를 렌더링하여 전체 표 영역을 캡처합니다.
+    이미 문서를 열어 둔 경우에는 _capture_region(page, ...)를 직접 사용하세요.
 
     Args:
         pdf_path: PDF 파일 경로
+        page_num: 페이지 번호 (1-based)
+        bbox: 기준 영역 (x0, y0, x1, y1)
+        dpi: 렌더링 해상도 (상한)
+        padding: 여백 (points)
+        extend_to_bottom: True면 페이지 하단까지 확장
+        max_edge: 결과 이미지의 최대 긴 변 (px)
 
     Returns:
-        추출된 이미지 리스트 (표 이미지는 전체 영역으로 대체됨)
+        PNG 이미지 바이너리, 실패 시 None
     """
-    extracted_images: List[ExtractedImage] = []
+    try:
+        doc = fitz.open(pdf_path)
+    except Exception as e:
+        log.error(f"[RENDER] Failed to capture table region: {e}")
+        return None
 
+    try:
+        page_idx = page_num - 1
+        if page_idx < 0 or page_idx >= len(doc):
+            log.warning(f"[RENDER] Invalid page number: {page_num}")
+            return None
+        return _capture_region(
+            doc[page_idx],
+            bbox,
+            dpi=dpi,
+            padding=padding,
+            extend_to_bottom=extend_to_bottom,
+            max_edge=max_edge,
+        )
+    finally:
+        doc.close()
+
+
+def extract_images_with_full_tables(pdf_path: Path) -> Iterator[ExtractedImage]:
+    """
+    PDF에서 이미지 추출 + 표 영역 전체 캡처 (페이지 순서대로 yield)
+
+    임베드된 이미지가 표의 일부만 포함할 경우,
+    페이지 렌더링으로 전체 표 영역을 캡처하여 대체합니다.
+
+    Args:
+        pdf_path: PDF 파일 경로
+
+    Yields:
+        추출된 이미지 (표 이미지는 전체 영역으로 대체됨, "unknown"은 제외)
+    """
     try:
         doc = fitz.open(pdf_path)
+    except Exception as e:
+        log.error(f"[FULL_TABLE] Failed to process PDF: {pdf_path}, error={e}")
+        raise
+
+    count = 0
+    xref_cache: Dict[int, Optional[Tuple[bytes, str, str]]] = {}
+    try:
         log.info(f"[FULL_TABLE] Opened PDF: {pdf_path.name}, pages={len(doc)}")
 
         for page_idx in range(len(doc)):
@@ -347,27 +491,23 @@ def extract_images_with_full_tables(pdf_path: Path) -> List[ExtractedImage]:
 
             for img_index, img_info in enumerate(image_list):
                 try:
-                    xref = img_info[0]
-                    base_image = doc.extract_image(xref)
+                    xref, _, width, height = img_info[:4]
 
-                    if not base_image:
+                    # 이미지 타입 1차 분류 - unknown(아이콘/구분선 등)은 추출하지 않음
+                    img_type = _classify_image_type(width, height)
+                    if img_type == "unknown":
                         continue
 
-                    original_bytes = base_image["image"]
-                    image_ext = base_image["ext"]
-
-                    # PIL Image로 메타데이터 추출
-                    pil_image = Image.open(BytesIO(original_bytes))
-                    width, height = pil_image.size
+                    extracted = _extract_xref(doc, xref, width, height, img_type, xref_cache)
+                    if not extracted:
+                        continue
 
-                    # 이미지 타입 분류
-                    img_type = _classify_image_type(pil_image)
+                    original_bytes, image_ext, img_type = extracted
 
                     # 이미지 위치 (바운딩 박스) 추출
-                    rects = page.get_image_rects(xref)
-                    if not rects:
+                    rect = _image_bbox(page, img_info)
+                    if rect is None:
                         continue
-                    rect = rects[0]
                     bbox = (rect.x0, rect.y0, rect.x1, rect.y1)
 
                     # 표 타입이면 페이지 렌더링으로 전체 영역 캡처
@@ -383,10 +523,10 @@ def extract_images_with_full_tables(pdf_path: Path) -> List[ExtractedImage]:
                         )
 
                         # 표 영역 확장 캡처 (y0부터 페이지 하단까지)
-                        rendered = capture_table_region_by_rendering(
-                            pdf_path=pdf_path,
-                            page_num=page_num,
-                            bbox=bbox,
+                        # 이미 열린 page를 재사용 (PDF 재오픈/xref 재파싱 없음)
+                        rendered = _capture_region(
+                            page,
+                            bbox,
                             dpi=200,
                             padding=10,
                             extend_to_bottom=True,
@@ -395,9 +535,8 @@ def extract_images_with_full_tables(pdf_path: Path) -> List[ExtractedImage]:
                         if rendered:
                             final_image_data = rendered
                             final_format = "png"
-                            # 새 이미지 크기 확인
-                            rendered_img = Image.open(BytesIO(rendered))
-                            final_width, final_height = rendered_img.size
+                            # 새 이미지 크기 확인 (헤더만 읽음)
+                            final_width, final_height = _peek_size(rendered)
                             log.info(
                                 f"[FULL_TABLE] Replaced with rendered image: "
                                 f"{width}x{height} -> {final_width}x{final_height}"
@@ -414,7 +553,6 @@ def extract_images_with_full_tables(pdf_path: Path) -> List[ExtractedImage]:
                         image_format=final_format,
                     )
 
-                    extracted_images.append(extracted_img)
                     log.debug(
                         f"[FULL_TABLE] Extracted: page={page_num}, index={img_index}, "
                         f"type={img_type}, size={final_width}x{final_height}"
@@ -427,11 +565,13 @@ def extract_images_with_full_tables(pdf_path: Path) -> List[ExtractedImage]:
                     )
                     continue
 
-        doc.close()
-        log.info(f"[FULL_TABLE] Extracted {len(extracted_images)} images from {pdf_path.name}")
+                count += 1
+                yield extracted_img
+
+        log.info(f"[FULL_TABLE] Extracted {count} images from {pdf_path.name}")
 
     except Exception as e:
         log.error(f"[FULL_TABLE] Failed to process PDF: {pdf_path}, error={e}")
         raise
-
-    return extracted_images
+    finally:
+        doc.close()
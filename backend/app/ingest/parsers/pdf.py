@@ -1,15 +1,14 @@
 from __future__ import annotations
 from pathlib import Path
 from typing import List
-from pypdf import PdfReader
+import fitz  # PyMuPDF
 
 def parse_pdf(path: Path) -> List[str]:
-    """페이지 단위 텍스트 리스트 반환."""
+    """페이지 단위 텍스트 리스트 반환. (MuPDF 텍스트 추출 사용)"""
     out: List[str] = []
-    with path.open("rb") as f:
-        reader = PdfReader(f)
-        for page in reader.pages:
-            text = (page.extract_text() or "").strip()
+    with fitz.open(path) as doc:
+        for page in doc:
+            text = page.get_text("text").strip()
             if text:
                 out.append(text)
     return out
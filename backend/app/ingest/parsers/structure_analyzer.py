@@ -17,12 +17,19 @@ PyMuPDF(fitz)를 사용하여 PDF 문서의 구조를 분석합니다:
 
 from __future__ import annotations
 import re
+from bisect import bisect_right
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import itemgetter
+
+import numpy as np
 
 try:
     import fitz  # PyMuPDF
+    # get_text("dict") 기본 플래그에서 이미지 블록 제외 (이미지 바이너리를 dict로 복사하지 않음)
+    _TEXT_DICT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
 except ImportError:
     fitz = None
 
@@ -35,9 +42,9 @@ log = get_logger(__name__)
 # 데이터 클래스
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class TextBlock:
-    """텍스트 블록 (폰트 정보 포함)"""
+    """텍스트 블록 (폰트 정보 포함, 블록 수가 많아 __dict__ 없이 slots 사용)"""
     text: str
     page_num: int  # 1-based
     font_size: float
@@ -54,9 +61,9 @@ class TextBlock:
         return self.bbox[1]
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentStructure:
-    """문서 구조 (조항/섹션)"""
+    """문서 구조 (조항/섹션, 조항·항목마다 생성되므로 slots 사용)"""
     type: str  # "article" | "section" | "item" | "paragraph"
     number: Optional[str] = None  # "1", "1-1", "가" 등
     title: Optional[str] = None  # "목적", "정의" 등
@@ -95,6 +102,28 @@ ITEM_PATTERNS = [
     (re.compile(r'^([가-힣])\)\s'), 4),  # "가) ", "나) " → Level 4
 ]
 
+# 항 패턴 4종을 하나로 합친 패턴 (parse_item용, lastgroup: "item{level}")
+ITEM_PATTERN = re.compile(
+    r'^(?:'
+    r'(?P<item1>\d+)\.\s'
+    r'|(?P<item2>[가-힣])\.\s'
+    r'|(?P<item3>\d+)\)\s'
+    r'|(?P<item4>[가-힣])\)\s'
+    r')'
+)
+
+# 조항 + 항 패턴을 하나로 합친 패턴 (줄마다 한 번만 매칭, 대안 순서 = 위 패턴 검사 순서)
+# lastgroup: "article" 또는 "item{level}"
+STRUCTURE_PATTERN = re.compile(
+    r'^(?:'
+    r'(?P<article>제(?P<article_num>\d+)조\s*(?:\((?P<article_title>[^)]+)\))?)'
+    r'|(?P<item1>\d+)\.\s'
+    r'|(?P<item2>[가-힣])\.\s'
+    r'|(?P<item3>\d+)\)\s'
+    r'|(?P<item4>[가-힣])\)\s'
+    r')'
+)
+
 
 # =============================================================================
 # 폰트 분석
@@ -120,8 +149,8 @@ def extract_text_blocks(pdf_path: Path) -> List[TextBlock]:
         doc = fitz.open(pdf_path)
 
         for page_num, page in enumerate(doc, start=1):
-            # 텍스트 블록 추출 (폰트 정보 포함)
-            text_dict = page.get_text("dict")
+            # 텍스트 블록 추출 (폰트 정보 포함, 이미지 블록은 MuPDF 단계에서 제외)
+            text_dict = page.get_text("dict", flags=_TEXT_DICT_FLAGS)
 
             for block in text_dict.get("blocks", []):
                 if block.get("type") != 0:  # 0 = text block
@@ -158,18 +187,29 @@ def extract_text_blocks(pdf_path: Path) -> List[TextBlock]:
         return []
 
 
-def calculate_average_font_size(blocks: List[TextBlock]) -> float:
-    """평균 폰트 크기 계산"""
-    if not blocks:
+def font_size_array(blocks: List[TextBlock]) -> np.ndarray:
+    """블록 폰트 크기를 배열로 변환 (평균/비교를 벡터 연산으로 처리하기 위함)"""
+    return np.fromiter((b.font_size for b in blocks), dtype=np.float64, count=len(blocks))
+
+
+def calculate_average_font_size(blocks: Union[List[TextBlock], np.ndarray]) -> float:
+    """
+    평균 폰트 크기 계산
+
+    Args:
+        blocks: TextBlock 리스트 또는 font_size_array()로 만든 폰트 크기 배열
+    """
+    sizes = blocks if isinstance(blocks, np.ndarray) else font_size_array(blocks)
+    if not sizes.size:
         return 12.0
 
     # 너무 작거나 큰 폰트는 제외 (아웃라이어)
-    sizes = [b.font_size for b in blocks if 8.0 <= b.font_size <= 20.0]
+    mask = (sizes >= 8.0) & (sizes <= 20.0)
 
-    if not sizes:
+    if not mask.any():
         return 12.0
 
-    return sum(sizes) / len(sizes)
+    return float(sizes[mask].mean())
 
 
 def is_heading(block: TextBlock, avg_font_size: float, threshold: float = 1.2) -> bool:
@@ -218,8 +258,12 @@ def parse_article(text: str, page_num: int) -> Optional[DocumentStructure]:
     if not match:
         return None
 
-    number = match.group(1)
-    title = match.group(2) or ""
+    return _build_article(match.group(1), match.group(2), text[match.end():], page_num)
+
+
+def _build_article(number: str, title: Optional[str], rest: str, page_num: int) -> DocumentStructure:
+    """조항 DocumentStructure 생성 (rest: 조항 제목 이후 텍스트)"""
+    title = title or ""
 
     # "제1조 (목적)" 형태
     full_title = f"제{number}조"
@@ -227,7 +271,7 @@ def parse_article(text: str, page_num: int) -> Optional[DocumentStructure]:
         full_title += f" ({title})"
 
     # 본문 추출 (제목 이후)
-    content = text[match.end():].strip()
+    content = rest.strip()
 
     return DocumentStructure(
         type="article",
@@ -251,21 +295,67 @@ def parse_item(text: str, page_num: int) -> Optional[Tuple[DocumentStructure, in
     Returns:
         (DocumentStructure, level) 또는 None
     """
-    for pattern, level in ITEM_PATTERNS:
-        match = pattern.match(text)
-        if match:
-            number = match.group(1)
-            content = text[match.end():].strip()
+    match = ITEM_PATTERN.match(text)
+    if not match:
+        return None
+
+    kind = match.lastgroup
+    level = int(kind[-1])  # "item1" ~ "item4"
+    return _build_item(match.group(kind), level, text[match.end():], page_num), level
+
+
+def _build_item(number: str, level: int, rest: str, page_num: int) -> DocumentStructure:
+    """항/호/목 DocumentStructure 생성 (rest: 번호 이후 텍스트)"""
+    return DocumentStructure(
+        type="item",
+        number=number,
+        content=rest.strip(),
+        page_num=page_num,
+        hierarchy_level=level + 1  # 조항=1, 항=2, 호=3, 목=4
+    )
+
+
+def _may_start_structure(text: str) -> bool:
+    """
+    정규식 전 앞 1~2글자로 조항/항목 가능성 확인 (STRUCTURE_PATTERN이 매칭될 수 없는 줄을 빠르게 제외)
+
+    - 숫자로 시작: "1. ", "1) " 가능
+    - 한글 + "." / ")": "가. ", "가) " 가능
+    - "제" + 숫자: "제N조" 가능
+    """
+    if not text:
+        return False
+    first = text[0]
+    if first.isdecimal():  # 정규식 \d와 같은 범위 (유니코드 Nd)
+        return True
+    if "가" <= first <= "힣" and len(text) > 1:
+        second = text[1]
+        return second in ".)" or (first == "제" and second.isdecimal())
+    return False
 
-            return DocumentStructure(
-                type="item",
-                number=number,
-                content=content,
-                page_num=page_num,
-                hierarchy_level=level + 1  # 조항=1, 항=2, 호=3, 목=4
-            ), level
 
-    return None
+@lru_cache(maxsize=4096)
+def _classify_line(text: str) -> Optional[Tuple[int, str, Optional[str], int]]:
+    """
+    줄의 구조 패턴 매칭 결과 캐시 (머리글/바닥글처럼 반복되는 줄은 한 번만 매칭)
+
+    DocumentStructure는 이후 내용이 덧붙는 가변 객체이므로 캐시하지 않고,
+    매칭 결과만 불변 튜플로 저장합니다.
+
+    Returns:
+        (level, number, title, match_end) 또는 None (조항이면 level=0)
+    """
+    if not _may_start_structure(text):
+        return None
+
+    match = STRUCTURE_PATTERN.match(text)
+    if not match:
+        return None
+
+    kind = match.lastgroup
+    if kind == "article":
+        return 0, match.group("article_num"), match.group("article_title"), match.end()
+    return int(kind[-1]), match.group(kind), None, match.end()  # "item1" ~ "item4"
 
 
 # =============================================================================
@@ -276,6 +366,8 @@ def merge_text_blocks(blocks: List[TextBlock]) -> List[Tuple[str, int]]:
     """
     텍스트 블록을 줄 단위로 병합
 
+    정렬은 NumPy lexsort로, 줄 경계는 블록마다 비교하는 대신 줄마다 이분 탐색 한 번으로 찾습니다.
+
     Args:
         blocks: TextBlock 리스트
 
@@ -285,30 +377,37 @@ def merge_text_blocks(blocks: List[TextBlock]) -> List[Tuple[str, int]]:
     if not blocks:
         return []
 
-    # 페이지, Y좌표 기준 정렬
-    sorted_blocks = sorted(blocks, key=lambda b: (b.page_num, b.y0, b.x0))
+    n = len(blocks)
+    pages = np.fromiter((b.page_num for b in blocks), dtype=np.int64, count=n)
+    ys = np.fromiter((b.bbox[1] for b in blocks), dtype=np.float64, count=n)  # y0
+    xs = np.fromiter((b.bbox[0] for b in blocks), dtype=np.float64, count=n)  # x0
 
-    lines = []
-    current_line = []
-    current_page = sorted_blocks[0].page_num
-    current_y = sorted_blocks[0].y0
-
-    for block in sorted_blocks:
-        # 페이지가 바뀌거나 Y좌표가 크게 변하면 새 줄
-        if block.page_num != current_page or abs(block.y0 - current_y) > 5:
-            if current_line:
-                line_text = " ".join(b.text for b in current_line)
-                lines.append((line_text, current_page))
-            current_line = [block]
-            current_page = block.page_num
-            current_y = block.y0
-        else:
-            current_line.append(block)
+    # 페이지, Y좌표, X좌표 기준 정렬 (sorted와 같은 안정 정렬)
+    order = np.lexsort((xs, ys, pages))
+    sorted_pages = pages[order]
+    sorted_ys = ys[order].tolist()
+    texts = [blocks[i].text for i in order.tolist()]
+
+    # 페이지가 바뀌는 위치와 각 구간의 페이지 번호 (파이썬 int로 한 번에 변환)
+    starts = np.flatnonzero(np.diff(sorted_pages)) + 1
+    bounds = [0, *starts.tolist(), n]
+    page_nums = [int(sorted_pages[0]), *sorted_pages[starts].tolist()]
 
-    # 마지막 줄
-    if current_line:
-        line_text = " ".join(b.text for b in current_line)
-        lines.append((line_text, current_page))
+    lines = []
+    for page_num, lo, hi in zip(page_nums, bounds[:-1], bounds[1:]):
+        start = lo
+        while start < hi:
+            # 줄 첫 블록의 Y좌표에서 5 이상 벗어나면 새 줄 (페이지 내 Y는 오름차순)
+            anchor = sorted_ys[start]
+            end = bisect_right(sorted_ys, anchor + 5, start + 1, hi)
+            # 부동소수 경계 보정: 원래 조건(y - anchor > 5)과 정확히 맞춤
+            while end > start + 1 and sorted_ys[end - 1] - anchor > 5:
+                end -= 1
+            while end < hi and not sorted_ys[end] - anchor > 5:
+                end += 1
+
+            lines.append((" ".join(texts[start:end]), page_num))
+            start = end
 
     return lines
 
@@ -325,47 +424,48 @@ def group_by_structure(lines: List[Tuple[str, int]]) -> List[DocumentStructure]:
     """
     structures = []
     current_article = None
-    pending_content = []
+    # 현재 조항 본문 줄 (첫 줄은 조항 제목 뒤 본문) - 조항 확정 시 한 번만 결합
+    article_lines: List[str] = []
 
-    for text, page_num in lines:
-        # 1. 조항 파싱 시도
-        article = parse_article(text, page_num)
-        if article:
-            # 이전 조항 저장
-            if current_article:
-                if pending_content:
-                    current_article.content += "\n" + "\n".join(pending_content)
-                    pending_content = []
-                structures.append(current_article)
+    # 줄 분류를 map으로 일괄 수행: 반복되는 줄은 _classify_line 캐시(C 레벨 lru_cache)에서 바로 반환되고,
+    # 캐시에 없는 줄도 앞글자 사전 검사로 대부분 정규식 없이 걸러짐
+    classified = map(_classify_line, map(itemgetter(0), lines))
 
-            current_article = article
+    for (text, page_num), cls in zip(lines, classified):
+        # 3. 일반 텍스트
+        if cls is None:
+            article_lines.append(text)
             continue
 
-        # 2. 항/호/목 파싱 시도
-        item_result = parse_item(text, page_num)
-        if item_result:
-            item, level = item_result
+        level, number, title, end = cls
+        rest = text[end:]
 
+        # 1. 조항
+        if level == 0:
+            article = _build_article(number, title, rest, page_num)
             if current_article:
-                # 보류된 내용 먼저 조항에 추가
-                if pending_content:
-                    current_article.content += "\n" + "\n".join(pending_content)
-                    pending_content = []
-
-                # 항목 추가
-                current_article.items.append(item)
+                # 이전 조항 저장
+                current_article.content = "\n".join(article_lines)
+                structures.append(current_article)
+                article_lines = [article.content]
             else:
-                # 조항 없이 항목만 있는 경우 (드물지만)
-                pending_content.append(text)
+                # 첫 조항 이전의 보류 텍스트는 첫 조항 본문 뒤에 붙음
+                article_lines = [article.content] + article_lines
+
+            current_article = article
             continue
 
-        # 3. 일반 텍스트 (보류)
-        pending_content.append(text)
+        # 2. 항/호/목
+        if current_article:
+            # 항목 추가 ("item1" ~ "item4")
+            current_article.items.append(_build_item(number, level, rest, page_num))
+        else:
+            # 조항 없이 항목만 있는 경우 (드물지만)
+            article_lines.append(text)
 
     # 마지막 조항 저장
     if current_article:
-        if pending_content:
-            current_article.content += "\n" + "\n".join(pending_content)
+        current_article.content = "\n".join(article_lines)
         structures.append(current_article)
 
     return structures
@@ -424,20 +524,19 @@ def structure_to_simple_blocks(structures: List[DocumentStructure]) -> List[Tupl
     blocks = []
 
     for article in structures:
-        # 조항 전체 텍스트 구성
-        full_text = ""
+        # 조항 전체 텍스트 구성 (줄 단위로 모은 뒤 한 번에 결합)
+        lines = []
 
         if article.full_title:
-            full_text += article.full_title + "\n"
+            lines.append(article.full_title)
 
         if article.content:
-            full_text += article.content + "\n"
+            lines.append(article.content)
 
         # 하위 항목들
-        for item in article.items:
-            item_text = f"{item.number}. {item.content}"
-            full_text += item_text + "\n"
+        lines.extend(f"{item.number}. {item.content}" for item in article.items)
 
+        full_text = "\n".join(lines)
         blocks.append((article.page_num, full_text.strip()))
 
     return blocks
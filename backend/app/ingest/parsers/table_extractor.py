@@ -10,11 +10,22 @@ PDF 문서에서 표를 구조적으로 추출합니다:
 
 from __future__ import annotations
 
+import heapq
+import multiprocessing
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from itertools import groupby
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from io import BytesIO
 
+import numpy as np
+
 try:
     import pdfplumber
     HAS_PDFPLUMBER = True
@@ -33,14 +44,53 @@ from app.services.logging import get_logger
 
 log = get_logger("app.ingest.parsers.table_extractor")
 
-
-@dataclass
+# 페이지 병렬 표 추출 설정
+TABLE_WORKERS = min(4, os.cpu_count() or 1)   # 프로세스 워커 수
+TABLE_PARALLEL_MIN_PAGES = 16                 # 이 페이지 수 미만은 단일 프로세스 처리
+TABLE_PAGES_PER_SHARD = 4                     # 워커 한 번에 맡기는 최소 페이지 수
+TABLE_CAPTURE_PARALLEL_MIN_TABLES = 128       # 이 개수 미만의 표는 단일 프로세스에서 캡처
+
+# find_tables 전략 (순서대로 시도, 페이지마다 재생성하지 않도록 모듈 상수로 유지)
+# 선 기반 전략만 사용 (텍스트 전략은 목차/번호목록 오탐이 심함)
+#
+# 참고: 테두리 없는 표(텍스트 정렬만 있는 표)는 감지 못함
+# 하지만 이런 표는 image_extractor.py에서 이미지로 캡처 후
+# Vision API로 처리되므로 문제 없음
+_TABLE_STRATEGIES: Tuple[Dict[str, Any], ...] = (
+    # 1) 선 기반 (테두리가 있는 표) - 가장 정확
+    {
+        "vertical_strategy": "lines",
+        "horizontal_strategy": "lines",
+        "snap_tolerance": 5,
+        "join_tolerance": 5,
+    },
+    # 2) 혼합 (세로선 + 가로 텍스트) - 부분 테두리 표
+    {
+        "vertical_strategy": "lines",
+        "horizontal_strategy": "text",
+        "snap_tolerance": 5,
+        "join_tolerance": 5,
+    },
+    # 텍스트 기반 전략 비활성화 (오탐 방지)
+    # 목차, 번호 목록, 들여쓰기된 텍스트 등을 표로 오인하는 문제
+)
+
+# 연속 표 판단 시 첫 행이 헤더인지 확인하는 키워드 (소문자, 도메인별 키워드는 여기에 추가)
+_HEADER_KEYWORDS: Tuple[str, ...] = (
+    "번호", "항목", "이름", "내용", "구분", "비고", "날짜", "금액",
+    "no", "name", "item", "date", "amount", "type", "description",
+)
+# 키워드 전체를 하나의 정규식으로 묶어 첫 행 문자열을 한 번만 검색
+_HEADER_KEYWORD_RE = re.compile("|".join(map(re.escape, _HEADER_KEYWORDS)))
+
+
+@dataclass(slots=True)
 class ExtractedTable:
-    """추출된 표 데이터"""
+    """추출된 표 데이터 (병합/캡처 루프에서 속성 접근이 잦아 __dict__ 없이 slots 사용)"""
     page_num: int                           # 페이지 번호 (1-based), 병합 시 시작 페이지
     table_index: int                        # 페이지 내 표 인덱스 (0-based)
     bbox: Tuple[float, float, float, float] # (x0, y0, x1, y1)
-    rows: List[List[str]]                   # 2D 셀 데이터
+    rows: List[List[str]]                   # 2D 셀 데이터 (_clean_rows로 정제된 값)
     markdown: str                           # 마크다운 변환 결과
     section_title: Optional[str] = None     # 표 섹션 제목 (감지된 경우)
     confidence: float = 1.0                 # 추출 신뢰도 (0.0 ~ 1.0)
@@ -52,25 +102,59 @@ class ExtractedTable:
     page_end: Optional[int] = None          # 끝 페이지 (병합된 경우)
     is_merged: bool = False                 # 병합된 표 여부
     merged_from: List[int] = field(default_factory=list)  # 병합 원본 페이지 목록
+    # 열 구조 시그니처 캐시 (column_signature 첫 접근 시 계산, slots라 cached_property 대신 사용)
+    _column_signature: Optional[Tuple[int, List[str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def column_signature(self) -> Tuple[int, List[str]]:
+        """(열 개수, 정규화된 헤더 행) - 생성 후 rows를 바꾸지 않으므로 한 번만 계산"""
+        if self._column_signature is None:
+            self._column_signature = _get_column_signature(self.rows)
+        return self._column_signature
+
+
+@lru_cache(maxsize=8192)
+def _normalize_cell_text(text: str) -> str:
+    """공백/줄바꿈을 단일 공백으로 정규화 (앞뒤 공백 제거 포함)"""
+    return " ".join(text.split())
 
 
 def _clean_cell(cell: Any) -> str:
-    """셀 값 정제"""
+    """
+    셀 값 정제
+
+    표에는 빈 칸, "-", 헤더 라벨처럼 반복되는 값이 많으므로 문자열화한 뒤 캐시된 정규화를 사용합니다.
+    """
     if cell is None:
         return ""
-    text = str(cell).strip()
-    # 줄바꿈을 공백으로 대체
-    text = " ".join(text.split())
-    return text
+    return _normalize_cell_text(str(cell))
+
+
+def _clean_rows(rows: List[List[Any]]) -> List[List[str]]:
+    """
+    표 전체 셀을 한 번만 정제
+
+    이후 단계(신뢰도/섹션 감지/마크다운/병합)는 모두 정제된 행을 받으므로
+    셀마다 _clean_cell을 반복 호출하지 않습니다.
+    """
+    return [[_clean_cell(c) for c in row] for row in rows]
 
 
-def _table_to_markdown(rows: List[List[str]], section_title: Optional[str] = None) -> str:
+def _table_to_markdown(
+    rows: List[List[str]],
+    section_title: Optional[str] = None,
+    start: int = 1,
+    end: Optional[int] = None,
+) -> str:
     """
     2D 테이블을 마크다운 표로 변환
 
     Args:
-        rows: 2D 셀 데이터
+        rows: 2D 셀 데이터 (정제된 값)
         section_title: 섹션 제목 (있으면 ### 헤더 추가)
+        start, end: 헤더(0행) 아래에 출력할 데이터 행 범위 [start, end) (기본: 전체)
 
     Returns:
         마크다운 문자열
@@ -78,6 +162,10 @@ def _table_to_markdown(rows: List[List[str]], section_title: Optional[str] = Non
     if not rows or len(rows) < 1:
         return ""
 
+    # 데이터 행 없이 제목만 남은 섹션 (_split_table_by_sections의 빈 범위)
+    if section_title and end is not None and end <= start:
+        return f"### {section_title}"
+
     lines = []
 
     # 섹션 제목
@@ -85,22 +173,18 @@ def _table_to_markdown(rows: List[List[str]], section_title: Optional[str] = Non
         lines.append(f"### {section_title}")
         lines.append("")
 
-    # 헤더 행
+    # 헤더 행 + 구분선
     header = rows[0]
-    header_line = "| " + " | ".join(_clean_cell(c) for c in header) + " |"
-    lines.append(header_line)
+    width = len(header)
+    lines.append("| " + " | ".join(header) + " |")
+    lines.append("|" + "|".join(["---"] * width) + "|")
 
-    # 구분선
-    separator = "|" + "|".join("---" for _ in header) + "|"
-    lines.append(separator)
-
-    # 데이터 행
-    for row in rows[1:]:
-        # 열 수 맞추기
-        while len(row) < len(header):
-            row.append("")
-        row_line = "| " + " | ".join(_clean_cell(c) for c in row[:len(header)]) + " |"
-        lines.append(row_line)
+    # 데이터 행 (열 수 맞추기: 헤더보다 짧으면 빈 셀 추가, 길면 자름 - 입력 행은 변경하지 않음)
+    for i in range(start, len(rows) if end is None else end):
+        row = rows[i]
+        if len(row) != width:
+            row = row[:width] + [""] * (width - len(row))
+        lines.append("| " + " | ".join(row) + " |")
 
     return "\n".join(lines)
 
@@ -118,18 +202,20 @@ def _detect_section_titles(rows: List[List[str]]) -> List[Tuple[int, str]]:
     """
     sections = []
 
-    for i, row in enumerate(rows):
-        if i == 0:  # 헤더는 스킵
-            continue
-
-        non_empty = [c for c in row if _clean_cell(c)]
-
-        # 첫 셀만 값이 있고 나머지가 비어있는 경우
-        if len(non_empty) == 1 and _clean_cell(row[0]):
-            sections.append((i, _clean_cell(row[0])))
-        # 모든 셀이 동일한 값인 경우 (병합된 행)
-        elif len(set(_clean_cell(c) for c in row if _clean_cell(c))) == 1 and non_empty:
-            sections.append((i, non_empty[0]))
+    # 두 조건 모두 "값이 있는 셀이 하나 이상이고 전부 같은 값"으로 귀결
+    # → 행마다 한 번 훑으며 다른 값이 나오면 즉시 중단
+    for i in range(1, len(rows)):  # 헤더(0행)는 스킵
+        title = None
+        for cell in rows[i]:
+            if not cell:
+                continue
+            if title is None:
+                title = cell
+            elif cell != title:
+                break
+        else:
+            if title is not None:
+                sections.append((i, title))
 
     return sections
 
@@ -137,36 +223,47 @@ def _detect_section_titles(rows: List[List[str]]) -> List[Tuple[int, str]]:
 def _split_table_by_sections(
     rows: List[List[str]],
     sections: List[Tuple[int, str]]
-) -> List[Tuple[str, List[List[str]]]]:
+) -> List[Tuple[Optional[str], int, int]]:
     """
     섹션별로 표 분할
 
+    행을 복사하지 않고 각 섹션의 데이터 행 범위만 반환합니다.
+    (마크다운은 _table_to_markdown(rows, title, start, end)로 헤더와 함께 생성)
+    데이터 행이 모두 빈 셀인 구간은 헤더만 반복되는 마크다운이 되므로,
+    제목이 있으면 빈 범위(start == end)로 제목만 남기고 제목이 없으면 제외합니다.
+
     Returns:
-        [(section_title, rows), ...]
+        [(section_title, start_row, end_row), ...]
     """
     if not sections:
-        return [(None, rows)]
+        return [(None, 1, len(rows))]
 
     result = []
-    header = rows[0]
 
     # 첫 섹션 이전 데이터
     if sections[0][0] > 1:
-        pre_section_rows = [header] + rows[1:sections[0][0]]
-        result.append((None, pre_section_rows))
+        result.append((None, 1, sections[0][0]))
 
     # 각 섹션별 데이터
     for i, (row_idx, title) in enumerate(sections):
         # 다음 섹션 시작점 또는 끝
         next_idx = sections[i + 1][0] if i + 1 < len(sections) else len(rows)
 
-        # 섹션 제목 행 다음부터 다음 섹션 전까지
-        section_rows = [header] + rows[row_idx + 1:next_idx]
+        # 섹션 제목 행 다음부터 다음 섹션 전까지 (데이터가 있는 경우만)
+        if next_idx > row_idx + 1:
+            result.append((title, row_idx + 1, next_idx))
+
+    blank = [not any(any(rows[r]) for r in range(start, end)) for _, start, end in result]
 
-        if len(section_rows) > 1:  # 데이터가 있는 경우만
-            result.append((title, section_rows))
+    # 데이터가 있는 구간이 하나도 없으면 헤더 행 내용이 사라지지 않도록 그대로 반환
+    if all(blank):
+        return result
 
-    return result
+    return [
+        (title, start, start if is_blank else end)
+        for (title, start, end), is_blank in zip(result, blank)
+        if title or not is_blank
+    ]
 
 
 def _is_toc_or_numbered_list(table_data: List[List[str]]) -> bool:
@@ -207,7 +304,7 @@ def _is_toc_or_numbered_list(table_data: List[List[str]]) -> bool:
     ]
 
     # 첫 번째 열에서 패턴 매칭 검사
-    first_col_cells = [_clean_cell(row[0]) for row in table_data if row]
+    first_col_cells = [row[0] for row in table_data if row]
     total_rows = len(first_col_cells)
 
     if total_rows == 0:
@@ -232,13 +329,13 @@ def _is_toc_or_numbered_list(table_data: List[List[str]]) -> bool:
     # 조건 2: 첫 열의 70% 이상이 목차 패턴 → 목차로 판단
     toc_ratio = toc_matches / total_rows
     if toc_ratio >= 0.7:
-        log.debug(f"[TOC_FILTER] Detected as TOC: toc_ratio={toc_ratio:.2f}")
+        log.debug("[TOC_FILTER] Detected as TOC: toc_ratio=%.2f", toc_ratio)
         return True
 
     # 조건 3: 2열이고, 첫 열의 60% 이상이 번호 목록 패턴이고,
     #         두 번째 열이 페이지 번호 또는 매우 짧으면 → 목차/목록
     if col_count == 2 and list_matches / total_rows >= 0.6:
-        second_col_cells = [_clean_cell(row[1]) if len(row) > 1 else "" for row in table_data]
+        second_col_cells = [row[1] if len(row) > 1 else "" for row in table_data]
 
         # 두 번째 열이 페이지 번호 패턴인지 확인
         page_pattern = r"^\d+P?$|^-*\d+P?$"
@@ -248,21 +345,36 @@ def _is_toc_or_numbered_list(table_data: List[List[str]]) -> bool:
         avg_second_col_len = sum(len(cell) for cell in second_col_cells) / max(len(second_col_cells), 1)
 
         if page_matches / total_rows >= 0.5:
-            log.debug(f"[TOC_FILTER] Detected as TOC (page numbers): page_ratio={page_matches/total_rows:.2f}")
+            log.debug("[TOC_FILTER] Detected as TOC (page numbers): page_ratio=%.2f", page_matches / total_rows)
             return True
 
         if avg_second_col_len <= 5:
-            log.debug(f"[TOC_FILTER] Detected as numbered list: avg_second_col={avg_second_col_len:.1f}")
+            log.debug("[TOC_FILTER] Detected as numbered list: avg_second_col=%.1f", avg_second_col_len)
             return True
 
     # 조건 4: 1열이고 80% 이상이 번호 목록 → 목록으로 판단
     if col_count == 1 and list_matches / total_rows >= 0.8:
-        log.debug(f"[TOC_FILTER] Detected as single-column list: list_ratio={list_matches/total_rows:.2f}")
+        log.debug("[TOC_FILTER] Detected as single-column list: list_ratio=%.2f", list_matches / total_rows)
         return True
 
     return False
 
 
+def _cell_stats(table_data: List[List[str]]) -> Tuple[int, int, int, set]:
+    """신뢰도 계산용 셀 통계 (전체 셀 수, 빈 셀 수, 50자 초과 셀 수, 행별 열 수 집합)"""
+    total = empty = long = 0
+    col_counts = set()
+    for row in table_data:
+        total += len(row)
+        col_counts.add(len(row))
+        for cell in row:
+            if not cell:
+                empty += 1
+            elif len(cell) > 50:
+                long += 1
+    return total, empty, long, col_counts
+
+
 def _calculate_confidence(table_data: List[List[str]]) -> float:
     """
     표 추출 신뢰도 계산
@@ -292,9 +404,10 @@ def _calculate_confidence(table_data: List[List[str]]) -> float:
     if col_count == 2:
         confidence -= 0.3  # 2열은 낮은 신뢰도
 
+    # 1~4번 체크에 필요한 셀 통계를 한 번의 순회로 집계
+    total_cells, empty_cells, long_cells, col_counts = _cell_stats(table_data)
+
     # 1. 빈 셀 비율 체크
-    total_cells = sum(len(row) for row in table_data)
-    empty_cells = sum(1 for row in table_data for cell in row if not _clean_cell(cell))
     empty_ratio = empty_cells / total_cells if total_cells > 0 else 1.0
 
     if empty_ratio > 0.5:
@@ -303,8 +416,7 @@ def _calculate_confidence(table_data: List[List[str]]) -> float:
         confidence -= 0.1
 
     # 2. 열 수 일관성 체크
-    col_counts = [len(row) for row in table_data]
-    if len(set(col_counts)) > 1:
+    if len(col_counts) > 1:
         confidence -= 0.2
 
     # 3. 데이터 행 수 체크
@@ -313,11 +425,6 @@ def _calculate_confidence(table_data: List[List[str]]) -> float:
 
     # 4. 셀 내용 길이 체크 (표 셀은 보통 짧음)
     # 긴 텍스트(50자 이상)가 많으면 본문 텍스트일 가능성
-    long_cells = 0
-    for row in table_data:
-        for cell in row:
-            if len(_clean_cell(cell)) > 50:
-                long_cells += 1
     long_cell_ratio = long_cells / total_cells if total_cells > 0 else 0
     if long_cell_ratio > 0.3:
         confidence -= 0.4  # 긴 셀이 30% 이상이면 표 아닐 가능성 높음
@@ -325,172 +432,234 @@ def _calculate_confidence(table_data: List[List[str]]) -> float:
     return max(0.0, confidence)
 
 
-def extract_tables_from_pdf(pdf_path: Path) -> List[ExtractedTable]:
+def _extract_page_tables(page: Any, page_num: int) -> List[ExtractedTable]:
     """
-    PDF에서 모든 표 추출 (pdfplumber 사용)
+    pdfplumber 페이지 한 장에서 표 추출
 
     Args:
-        pdf_path: PDF 파일 경로
+        page: pdfplumber Page 객체
+        page_num: 페이지 번호 (1-based)
 
     Returns:
-        추출된 표 리스트
+        해당 페이지에서 추출된 표 리스트
     """
-    if not HAS_PDFPLUMBER:
-        log.warning("[TABLE] pdfplumber not available, skipping table extraction")
+    # 셀 하나를 만들려면 세로/가로 경계가 각각 2개 이상 필요
+    # 두 전략 모두 세로선(lines) 기반이므로 세로 선분이 2개 미만인 페이지는 find_tables 생략
+    # (page.edges는 pdfplumber가 페이지 단위로 캐시하므로 이후 find_tables에서 재사용됨)
+    if len(page.vertical_edges) < 2:
+        log.debug("[TABLE] Not enough vertical edges on page %s, skipping", page_num)
         return []
 
-    extracted_tables: List[ExtractedTable] = []
+    # 전략별 가로 경계 소스: "lines"는 가로 선분, "text"는 글자(단어) 행
+    has_horizontal = {
+        "lines": len(page.horizontal_edges) >= 2,
+        "text": bool(page.chars),
+    }
 
-    try:
-        with pdfplumber.open(pdf_path) as pdf:
-            log.info(f"[TABLE] Opened PDF: {pdf_path.name}, pages={len(pdf.pages)}")
-
-            for page_num, page in enumerate(pdf.pages, start=1):
-                page_area = page.width * page.height
-                valid_tables = []
-
-                # 여러 전략으로 표 감지 시도
-                # 선 기반 전략만 사용 (텍스트 전략은 목차/번호목록 오탐이 심함)
-                #
-                # 참고: 테두리 없는 표(텍스트 정렬만 있는 표)는 감지 못함
-                # 하지만 이런 표는 image_extractor.py에서 이미지로 캡처 후
-                # Vision API로 처리되므로 문제 없음
-                strategies = [
-                    # 1) 선 기반 (테두리가 있는 표) - 가장 정확
-                    {
-                        "vertical_strategy": "lines",
-                        "horizontal_strategy": "lines",
-                        "snap_tolerance": 5,
-                        "join_tolerance": 5,
-                    },
-                    # 2) 혼합 (세로선 + 가로 텍스트) - 부분 테두리 표
-                    {
-                        "vertical_strategy": "lines",
-                        "horizontal_strategy": "text",
-                        "snap_tolerance": 5,
-                        "join_tolerance": 5,
-                    },
-                    # 텍스트 기반 전략 비활성화 (오탐 방지)
-                    # 목차, 번호 목록, 들여쓰기된 텍스트 등을 표로 오인하는 문제
-                ]
-
-                for strategy in strategies:
-                    if valid_tables:  # 이미 유효한 표를 찾았으면 중단
-                        break
-
-                    try:
-                        detected_tables = page.find_tables(strategy)
-
-                        for t in detected_tables:
-                            table_area = (t.bbox[2] - t.bbox[0]) * (t.bbox[3] - t.bbox[1])
-                            area_ratio = table_area / page_area
-
-                            # 면적 비율 조건: 3% ~ 60%
-                            # (선 기반 전략만 사용하므로 단일 조건)
-                            min_ratio = 0.03
-                            max_ratio = 0.60
-
-                            if min_ratio < area_ratio < max_ratio:
-                                valid_tables.append(t)
-                                log.debug(
-                                    f"[TABLE] Valid table found: page={page_num}, "
-                                    f"strategy={strategy.get('vertical_strategy')}, "
-                                    f"bbox={t.bbox}, area_ratio={area_ratio:.2%}"
-                                )
-                            else:
-                                log.debug(
-                                    f"[TABLE] Skipping table: page={page_num}, "
-                                    f"area_ratio={area_ratio:.2%} (out of range {min_ratio:.0%}-{max_ratio:.0%})"
-                                )
-                    except Exception as e:
-                        log.debug(f"[TABLE] Strategy {strategy} failed: {e}")
-                        continue
+    page_area = page.width * page.height
+    valid_tables = []
+    page_tables: List[ExtractedTable] = []
 
-                # 유효한 표가 없으면 다음 페이지
-                if not valid_tables:
-                    log.debug(f"[TABLE] No valid tables on page {page_num}")
-                    continue
+    # 여러 전략으로 표 감지 시도 (_TABLE_STRATEGIES 순서대로)
+    for strategy in _TABLE_STRATEGIES:
+        if valid_tables:  # 이미 유효한 표를 찾았으면 중단
+            break
+        if not has_horizontal[strategy["horizontal_strategy"]]:
+            continue
 
-                log.debug(f"[TABLE] Page {page_num}: found {len(valid_tables)} valid tables")
+        try:
+            detected_tables = page.find_tables(strategy)
 
-                for table_idx, table_obj in enumerate(valid_tables):
-                    table_data = table_obj.extract()
+            for t in detected_tables:
+                table_area = (t.bbox[2] - t.bbox[0]) * (t.bbox[3] - t.bbox[1])
+                area_ratio = table_area / page_area
 
-                    if not table_data or len(table_data) < 2:
-                        continue
+                # 면적 비율 조건: 3% ~ 60%
+                # (선 기반 전략만 사용하므로 단일 조건)
+                min_ratio = 0.03
+                max_ratio = 0.60
 
-                    # 추가 검증: 최소 열 수
-                    col_count = len(table_data[0]) if table_data else 0
-                    if col_count < 2:
-                        log.debug(
-                            f"[TABLE] Skipping single-column table: page={page_num}, "
-                            f"index={table_idx}, cols={col_count}"
-                        )
-                        continue
+                if min_ratio < area_ratio < max_ratio:
+                    valid_tables.append(t)
+                    log.debug(
+                        "[TABLE] Valid table found: page=%s, strategy=%s, bbox=%s, area_ratio=%.2f%%",
+                        page_num, strategy.get("vertical_strategy"), t.bbox, area_ratio * 100,
+                    )
+                else:
+                    log.debug(
+                        "[TABLE] Skipping table: page=%s, area_ratio=%.2f%% (out of range %.0f%%-%.0f%%)",
+                        page_num, area_ratio * 100, min_ratio * 100, max_ratio * 100,
+                    )
+        except Exception as e:
+            log.debug("[TABLE] Strategy %s failed: %s", strategy, e)
+            continue
 
-                    # 추가 검증: 행 수
-                    if len(table_data) < 2:
-                        log.debug(
-                            f"[TABLE] Skipping single-row table: page={page_num}, "
-                            f"index={table_idx}, rows={len(table_data)}"
-                        )
-                        continue
+    # 유효한 표가 없으면 빈 결과
+    if not valid_tables:
+        log.debug("[TABLE] No valid tables on page %s", page_num)
+        return []
 
-                    # 신뢰도 계산
-                    confidence = _calculate_confidence(table_data)
+    log.debug("[TABLE] Page %s: found %d valid tables", page_num, len(valid_tables))
 
-                    if confidence < 0.5:  # 0.3 → 0.5 (더 엄격한 임계값)
-                        log.debug(
-                            f"[TABLE] Skipping low-confidence table: "
-                            f"page={page_num}, index={table_idx}, confidence={confidence:.2f}"
-                        )
-                        continue
+    for table_idx, table_obj in enumerate(valid_tables):
+        table_data = _clean_rows(table_obj.extract() or [])
+
+        if not table_data or len(table_data) < 2:
+            continue
+
+        # 추가 검증: 최소 열 수
+        col_count = len(table_data[0]) if table_data else 0
+        if col_count < 2:
+            log.debug(
+                "[TABLE] Skipping single-column table: page=%s, index=%s, cols=%s",
+                page_num, table_idx, col_count,
+            )
+            continue
 
-                    # 섹션 감지 및 분할
-                    sections = _detect_section_titles(table_data)
+        # 추가 검증: 행 수
+        if len(table_data) < 2:
+            log.debug(
+                "[TABLE] Skipping single-row table: page=%s, index=%s, rows=%d",
+                page_num, table_idx, len(table_data),
+            )
+            continue
 
-                    if sections:
-                        # 복합 표: 섹션별로 분할하여 마크다운 생성
-                        split_tables = _split_table_by_sections(table_data, sections)
-                        markdown_parts = []
+        # 신뢰도 계산
+        confidence = _calculate_confidence(table_data)
 
-                        for section_title, section_rows in split_tables:
-                            md = _table_to_markdown(section_rows, section_title)
-                            if md:
-                                markdown_parts.append(md)
+        if confidence < 0.5:  # 0.3 → 0.5 (더 엄격한 임계값)
+            log.debug(
+                "[TABLE] Skipping low-confidence table: page=%s, index=%s, confidence=%.2f",
+                page_num, table_idx, confidence,
+            )
+            continue
 
-                        markdown = "\n\n".join(markdown_parts)
-                        section_title = "복합 표"
-                    else:
-                        # 단일 표
-                        markdown = _table_to_markdown(table_data)
-                        section_title = None
-
-                    # 표 영역 (바운딩 박스) - find_tables에서 제공하는 실제 bbox 사용
-                    bbox = table_obj.bbox
-
-                    extracted_table = ExtractedTable(
-                        page_num=page_num,
-                        table_index=table_idx,
-                        bbox=bbox,
-                        rows=table_data,
-                        markdown=markdown,
-                        section_title=section_title,
-                        confidence=confidence,
-                        metadata={
-                            "row_count": len(table_data),
-                            "col_count": len(table_data[0]) if table_data else 0,
-                            "has_sections": len(sections) > 0,
-                            "section_count": len(sections),
-                        }
-                    )
+        # 섹션 감지 및 분할
+        sections = _detect_section_titles(table_data)
 
-                    extracted_tables.append(extracted_table)
-                    log.info(
-                        f"[TABLE] Extracted table: page={page_num}, index={table_idx}, "
-                        f"rows={len(table_data)}, cols={len(table_data[0]) if table_data else 0}, "
-                        f"confidence={confidence:.2f}, sections={len(sections)}"
-                    )
+        if sections:
+            # 복합 표: 섹션별로 분할하여 마크다운 생성
+            split_tables = _split_table_by_sections(table_data, sections)
+            markdown_parts = []
+
+            for section_title, start, end in split_tables:
+                md = _table_to_markdown(table_data, section_title, start, end)
+                if md:
+                    markdown_parts.append(md)
+
+            markdown = "\n\n".join(markdown_parts)
+            section_title = "복합 표"
+        else:
+            # 단일 표
+            markdown = _table_to_markdown(table_data)
+            section_title = None
+
+        # 표 영역 (바운딩 박스) - find_tables에서 제공하는 실제 bbox 사용
+        bbox = table_obj.bbox
+
+        extracted_table = ExtractedTable(
+            page_num=page_num,
+            table_index=table_idx,
+            bbox=bbox,
+            rows=table_data,
+            markdown=markdown,
+            section_title=section_title,
+            confidence=confidence,
+            metadata={
+                "row_count": len(table_data),
+                "col_count": len(table_data[0]) if table_data else 0,
+                "has_sections": len(sections) > 0,
+                "section_count": len(sections),
+            }
+        )
+
+        page_tables.append(extracted_table)
+        log.info(
+            f"[TABLE] Extracted table: page={page_num}, index={table_idx}, "
+            f"rows={len(table_data)}, cols={len(table_data[0]) if table_data else 0}, "
+            f"confidence={confidence:.2f}, sections={len(sections)}"
+        )
+
+    return page_tables
+
+
+def _extract_page_range(pdf_path: Path, start: int, end: int) -> List[ExtractedTable]:
+    """
+    페이지 범위 [start, end) 표 추출 (프로세스 워커 진입점)
+
+    워커마다 PDF를 한 번만 열고 담당 페이지를 순서대로 처리합니다.
+    """
+    tables: List[ExtractedTable] = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for page_num in range(start, end):
+            tables.extend(_extract_page_tables(pdf.pages[page_num - 1], page_num))
+    return tables
+
+
+def _extract_parallel(pdf_path: Path, page_count: int) -> List[ExtractedTable]:
+    """
+    페이지 범위 샤드를 프로세스 풀에 분배하고 결과를 순서대로 합침
+
+    풀 실행이 실패하면(BrokenProcessPool, 제한된 컨테이너의 세마포어 OSError 등)
+    현재 프로세스에서 전체 페이지를 다시 추출합니다.
+    """
+    shard_size = max(
+        TABLE_PAGES_PER_SHARD, -(-page_count // (TABLE_WORKERS * 4))
+    )
+    starts = list(range(1, page_count + 1, shard_size))
+    ends = [min(start + shard_size, page_count + 1) for start in starts]
+    workers = min(TABLE_WORKERS, len(starts))
+    log.info(
+        f"[TABLE] Parallel extraction: pages={page_count}, "
+        f"shards={len(starts)}, workers={workers}"
+    )
+
+    try:
+        # spawn: 서버 프로세스의 스레드/락 상태를 fork로 복제하지 않도록 함
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            results = executor.map(
+                partial(_extract_page_range, pdf_path), starts, ends
+            )
+            return [table for shard in results for table in shard]
+    except Exception as e:
+        log.warning(f"[TABLE] Parallel extraction failed, falling back to single process: {e}")
+        return _extract_page_range(pdf_path, 1, page_count + 1)
+
+
+def extract_tables_from_pdf(pdf_path: Path) -> List[ExtractedTable]:
+    """
+    PDF에서 모든 표 추출 (pdfplumber 사용)
+
+    pdfplumber 분석은 순수 파이썬이라 GIL에 묶이므로, 페이지가 많은 문서는
+    페이지 범위로 나눠 프로세스 풀에서 병렬 처리합니다. (결과는 페이지 순서 유지)
+
+    Args:
+        pdf_path: PDF 파일 경로
+
+    Returns:
+        추출된 표 리스트
+    """
+    if not HAS_PDFPLUMBER:
+        log.warning("[TABLE] pdfplumber not available, skipping table extraction")
+        return []
+
+    extracted_tables: List[ExtractedTable] = []
+
+    try:
+        with pdfplumber.open(pdf_path) as pdf:
+            page_count = len(pdf.pages)
+            log.info(f"[TABLE] Opened PDF: {pdf_path.name}, pages={page_count}")
+
+            # 작은 문서는 프로세스 기동 비용이 더 크므로 현재 프로세스에서 처리
+            parallel = page_count >= TABLE_PARALLEL_MIN_PAGES and TABLE_WORKERS > 1
+            if not parallel:
+                for page_num, page in enumerate(pdf.pages, start=1):
+                    extracted_tables.extend(_extract_page_tables(page, page_num))
+
+        if parallel:
+            extracted_tables = _extract_parallel(pdf_path, page_count)
 
         log.info(f"[TABLE] Extracted {len(extracted_tables)} tables from {pdf_path.name}")
 
@@ -500,6 +669,10 @@ def extract_tables_from_pdf(pdf_path: Path) -> List[ExtractedTable]:
     return extracted_tables
 
 
+def _page_key(item: Tuple[int, str, str]) -> int:
+    return item[0]
+
+
 def merge_tables_with_text(
     text_chunks: List[Tuple[int, str]],
     tables: List[ExtractedTable],
@@ -515,28 +688,12 @@ def merge_tables_with_text(
         [(page_num, content, content_type), ...]
         content_type: "text" | "table"
     """
-    result = []
-
-    # 페이지별로 그룹화
-    page_tables = {}
-    for table in tables:
-        if table.page_num not in page_tables:
-            page_tables[table.page_num] = []
-        page_tables[table.page_num].append(table)
-
-    # 텍스트 청크 추가
-    for page_num, text in text_chunks:
-        result.append((page_num, text, "text"))
+    # 각 스트림을 페이지 순으로 정렬 (보통 이미 정렬된 입력이라 선형 시간)
+    texts = sorted(((page_num, text, "text") for page_num, text in text_chunks), key=_page_key)
+    table_items = sorted(((t.page_num, t.markdown, "table") for t in tables), key=_page_key)
 
-    # 표 추가 (각 페이지의 텍스트 뒤에)
-    for page_num, page_table_list in page_tables.items():
-        for table in page_table_list:
-            result.append((page_num, table.markdown, "table"))
-
-    # 페이지 번호로 정렬
-    result.sort(key=lambda x: (x[0], 0 if x[2] == "text" else 1))
-
-    return result
+    # 두 정렬 스트림 병합: 같은 페이지면 앞선 스트림(텍스트)이 먼저 → 표는 각 페이지 텍스트 뒤에 위치
+    return list(heapq.merge(texts, table_items, key=_page_key))
 
 
 # ===========================================================================
@@ -570,10 +727,20 @@ def _is_adjacent_table(
     if upper_table.page_num != lower_table.page_num:
         return False
 
-    # 2. Y 좌표 확인: upper가 위에 있어야 함
-    upper_bottom = upper_table.bbox[3]  # y1
-    lower_top = lower_table.bbox[1]     # y0
+    return _is_adjacent_bbox(upper_table.bbox, lower_table.bbox, y_threshold, x_overlap_ratio)
 
+
+def _is_adjacent_bbox(
+    upper_bbox: Tuple[float, float, float, float],
+    lower_bbox: Tuple[float, float, float, float],
+    y_threshold: float,
+    x_overlap_ratio: float,
+) -> bool:
+    """같은 페이지 두 표 bbox의 인접 여부 (_is_adjacent_table 조건 2~3, 좌표만으로 판단)"""
+    upper_x0, _, upper_x1, upper_bottom = upper_bbox
+    lower_x0, lower_top, lower_x1, _ = lower_bbox
+
+    # 2. Y 좌표 확인: upper가 위에 있어야 함
     # upper가 lower보다 아래에 있으면 순서가 잘못됨
     if upper_bottom > lower_top + y_threshold:
         return False
@@ -581,33 +748,22 @@ def _is_adjacent_table(
     # Y 간격 확인 (음수도 허용 - 표가 살짝 겹칠 수 있음)
     y_gap = lower_top - upper_bottom
     if y_gap > y_threshold:
-        log.debug(f"[ADJACENT] Y gap too large: {y_gap:.1f} > {y_threshold}")
+        log.debug("[ADJACENT] Y gap too large: %.1f > %s", y_gap, y_threshold)
         return False
 
-    # 3. X 좌표 겹침 확인
-    upper_x0, upper_x1 = upper_table.bbox[0], upper_table.bbox[2]
-    lower_x0, lower_x1 = lower_table.bbox[0], lower_table.bbox[2]
-
-    # 겹치는 X 범위 계산
-    overlap_x0 = max(upper_x0, lower_x0)
-    overlap_x1 = min(upper_x1, lower_x1)
-    overlap_width = max(0, overlap_x1 - overlap_x0)
-
-    # 더 좁은 표 기준으로 겹침 비율 계산
-    upper_width = upper_x1 - upper_x0
-    lower_width = lower_x1 - lower_x0
-    min_width = min(upper_width, lower_width)
-
+    # 3. X 좌표 겹침 확인 (더 좁은 표 기준으로 겹침 비율 계산)
+    min_width = min(upper_x1 - upper_x0, lower_x1 - lower_x0)
     if min_width <= 0:
         return False
 
+    overlap_width = max(0, min(upper_x1, lower_x1) - max(upper_x0, lower_x0))
     overlap_ratio = overlap_width / min_width
     if overlap_ratio < x_overlap_ratio:
-        log.debug(f"[ADJACENT] X overlap too small: {overlap_ratio:.2f} < {x_overlap_ratio}")
+        log.debug("[ADJACENT] X overlap too small: %.2f < %s", overlap_ratio, x_overlap_ratio)
         return False
 
     log.debug(
-        f"[ADJACENT] Tables are adjacent: y_gap={y_gap:.1f}, x_overlap={overlap_ratio:.2f}"
+        "[ADJACENT] Tables are adjacent: y_gap=%.1f, x_overlap=%.2f", y_gap, overlap_ratio
     )
     return True
 
@@ -635,8 +791,8 @@ def _merge_adjacent_tables(
 
     if upper_cols == lower_cols:
         # 열 수가 같으면 lower의 첫 행이 헤더인지 확인
-        upper_header = [_clean_cell(c).lower() for c in upper_table.rows[0]] if upper_table.rows else []
-        lower_header = [_clean_cell(c).lower() for c in lower_table.rows[0]] if lower_table.rows else []
+        upper_header = [c.lower() for c in upper_table.rows[0]] if upper_table.rows else []
+        lower_header = [c.lower() for c in lower_table.rows[0]] if lower_table.rows else []
 
         if upper_header == lower_header:
             # 헤더 동일 -> 스킵
@@ -648,17 +804,14 @@ def _merge_adjacent_tables(
     else:
         # 열 수가 다름 -> 복잡한 중첩 표, 그대로 병합 (열 수 맞춤)
         max_cols = max(upper_cols, lower_cols)
-        # 기존 행들 열 수 맞춤
+        # 기존 행들 열 수 맞춤 (원본 행은 수정하지 않고 새 리스트로 교체)
         for i, row in enumerate(merged_rows):
-            while len(row) < max_cols:
-                row.append("")
-            merged_rows[i] = row[:max_cols]
+            pad = max_cols - len(row)
+            merged_rows[i] = row + [""] * pad if pad > 0 else row[:max_cols]
         # lower 행 추가
         for row in lower_table.rows:
-            new_row = list(row)
-            while len(new_row) < max_cols:
-                new_row.append("")
-            merged_rows.append(new_row[:max_cols])
+            pad = max_cols - len(row)
+            merged_rows.append(row + [""] * pad if pad > 0 else row[:max_cols])
 
     # 마크다운 재생성
     merged_markdown = _table_to_markdown(merged_rows, upper_table.section_title)
@@ -726,28 +879,28 @@ def merge_adjacent_tables_on_page(
     if not tables or len(tables) < 2:
         return tables
 
-    # 페이지별로 그룹화
-    page_tables: Dict[int, List[ExtractedTable]] = {}
-    for table in tables:
-        if table.page_num not in page_tables:
-            page_tables[table.page_num] = []
-        page_tables[table.page_num].append(table)
+    # (페이지, Y 좌표 상단) 기준으로 한 번 정렬 후 페이지별로 위에서 아래로 한 번씩 훑음
+    ordered = sorted(tables, key=_table_page_top)
 
     merged_all: List[ExtractedTable] = []
-
-    for page_num, page_table_list in page_tables.items():
-        if len(page_table_list) < 2:
-            merged_all.extend(page_table_list)
+    total_adj_merged = 0  # 결과 중 인접 병합된 표 수 (페이지별 집계를 누적)
+
+    for page_num, group in groupby(ordered, key=_table_page):
+        sorted_tables = list(group)
+        if len(sorted_tables) < 2:
+            merged_all.extend(sorted_tables)
+            if sorted_tables[0].metadata.get("is_adjacent_merged"):
+                total_adj_merged += 1
             continue
 
-        # Y 좌표(상단) 기준 정렬
-        sorted_tables = sorted(page_table_list, key=lambda t: t.bbox[1])
-
         merged_on_page: List[ExtractedTable] = []
         current_table = sorted_tables[0]
 
         for next_table in sorted_tables[1:]:
-            if _is_adjacent_table(current_table, next_table, y_threshold, x_overlap_ratio):
+            # 같은 페이지 그룹이므로 bbox만 비교
+            # 병합될 때마다 current_table의 bbox가 합쳐져 바뀌므로 쌍별 판정을
+            # 미리 일괄 계산할 수 없음 (연속 쌍 순차 비교 유지)
+            if _is_adjacent_bbox(current_table.bbox, next_table.bbox, y_threshold, x_overlap_ratio):
                 # 인접 -> 병합
                 current_table = _merge_adjacent_tables(current_table, next_table)
                 # 연쇄 병합 메타데이터 업데이트
@@ -766,12 +919,12 @@ def merge_adjacent_tables_on_page(
             1 for t in merged_on_page if t.metadata.get("is_adjacent_merged")
         )
         if adj_merged_count > 0:
+            total_adj_merged += adj_merged_count
             log.info(
-                f"[ADJACENT] Page {page_num}: {len(page_table_list)} tables -> "
+                f"[ADJACENT] Page {page_num}: {len(sorted_tables)} tables -> "
                 f"{len(merged_on_page)} tables ({adj_merged_count} merged)"
             )
 
-    total_adj_merged = sum(1 for t in merged_all if t.metadata.get("is_adjacent_merged"))
     log.info(
         f"[ADJACENT] Total: {len(tables)} tables -> {len(merged_all)} tables "
         f"({total_adj_merged} adjacent-merged)"
@@ -795,7 +948,7 @@ def is_complex_table(table: ExtractedTable) -> bool:
     """
     # 1. 신뢰도 체크
     if table.confidence < 0.7:
-        log.debug(f"[COMPLEX] Low confidence: {table.confidence:.2f}")
+        log.debug("[COMPLEX] Low confidence: %.2f", table.confidence)
         return True
 
     # 2. 인접 병합된 표
@@ -803,32 +956,52 @@ def is_complex_table(table: ExtractedTable) -> bool:
         log.debug("[COMPLEX] Adjacent-merged table")
         return True
 
-    # 3. 빈 셀 비율 체크
-    if table.rows:
-        total_cells = sum(len(row) for row in table.rows)
-        empty_cells = sum(1 for row in table.rows for cell in row if not _clean_cell(cell))
-        empty_ratio = empty_cells / total_cells if total_cells > 0 else 0
+    if not table.rows:
+        return False
 
-        if empty_ratio > 0.3:
-            log.debug(f"[COMPLEX] High empty ratio: {empty_ratio:.2f}")
-            return True
+    # 행 단위 한 번의 순회로 셀 통계 계산 (rows는 이미 정리된 문자열이므로 빈 셀 == "")
+    total_cells = empty_cells = 0
+    col_counts = set()
+    for row in table.rows:
+        total_cells += len(row)
+        empty_cells += row.count("")
+        col_counts.add(len(row))
+
+    # 3. 빈 셀 비율 체크
+    empty_ratio = empty_cells / total_cells if total_cells > 0 else 0
+    if empty_ratio > 0.3:
+        log.debug("[COMPLEX] High empty ratio: %.2f", empty_ratio)
+        return True
 
     # 4. 열 수 불일치 체크
-    if table.rows and len(table.rows) > 1:
-        col_counts = [len(row) for row in table.rows]
-        if len(set(col_counts)) > 1:
-            log.debug(f"[COMPLEX] Inconsistent columns: {set(col_counts)}")
-            return True
+    if len(col_counts) > 1:
+        log.debug("[COMPLEX] Inconsistent columns: %s", col_counts)
+        return True
 
     return False
 
 
+@contextmanager
+def _open_pdf(pdf_path: Path, doc: Optional["fitz.Document"] = None):
+    """캡처용 PDF 문서 (호출자가 연 문서는 그대로 쓰고, 없으면 열었다가 닫음)"""
+    if doc is not None:
+        yield doc
+        return
+    doc = fitz.open(pdf_path)
+    try:
+        yield doc
+    finally:
+        doc.close()
+
+
 def capture_full_table_region(
     pdf_path: Path,
     page_num: int,
     bbox: Tuple[float, float, float, float],
     dpi: int = 200,
     padding: int = 15,
+    *,
+    doc: Optional["fitz.Document"] = None,
 ) -> Optional[bytes]:
     """
     방안 C: 복잡한 표의 전체 영역을 고해상도 이미지로 캡처
@@ -841,6 +1014,7 @@ def capture_full_table_region(
         bbox: 표 영역 (x0, y0, x1, y1)
         dpi: 이미지 해상도 (기본 200, 높은 해상도)
         padding: 표 주변 여백 (pixels)
+        doc: 이미 열린 PDF 문서 (주면 재사용하고 닫지 않음)
 
     Returns:
         PNG 이미지 바이너리, 실패 시 None
@@ -850,33 +1024,31 @@ def capture_full_table_region(
         return None
 
     try:
-        doc = fitz.open(pdf_path)
-        page_idx = page_num - 1
+        with _open_pdf(pdf_path, doc) as doc:
+            page_idx = page_num - 1
 
-        if page_idx < 0 or page_idx >= len(doc):
-            log.warning(f"[TABLE] Invalid page number: {page_num}")
-            doc.close()
-            return None
+            if page_idx < 0 or page_idx >= len(doc):
+                log.warning(f"[TABLE] Invalid page number: {page_num}")
+                return None
 
-        page = doc[page_idx]
+            page = doc[page_idx]
 
-        # bbox에 패딩 적용
-        x0, y0, x1, y1 = bbox
-        padding_pts = padding * 72 / dpi
-        x0 = max(0, x0 - padding_pts)
-        y0 = max(0, y0 - padding_pts)
-        x1 = min(page.rect.width, x1 + padding_pts)
-        y1 = min(page.rect.height, y1 + padding_pts)
+            # bbox에 패딩 적용
+            x0, y0, x1, y1 = bbox
+            padding_pts = padding * 72 / dpi
+            x0 = max(0, x0 - padding_pts)
+            y0 = max(0, y0 - padding_pts)
+            x1 = min(page.rect.width, x1 + padding_pts)
+            y1 = min(page.rect.height, y1 + padding_pts)
 
-        clip_rect = fitz.Rect(x0, y0, x1, y1)
+            clip_rect = fitz.Rect(x0, y0, x1, y1)
 
-        # 고해상도 캡처
-        zoom = dpi / 72.0
-        matrix = fitz.Matrix(zoom, zoom)
-        pix = page.get_pixmap(matrix=matrix, clip=clip_rect)
+            # 고해상도 캡처
+            zoom = dpi / 72.0
+            matrix = fitz.Matrix(zoom, zoom)
+            pix = page.get_pixmap(matrix=matrix, clip=clip_rect)
 
-        image_data = pix.tobytes("png")
-        doc.close()
+            image_data = pix.tobytes("png")
 
         log.info(
             f"[TABLE] Captured full region: page={page_num}, "
@@ -895,29 +1067,116 @@ def get_table_summary(tables: List[ExtractedTable]) -> Dict[str, Any]:
     if not tables:
         return {"total": 0}
 
+    # 표마다 한 번씩만 훑으며 집계
+    by_page = Counter()
+    confidence_sum = 0.0
+    total_rows = with_sections = 0
+    for t in tables:
+        by_page[t.page_num] += 1
+        confidence_sum += t.confidence
+        total_rows += len(t.rows)
+        if t.metadata.get("has_sections"):
+            with_sections += 1
+
     return {
         "total": len(tables),
-        "by_page": {t.page_num: sum(1 for tt in tables if tt.page_num == t.page_num) for t in tables},
-        "avg_confidence": sum(t.confidence for t in tables) / len(tables),
-        "total_rows": sum(len(t.rows) for t in tables),
-        "with_sections": sum(1 for t in tables if t.metadata.get("has_sections")),
+        "by_page": dict(by_page),
+        "avg_confidence": confidence_sum / len(tables),
+        "total_rows": total_rows,
+        "with_sections": with_sections,
     }
 
 
+def _table_page(table: ExtractedTable) -> int:
+    return table.page_num
+
+
+def _table_page_top(table: ExtractedTable) -> Tuple[int, float]:
+    return table.page_num, table.bbox[1]
+
+
+def _capture_shard(
+    merged: bool,
+    pdf_path: Path,
+    dpi: int,
+    padding: int,
+    shard: List[ExtractedTable],
+) -> List[Tuple[Optional[bytes], str]]:
+    """표 묶음 이미지 캡처 (프로세스 워커 진입점, 표 순서대로 이미지 데이터만 반환)"""
+    capture = capture_merged_table_images if merged else capture_table_images
+    captured = capture(pdf_path, shard, dpi, padding, workers=1)
+    return [(t.image_data, t.image_format) for t in captured]
+
+
+def _capture_parallel(
+    pdf_path: Path,
+    tables: List[ExtractedTable],
+    dpi: int,
+    padding: int,
+    workers: int,
+    merged: bool,
+) -> List[ExtractedTable]:
+    """
+    페이지 순으로 나눈 표 묶음을 프로세스 풀에서 캡처하고 결과를 원래 표에 채움
+
+    PyMuPDF는 멀티스레드를 지원하지 않으므로 스레드 대신 프로세스로 나누고,
+    워커마다 PDF를 한 번만 엽니다. 풀 실행이 실패하면 현재 프로세스에서 다시 캡처합니다.
+    """
+    ordered = sorted(tables, key=_table_page)
+    shard_size = -(-len(ordered) // (workers * 4))
+    shards = [ordered[i:i + shard_size] for i in range(0, len(ordered), shard_size)]
+    workers = min(workers, len(shards))
+    log.info(
+        f"[TABLE] Parallel capture: tables={len(ordered)}, "
+        f"shards={len(shards)}, workers={workers}"
+    )
+
+    try:
+        # spawn: 서버 프로세스의 스레드/락 상태를 fork로 복제하지 않도록 함
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            results = executor.map(
+                partial(_capture_shard, merged, pdf_path, dpi, padding), shards
+            )
+            captured_count = 0
+            for shard, images in zip(shards, results):
+                for table, (image_data, image_format) in zip(shard, images):
+                    table.image_data = image_data
+                    table.image_format = image_format
+                    if image_data is not None:
+                        captured_count += 1
+    except Exception as e:
+        log.warning(f"[TABLE] Parallel capture failed, falling back to single process: {e}")
+        capture = capture_merged_table_images if merged else capture_table_images
+        return capture(pdf_path, tables, dpi, padding, workers=1)
+
+    log.info(f"[TABLE] Captured {captured_count}/{len(tables)} table images from {pdf_path.name}")
+    return tables
+
+
 def capture_table_images(
     pdf_path: Path,
     tables: List[ExtractedTable],
     dpi: int = 150,
     padding: int = 10,
+    *,
+    doc: Optional["fitz.Document"] = None,
+    workers: int = TABLE_WORKERS,
 ) -> List[ExtractedTable]:
     """
     pdfplumber로 추출한 표의 bbox 영역을 PyMuPDF로 이미지 캡처.
 
+    이미지는 PNG로 저장합니다. 흰 바탕의 선/글자 위주인 표 이미지는 JPEG보다
+    PNG가 인코딩도 빠르고 크기도 작으며, 저장소와 Vision API 모두 인코딩된 이미지가 필요합니다.
+
     Args:
         pdf_path: PDF 파일 경로
         tables: pdfplumber로 추출한 ExtractedTable 리스트
         dpi: 이미지 해상도 (기본 150)
         padding: 표 주변 여백 (픽셀)
+        doc: 이미 열린 PDF 문서 (주면 재사용하고 닫지 않음)
+        workers: 표가 많을 때 사용할 프로세스 수 (1이면 현재 프로세스에서만 캡처)
 
     Returns:
         이미지 데이터가 추가된 ExtractedTable 리스트
@@ -929,62 +1188,70 @@ def capture_table_images(
     if not tables:
         return tables
 
-    try:
-        doc = fitz.open(pdf_path)
-
-        for table in tables:
-            try:
-                # pdfplumber는 1-based, fitz는 0-based 페이지
-                page_idx = table.page_num - 1
-                if page_idx < 0 or page_idx >= len(doc):
-                    log.warning(f"[TABLE] Invalid page number: {table.page_num}")
-                    continue
+    if workers > 1 and len(tables) >= TABLE_CAPTURE_PARALLEL_MIN_TABLES:
+        return _capture_parallel(pdf_path, tables, dpi, padding, workers, merged=False)
 
-                page = doc[page_idx]
+    try:
+        # 표마다 같은 값이므로 한 번만 계산
+        padding_pts = padding * 72 / dpi  # 여백 (포인트 단위)
+        zoom = dpi / 72.0  # DPI 기반 줌 (72 DPI가 기본)
+        matrix = fitz.Matrix(zoom, zoom)
 
-                # pdfplumber bbox를 fitz Rect로 변환
-                # pdfplumber: (x0, y0, x1, y1) in points
-                # fitz: Rect(x0, y0, x1, y1) in points
-                x0, y0, x1, y1 = table.bbox
+        with _open_pdf(pdf_path, doc) as doc:
+            # 페이지 순으로 처리하여 같은 페이지의 표들은 한 번 로드한 페이지로 렌더링
+            captured_count = 0
+            loaded_idx, page = -1, None
+            page_w = page_h = 0.0  # 로드한 페이지 크기 (표마다 page.rect를 새로 만들지 않음)
+            for table in sorted(tables, key=_table_page):
+                try:
+                    # pdfplumber는 1-based, fitz는 0-based 페이지
+                    page_idx = table.page_num - 1
+                    if page_idx < 0 or page_idx >= len(doc):
+                        log.warning(f"[TABLE] Invalid page number: {table.page_num}")
+                        continue
 
-                # 여백 추가 (포인트 단위로 변환)
-                padding_pts = padding * 72 / dpi
-                x0 = max(0, x0 - padding_pts)
-                y0 = max(0, y0 - padding_pts)
-                x1 = min(page.rect.width, x1 + padding_pts)
-                y1 = min(page.rect.height, y1 + padding_pts)
+                    if page_idx != loaded_idx:
+                        loaded_idx, page = page_idx, doc[page_idx]
+                        page_w, page_h = page.rect.width, page.rect.height
 
-                clip_rect = fitz.Rect(x0, y0, x1, y1)
+                    # pdfplumber bbox를 fitz Rect로 변환
+                    # pdfplumber: (x0, y0, x1, y1) in points
+                    # fitz: Rect(x0, y0, x1, y1) in points
+                    x0, y0, x1, y1 = table.bbox
 
-                # DPI 기반 줌 계산 (72 DPI가 기본)
-                zoom = dpi / 72.0
-                matrix = fitz.Matrix(zoom, zoom)
+                    # 여백 추가
+                    x0 = max(0, x0 - padding_pts)
+                    y0 = max(0, y0 - padding_pts)
+                    x1 = min(page_w, x1 + padding_pts)
+                    y1 = min(page_h, y1 + padding_pts)
 
-                # 클리핑 영역 이미지 생성
-                pix = page.get_pixmap(matrix=matrix, clip=clip_rect)
+                    clip_rect = fitz.Rect(x0, y0, x1, y1)
 
-                # PNG 바이트로 변환
-                image_bytes = pix.tobytes("png")
+                    # 클리핑 영역 이미지 생성
+                    # (표마다 clip 렌더링: 렌더링은 1ms 이하로 PNG 인코딩보다 훨씬 싸고,
+                    #  페이지 전체를 한 번 렌더링해 잘라내면 경계 안티앨리어싱 픽셀이 달라질 수 있음)
+                    pix = page.get_pixmap(matrix=matrix, clip=clip_rect)
 
-                # ExtractedTable에 이미지 데이터 추가
-                table.image_data = image_bytes
-                table.image_format = "png"
+                    # PNG 바이트로 변환
+                    image_bytes = pix.tobytes("png")
 
-                log.debug(
-                    f"[TABLE] Captured table image: page={table.page_num}, "
-                    f"index={table.table_index}, size={len(image_bytes)} bytes"
-                )
+                    # ExtractedTable에 이미지 데이터 추가
+                    table.image_data = image_bytes
+                    table.image_format = "png"
+                    captured_count += 1
 
-            except Exception as e:
-                log.warning(
-                    f"[TABLE] Failed to capture table image: "
-                    f"page={table.page_num}, index={table.table_index}, error={e}"
-                )
-                continue
+                    log.debug(
+                        "[TABLE] Captured table image: page=%s, index=%s, size=%d bytes",
+                        table.page_num, table.table_index, len(image_bytes),
+                    )
 
-        doc.close()
+                except Exception as e:
+                    log.warning(
+                        f"[TABLE] Failed to capture table image: "
+                        f"page={table.page_num}, index={table.table_index}, error={e}"
+                    )
+                    continue
 
-        captured_count = sum(1 for t in tables if t.image_data is not None)
         log.info(f"[TABLE] Captured {captured_count}/{len(tables)} table images from {pdf_path.name}")
 
     except Exception as e:
@@ -1010,7 +1277,7 @@ def _get_column_signature(rows: List[List[str]]) -> Tuple[int, List[str]]:
     header = rows[0]
     col_count = len(header)
     # 헤더를 소문자로 정규화 (공백 제거)
-    normalized_header = [_clean_cell(c).lower().replace(" ", "") for c in header]
+    normalized_header = [c.lower().replace(" ", "") for c in header]
 
     return (col_count, normalized_header)
 
@@ -1027,9 +1294,9 @@ def _is_continuation_table(
 
     조건:
     1. 연속된 페이지 (curr = prev + 1)
-    2. 열 구조가 동일하거나 유사
-    3. 이전 표가 페이지 하단에 위치
-    4. 현재 표가 페이지 상단에 위치
+    2. 이전 표가 페이지 하단에 위치
+    3. 현재 표가 페이지 상단에 위치
+    4. 열 구조가 동일하거나 유사
     5. 현재 표의 첫 행이 헤더가 아님 (데이터 행으로 시작)
 
     Args:
@@ -1046,32 +1313,36 @@ def _is_continuation_table(
     if curr_table.page_num != prev_table.page_num + 1:
         return False
 
-    # 2. 열 구조 비교
-    prev_sig = _get_column_signature(prev_table.rows)
-    curr_sig = _get_column_signature(curr_table.rows)
+    # 위치 비교(실수 비교)를 먼저 하고, 통과한 경우에만 열 구조 시그니처 사용
 
-    # 열 개수가 다르면 연속 표 아님
-    if prev_sig[0] != curr_sig[0]:
-        log.debug(
-            f"[TABLE_MERGE] Column count mismatch: prev={prev_sig[0]}, curr={curr_sig[0]}"
-        )
-        return False
-
-    # 3. 이전 표가 페이지 하단에 있는지 확인
+    # 2. 이전 표가 페이지 하단에 있는지 확인
     # bbox = (x0, y0, x1, y1), y1이 표 하단
     prev_bottom_ratio = prev_table.bbox[3] / page_height if page_height > 0 else 0
     if prev_bottom_ratio < threshold_bottom:
         log.debug(
-            f"[TABLE_MERGE] Previous table not at bottom: ratio={prev_bottom_ratio:.2f} < {threshold_bottom}"
+            "[TABLE_MERGE] Previous table not at bottom: ratio=%.2f < %s",
+            prev_bottom_ratio, threshold_bottom,
         )
         return False
 
-    # 4. 현재 표가 페이지 상단에 있는지 확인
+    # 3. 현재 표가 페이지 상단에 있는지 확인
     # y0이 표 상단
     curr_top_ratio = curr_table.bbox[1] / page_height if page_height > 0 else 1
     if curr_top_ratio > threshold_top:
         log.debug(
-            f"[TABLE_MERGE] Current table not at top: ratio={curr_top_ratio:.2f} > {threshold_top}"
+            "[TABLE_MERGE] Current table not at top: ratio=%.2f > %s",
+            curr_top_ratio, threshold_top,
+        )
+        return False
+
+    # 4. 열 구조 비교 (표마다 한 번만 계산된 시그니처 사용)
+    prev_sig = prev_table.column_signature
+    curr_sig = curr_table.column_signature
+
+    # 열 개수가 다르면 연속 표 아님
+    if prev_sig[0] != curr_sig[0]:
+        log.debug(
+            "[TABLE_MERGE] Column count mismatch: prev=%s, curr=%s", prev_sig[0], curr_sig[0]
         )
         return False
 
@@ -1080,22 +1351,20 @@ def _is_continuation_table(
     # 현재 표의 첫 행이 데이터처럼 보이면 -> 연속 표
     if prev_sig[1] == curr_sig[1]:
         # 헤더가 동일 -> 헤더 반복된 연속 표 (첫 행 제거 필요)
-        log.debug(f"[TABLE_MERGE] Header repeated, marking as continuation")
+        log.debug("[TABLE_MERGE] Header repeated, marking as continuation")
         return True
 
     # 헤더가 다르면 -> 현재 표 첫 행이 데이터일 가능성
     # 데이터인지 판단: 헤더에 일반적인 헤더 키워드가 없으면 데이터로 간주
-    header_keywords = ["번호", "항목", "이름", "내용", "구분", "비고", "날짜", "금액",
-                       "no", "name", "item", "date", "amount", "type", "description"]
     first_row_text = " ".join(curr_sig[1]).lower()
-    has_header_keyword = any(kw in first_row_text for kw in header_keywords)
+    has_header_keyword = _HEADER_KEYWORD_RE.search(first_row_text) is not None
 
     if not has_header_keyword:
         # 헤더 키워드 없음 -> 데이터 행으로 시작하는 연속 표
-        log.debug(f"[TABLE_MERGE] First row looks like data, marking as continuation")
+        log.debug("[TABLE_MERGE] First row looks like data, marking as continuation")
         return True
 
-    log.debug(f"[TABLE_MERGE] Not a continuation table")
+    log.debug("[TABLE_MERGE] Not a continuation table")
     return False
 
 
@@ -1119,8 +1388,8 @@ def _merge_two_tables(
     merged_rows = list(prev_table.rows)  # 이전 표 전체
 
     # 현재 표의 헤더가 이전 표와 동일하면 스킵
-    prev_header = _get_column_signature(prev_table.rows)[1]
-    curr_header = _get_column_signature(curr_table.rows)[1]
+    prev_header = prev_table.column_signature[1]
+    curr_header = curr_table.column_signature[1]
 
     start_idx = 1 if (skip_header and prev_header == curr_header) else 0
     merged_rows.extend(curr_table.rows[start_idx:])
@@ -1199,7 +1468,8 @@ def merge_continuation_tables(
             # 병합
             current_table = _merge_two_tables(current_table, table)
             log.debug(
-                f"[TABLE_MERGE] Merged page {table.page_num} into table starting at page {current_table.page_num}"
+                "[TABLE_MERGE] Merged page %s into table starting at page %s",
+                table.page_num, current_table.page_num,
             )
         else:
             # 연속 아님 -> 현재 표 확정, 새 표 시작
@@ -1219,11 +1489,33 @@ def merge_continuation_tables(
     return merged_tables
 
 
+def _stack_pixmaps(pixmaps: List[Any]) -> np.ndarray:
+    """
+    RGB pixmap들을 세로로 이어 붙인 (H, W, 3) 배열 반환
+
+    폭이 좁은 이미지의 오른쪽 여백은 흰색으로 채웁니다.
+    """
+    total_height = sum(pix.height for pix in pixmaps)
+    max_width = max(pix.width for pix in pixmaps)
+
+    canvas = np.full((total_height, max_width, 3), 255, dtype=np.uint8)
+    y_offset = 0
+    for pix in pixmaps:
+        h, w = pix.height, pix.width
+        samples = np.frombuffer(pix.samples_mv, dtype=np.uint8).reshape(h, pix.stride)
+        canvas[y_offset:y_offset + h, :w] = samples[:, :w * pix.n].reshape(h, w, pix.n)[:, :, :3]
+        y_offset += h
+    return canvas
+
+
 def capture_merged_table_images(
     pdf_path: Path,
     tables: List[ExtractedTable],
     dpi: int = 150,
     padding: int = 10,
+    *,
+    doc: Optional["fitz.Document"] = None,
+    workers: int = TABLE_WORKERS,
 ) -> List[ExtractedTable]:
     """
     병합된 표의 이미지 캡처 (여러 페이지 결합)
@@ -1235,6 +1527,8 @@ def capture_merged_table_images(
         tables: 표 리스트 (병합 포함)
         dpi: 이미지 해상도
         padding: 표 주변 여백
+        doc: 이미 열린 PDF 문서 (주면 재사용하고 닫지 않음)
+        workers: 표가 많을 때 사용할 프로세스 수 (1이면 현재 프로세스에서만 캡처)
 
     Returns:
         이미지가 추가된 표 리스트
@@ -1248,151 +1542,150 @@ def capture_merged_table_images(
     except ImportError:
         log.warning("[TABLE] Pillow not available, cannot merge images")
         # 단일 페이지 이미지만 캡처
-        return capture_table_images(pdf_path, tables, dpi, padding)
-
-    try:
-        doc = fitz.open(pdf_path)
-
-        for table in tables:
-            try:
-                if not table.is_merged:
-                    # 단일 페이지 표: 기존 로직
-                    page_idx = table.page_num - 1
-                    if page_idx < 0 or page_idx >= len(doc):
-                        continue
-
-                    page = doc[page_idx]
-                    x0, y0, x1, y1 = table.bbox
-                    padding_pts = padding * 72 / dpi
-                    x0 = max(0, x0 - padding_pts)
-                    y0 = max(0, y0 - padding_pts)
-                    x1 = min(page.rect.width, x1 + padding_pts)
-                    y1 = min(page.rect.height, y1 + padding_pts)
+        return capture_table_images(pdf_path, tables, dpi, padding, doc=doc, workers=workers)
 
-                    clip_rect = fitz.Rect(x0, y0, x1, y1)
-                    zoom = dpi / 72.0
-                    matrix = fitz.Matrix(zoom, zoom)
-                    pix = page.get_pixmap(matrix=matrix, clip=clip_rect)
+    if workers > 1 and len(tables) >= TABLE_CAPTURE_PARALLEL_MIN_TABLES:
+        return _capture_parallel(pdf_path, tables, dpi, padding, workers, merged=True)
 
-                    table.image_data = pix.tobytes("png")
-                    table.image_format = "png"
-
-                else:
-                    # 병합된 표 처리
-                    merged_pages = table.merged_from or [table.page_num]
-
-                    # 인접 병합 (같은 페이지 내 병합): 병합된 bbox로 단순 캡처
-                    is_same_page_merge = (
-                        table.metadata.get("is_adjacent_merged") or
-                        len(set(merged_pages)) == 1 or
-                        (table.page_end and table.page_num == table.page_end)
-                    )
+    try:
+        # 표마다 같은 값이므로 한 번만 계산
+        padding_pts = padding * 72 / dpi  # 여백 (포인트 단위)
+        zoom = dpi / 72.0  # DPI 기반 줌 (72 DPI가 기본)
+        matrix = fitz.Matrix(zoom, zoom)
 
-                    if is_same_page_merge:
-                        # 같은 페이지 내 인접 병합: 병합된 bbox 사용
+        with _open_pdf(pdf_path, doc) as doc:
+            # 페이지 순으로 처리하여 같은 페이지의 표들은 한 번 로드한 페이지로 렌더링
+            captured_count = 0
+            loaded_idx, page = -1, None
+            page_w = page_h = 0.0  # 로드한 페이지 크기 (표마다 page.rect를 새로 만들지 않음)
+            for table in sorted(tables, key=_table_page):
+                try:
+                    if not table.is_merged:
+                        # 단일 페이지 표: 기존 로직
                         page_idx = table.page_num - 1
                         if page_idx < 0 or page_idx >= len(doc):
                             continue
 
-                        page = doc[page_idx]
-                        x0, y0, x1, y1 = table.bbox  # 병합된 bbox
-
-                        padding_pts = padding * 72 / dpi
+                        if page_idx != loaded_idx:
+                            loaded_idx, page = page_idx, doc[page_idx]
+                            page_w, page_h = page.rect.width, page.rect.height
+                        x0, y0, x1, y1 = table.bbox
                         x0 = max(0, x0 - padding_pts)
                         y0 = max(0, y0 - padding_pts)
-                        x1 = min(page.rect.width, x1 + padding_pts)
-                        y1 = min(page.rect.height, y1 + padding_pts)
+                        x1 = min(page_w, x1 + padding_pts)
+                        y1 = min(page_h, y1 + padding_pts)
 
                         clip_rect = fitz.Rect(x0, y0, x1, y1)
-                        zoom = dpi / 72.0
-                        matrix = fitz.Matrix(zoom, zoom)
                         pix = page.get_pixmap(matrix=matrix, clip=clip_rect)
 
                         table.image_data = pix.tobytes("png")
                         table.image_format = "png"
+                        captured_count += 1
 
-                        log.debug(
-                            f"[TABLE] Captured adjacent-merged table image: page={table.page_num}, "
-                            f"bbox=({x0:.0f},{y0:.0f},{x1:.0f},{y1:.0f}), "
-                            f"size={len(table.image_data)} bytes"
-                        )
                     else:
-                        # 여러 페이지에 걸친 병합: 각 페이지 캡처 후 결합
-                        page_images = []
+                        # 병합된 표 처리
+                        merged_pages = table.merged_from or [table.page_num]
+
+                        # 인접 병합 (같은 페이지 내 병합): 병합된 bbox로 단순 캡처
+                        is_same_page_merge = (
+                            table.metadata.get("is_adjacent_merged") or
+                            len(set(merged_pages)) == 1 or
+                            (table.page_end and table.page_num == table.page_end)
+                        )
 
-                        for i, page_num in enumerate(merged_pages):
-                            page_idx = page_num - 1
+                        if is_same_page_merge:
+                            # 같은 페이지 내 인접 병합: 병합된 bbox 사용
+                            page_idx = table.page_num - 1
                             if page_idx < 0 or page_idx >= len(doc):
                                 continue
 
-                            page = doc[page_idx]
-
-                            # 첫 페이지: 원래 bbox의 y0부터 페이지 끝까지
-                            # 중간/마지막 페이지: 페이지 시작부터 페이지 끝(또는 표 끝)까지
-                            if i == 0:
-                                # 첫 페이지: 원래 표 시작부터
-                                x0, y0, x1, y1 = table.bbox
-                                y1 = page.rect.height  # 페이지 끝까지
-                            elif i == len(merged_pages) - 1:
-                                # 마지막 페이지: 페이지 시작부터 표 끝까지
-                                x0 = table.bbox[0]
-                                x1 = table.bbox[2]
-                                y0 = 0
-                                y1 = page.rect.height * 0.5  # 상단 50% 정도로 추정
-                            else:
-                                # 중간 페이지: 전체 페이지
-                                x0 = table.bbox[0]
-                                x1 = table.bbox[2]
-                                y0 = 0
-                                y1 = page.rect.height
-
-                            padding_pts = padding * 72 / dpi
+                            if page_idx != loaded_idx:
+                                loaded_idx, page = page_idx, doc[page_idx]
+                                page_w, page_h = page.rect.width, page.rect.height
+                            x0, y0, x1, y1 = table.bbox  # 병합된 bbox
+
                             x0 = max(0, x0 - padding_pts)
                             y0 = max(0, y0 - padding_pts)
-                            x1 = min(page.rect.width, x1 + padding_pts)
-                            y1 = min(page.rect.height, y1 + padding_pts)
+                            x1 = min(page_w, x1 + padding_pts)
+                            y1 = min(page_h, y1 + padding_pts)
 
                             clip_rect = fitz.Rect(x0, y0, x1, y1)
-                            zoom = dpi / 72.0
-                            matrix = fitz.Matrix(zoom, zoom)
                             pix = page.get_pixmap(matrix=matrix, clip=clip_rect)
 
-                            # PIL Image로 변환
-                            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-                            page_images.append(img)
-
-                        if page_images:
-                            # 이미지 세로 결합
-                            total_height = sum(img.height for img in page_images)
-                            max_width = max(img.width for img in page_images)
-
-                            combined = Image.new("RGB", (max_width, total_height), "white")
-                            y_offset = 0
-                            for img in page_images:
-                                combined.paste(img, (0, y_offset))
-                                y_offset += img.height
-
-                            # PNG 바이트로 변환
-                            buffer = BytesIO()
-                            combined.save(buffer, format="PNG")
-                            table.image_data = buffer.getvalue()
+                            table.image_data = pix.tobytes("png")
                             table.image_format = "png"
+                            captured_count += 1
 
                             log.debug(
-                                f"[TABLE] Captured multi-page merged table image: pages={merged_pages}, "
-                                f"size={len(table.image_data)} bytes"
+                                "[TABLE] Captured adjacent-merged table image: page=%s, "
+                                "bbox=(%.0f,%.0f,%.0f,%.0f), size=%d bytes",
+                                table.page_num, x0, y0, x1, y1, len(table.image_data),
                             )
+                        else:
+                            # 여러 페이지에 걸친 병합: 각 페이지 캡처 후 결합
+                            page_images = []
+
+                            for i, page_num in enumerate(merged_pages):
+                                page_idx = page_num - 1
+                                if page_idx < 0 or page_idx >= len(doc):
+                                    continue
+
+                                if page_idx != loaded_idx:
+                                    loaded_idx, page = page_idx, doc[page_idx]
+                                    page_w, page_h = page.rect.width, page.rect.height
+
+                                # 첫 페이지: 원래 bbox의 y0부터 페이지 끝까지
+                                # 중간/마지막 페이지: 페이지 시작부터 페이지 끝(또는 표 끝)까지
+                                if i == 0:
+                                    # 첫 페이지: 원래 표 시작부터
+                                    x0, y0, x1, y1 = table.bbox
+                                    y1 = page_h  # 페이지 끝까지
+                                elif i == len(merged_pages) - 1:
+                                    # 마지막 페이지: 페이지 시작부터 표 끝까지
+                                    x0 = table.bbox[0]
+                                    x1 = table.bbox[2]
+                                    y0 = 0
+                                    y1 = page_h * 0.5  # 상단 50% 정도로 추정
+                                else:
+                                    # 중간 페이지: 전체 페이지
+                                    x0 = table.bbox[0]
+                                    x1 = table.bbox[2]
+                                    y0 = 0
+                                    y1 = page_h
+
+                                x0 = max(0, x0 - padding_pts)
+                                y0 = max(0, y0 - padding_pts)
+                                x1 = min(page_w, x1 + padding_pts)
+                                y1 = min(page_h, y1 + padding_pts)
+
+                                clip_rect = fitz.Rect(x0, y0, x1, y1)
+                                pix = page.get_pixmap(matrix=matrix, clip=clip_rect)
+
+                                page_images.append(pix)
+
+                            if page_images:
+                                # 이미지 세로 결합 (pixmap 버퍼를 캔버스에 바로 복사)
+                                combined = Image.fromarray(_stack_pixmaps(page_images))
+
+                                # PNG 바이트로 변환 (무손실이므로 압축 수준만 낮춰 인코딩 시간 단축)
+                                buffer = BytesIO()
+                                combined.save(buffer, format="PNG", compress_level=1)
+                                table.image_data = buffer.getvalue()
+                                table.image_format = "png"
+                                captured_count += 1
 
-            except Exception as e:
-                log.warning(
-                    f"[TABLE] Failed to capture table image: "
-                    f"page={table.page_num}, error={e}"
-                )
-                continue
+                                log.debug(
+                                    "[TABLE] Captured multi-page merged table image: pages=%s, size=%d bytes",
+                                    merged_pages, len(table.image_data),
+                                )
 
-        doc.close()
+                except Exception as e:
+                    log.warning(
+                        f"[TABLE] Failed to capture table image: "
+                        f"page={table.page_num}, error={e}"
+                    )
+                    continue
 
-        captured_count = sum(1 for t in tables if t.image_data is not None)
         log.info(f"[TABLE] Captured {captured_count}/{len(tables)} table images")
 
     except Exception as e:
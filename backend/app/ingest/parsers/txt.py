@@ -2,8 +2,21 @@ from __future__ import annotations
 from pathlib import Path
 from typing import List
 
+# 이 크기를 넘는 파일은 줄 단위로 읽어 전체 텍스트를 메모리에 올리지 않음
+_STREAM_MIN_BYTES = 50 * 1024 * 1024
+
+
 def parse_txt(path: Path) -> List[str]:
-    text = path.read_text(encoding="utf-8", errors="ignore")
+    if path.stat().st_size > _STREAM_MIN_BYTES:
+        # 줄바꿈(\n)은 ASCII라 멀티바이트 문자가 줄 경계에서 잘리지 않음
+        with path.open("rb") as f:
+            lines = (
+                line
+                for raw in f
+                for line in raw.decode("utf-8", "ignore").splitlines()
+            )
+            return [s for s in map(str.strip, lines) if s]
+
+    text = path.read_bytes().decode("utf-8", "ignore")
     # 빈 줄 기준 문단 분리
-    blocks = [b.strip() for b in text.splitlines() if b.strip()]
-    return blocks
+    return [s for s in map(str.strip, text.splitlines()) if s]
@@ -0,0 +1,164 @@
+"""
+Vision API 응답 캐시
+
+같은 이미지 바이트(재인덱싱, 재시도, 문서 내 중복 그림)에 대해 Vision API를
+다시 호출하지 않도록 이미지 해시 기준으로 응답을 저장합니다.
+
+- 키: blake2b(image_data) + 작업 종류 + 모델 + 프롬프트 버전
+- 성공 결과는 만료 없이 저장, NO_TABLE/형식 오류 같은 음성 결과(None)는 짧은 TTL로 저장
+- 프로세스 내 LRU를 먼저 조회하고, VISION_CACHE_PATH 설정 시 SQLite에 영구 저장
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock, local
+from typing import Optional, Tuple
+
+from app.config import settings
+from app.services.logging import get_logger
+
+log = get_logger("app.ingest.parsers.vision_cache")
+
+# 프롬프트/후처리를 바꾸면 올려서 이전 응답을 무효화
+PROMPT_VERSION = "v2"
+
+# 음성 결과(None) 보관 시간 (초) - 재시도 폭주 방지용, 길게 두지 않음
+NEGATIVE_TTL = 600.0
+
+# 인메모리 캐시 최대 항목 수
+MEMORY_CACHE_MAXSIZE = 1024
+
+
+def image_digest(image_data: bytes) -> str:
+    """이미지 바이트 내용 해시 (같은 이미지 판별용)"""
+    return hashlib.blake2b(image_data, digest_size=20).hexdigest()
+
+
+def make_key(image_data: bytes, task: str, model: str) -> str:
+    """이미지 내용 기반 캐시 키"""
+    return make_key_from_digest(image_digest(image_data), task, model)
+
+
+def make_key_from_digest(digest: str, task: str, model: str) -> str:
+    """image_digest()로 이미 계산한 해시로 캐시 키 생성 (같은 이미지를 다시 해시하지 않음)"""
+    return f"{digest}:{task}:{model}:{PROMPT_VERSION}"
+
+
+class VisionCache:
+    """
+    Vision 응답 캐시 (인메모리 LRU)
+
+    get()은 (hit 여부, 값)을 반환합니다. 음성 결과는 값이 None인 hit입니다.
+    blocking이 True인 캐시는 디스크 I/O가 있으므로 이벤트 루프에서는 스레드로 호출합니다.
+    """
+
+    blocking = False
+
+    def __init__(self, maxsize: int = MEMORY_CACHE_MAXSIZE):
+        self._maxsize = maxsize
+        self._items: OrderedDict[str, Tuple[Optional[str], Optional[float]]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: str) -> Tuple[bool, Optional[str]]:
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return False, None
+            value, expires_at = item
+            if expires_at is not None and expires_at < time.time():
+                del self._items[key]
+                return False, None
+            self._items.move_to_end(key)
+            return True, value
+
+    def set(self, key: str, value: Optional[str]):
+        """값 저장 (None은 음성 결과로 NEGATIVE_TTL 후 만료)"""
+        self._remember(key, value, time.time() + NEGATIVE_TTL if value is None else None)
+
+    def _remember(self, key: str, value: Optional[str], expires_at: Optional[float]):
+        with self._lock:
+            self._items[key] = (value, expires_at)
+            self._items.move_to_end(key)
+            while len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+
+class SqliteVisionCache(VisionCache):
+    """
+    Vision 응답 캐시 (SQLite 영구 저장, 재시작/재인덱싱 간 공유)
+
+    같은 프로세스에서 반복 조회하는 키는 상위 클래스의 인메모리 LRU에서 바로 반환하고,
+    SQLite는 LRU에 없을 때만 조회합니다.
+    """
+
+    blocking = True
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS vision_cache (
+            key TEXT PRIMARY KEY,
+            value TEXT,
+            expires_at REAL
+        );
+    """
+
+    def __init__(self, path: Path, maxsize: int = MEMORY_CACHE_MAXSIZE):
+        super().__init__(maxsize)
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = local()
+
+        conn = self._conn()
+        conn.executescript(self._SCHEMA)
+        # 만료된 음성 결과 정리
+        cur = conn.execute(
+            "DELETE FROM vision_cache WHERE expires_at IS NOT NULL AND expires_at < ?",
+            (time.time(),),
+        )
+        if cur.rowcount:
+            log.info("vision cache: removed %d expired entries", cur.rowcount)
+
+    def _conn(self) -> sqlite3.Connection:
+        """현재 스레드 전용 커넥션 (autocommit)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self._path), timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL;")
+            conn.execute("PRAGMA synchronous=NORMAL;")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Tuple[bool, Optional[str]]:
+        hit, value = super().get(key)
+        if hit:
+            return hit, value
+        row = self._conn().execute(
+            "SELECT value, expires_at FROM vision_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return False, None
+        value, expires_at = row
+        if expires_at is not None and expires_at < time.time():
+            return False, None
+        self._remember(key, value, expires_at)
+        return True, value
+
+    def set(self, key: str, value: Optional[str]):
+        """값 저장 (None은 음성 결과로 NEGATIVE_TTL 후 만료)"""
+        expires_at = time.time() + NEGATIVE_TTL if value is None else None
+        self._conn().execute(
+            "INSERT OR REPLACE INTO vision_cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, value, expires_at),
+        )
+        self._remember(key, value, expires_at)
+
+
+vision_cache = (
+    SqliteVisionCache(Path(settings.vision_cache_path))
+    if settings.vision_cache_path
+    else VisionCache()
+)
@@ -8,151 +8,414 @@ OpenAI Vision API를 사용한 이미지 처리 모듈
 from __future__ import annotations
 
 import asyncio
-import base64
-from typing import Optional, Dict, Any
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from itertools import islice
+from typing import Optional, Dict, Any, Iterable, List, Tuple
 from pathlib import Path
 
+from PIL import Image
+
+try:
+    import pybase64 as base64  # SIMD base64 인코더 (설치된 경우, stdlib와 동일한 API)
+except ImportError:
+    import base64
+
 from app.services.openai_client import get_async_client
 from app.config import settings
 from app.services.logging import get_logger
 from app.ingest.parsers.image_extractor import ExtractedImage
+from app.ingest.parsers.vision_cache import image_digest, make_key, make_key_from_digest, vision_cache
 
 log = get_logger("app.ingest.parsers.vision_processor")
 
-# Rate limiting: 요청 간 최소 대기 시간 (초)
-REQUEST_DELAY = 0.5  # 500ms 간격으로 요청
+# Rate limiting: Vision API 분당 최대 요청 수와 순간 허용 요청 수 (토큰 버킷)
+# 환경 변수로 조정 가능: VISION_MAX_RPM=300
+VISION_MAX_RPM = int(os.getenv("VISION_MAX_RPM", "120"))
+VISION_RATE_BURST = int(os.getenv("VISION_RATE_BURST", "5"))
+# 분당 최대 토큰 수 (OpenAI TPM 한도와 같은 기준: 요청당 max_tokens + 입력 토큰)
+VISION_MAX_TPM = int(os.getenv("VISION_MAX_TPM", "200000"))
+
+# 요청별 출력 토큰 상한과 입력(프롬프트 + detail=high 이미지) 토큰 추정치
+TABLE_MAX_TOKENS = 8000  # 복합 표 대응을 위해 더 증가
+FIGURE_MAX_TOKENS = 500
+VISION_PROMPT_TOKENS = 1500
+
+# 표 → 마크다운 변환 프롬프트 (process_table_image, process_complex_table_from_image 공용)
+_TABLE_SYSTEM_PROMPT = (
+    "당신은 한국어 문서의 복잡한 표를 완벽하게 추출하는 전문가입니다.\n\n"
+    "## 핵심 원칙\n"
+    "**표에 보이는 모든 텍스트를 누락 없이 추출해야 합니다.**\n"
+    "이미지를 위에서 아래로, 왼쪽에서 오른쪽으로 **스캔하듯이** 모든 내용을 읽으세요.\n\n"
+    "## 복합 표 처리 (매우 중요!)\n"
+    "하나의 이미지에 여러 개의 논리적 섹션이 있을 수 있습니다:\n"
+    "- 예: '평가대상자 예외적용', '평가항목 및 비율', '감점사항'이 한 이미지에 있음\n"
+    "- 예: '업적평가', '역량평가', '공통지표'가 하위 섹션으로 존재\n"
+    "**모든 섹션을 빠짐없이 별도의 마크다운 표로 추출하세요.**\n\n"
+    "## 출력 형식\n"
+    "### [섹션명]\n"
+    "| 헤더1 | 헤더2 | 헤더3 |\n"
+    "|-------|-------|-------|\n"
+    "| 값1   | 값2   | 값3   |\n\n"
+    "### [다음 섹션명]\n"
+    "| 헤더1 | 헤더2 |\n"
+    "|-------|-------|\n"
+    "| 값1   | 값2   |\n\n"
+    "## 상세 규칙\n"
+    "1. **모든 섹션 추출**: 이미지 상단부터 하단까지 모든 섹션 헤더를 찾아 각각 별도 표로\n"
+    "2. **모든 행 추출**: 각 섹션 내 모든 행을 누락 없이 추출\n"
+    "3. **모든 열 추출**: 좌측부터 우측까지 모든 열의 값을 추출\n"
+    "4. 중첩된 하위 항목은 들여쓰기 표현 (예: '└ 인당매출액' 또는 '- 인당매출액')\n"
+    "5. 병합된 셀(rowspan/colspan)은 해당 범위의 모든 행에 값을 반복\n"
+    "6. 숫자, 단위, 특수문자(%,원,일,점 등) 정확히 보존\n"
+    "7. 빈 셀은 공백으로 유지\n"
+    "8. 계층 구조가 있으면 부모-자식 관계를 명확히 표현\n\n"
+    "## 체크리스트 (출력 전 확인)\n"
+    "□ 이미지의 모든 섹션 헤더를 찾았는가?\n"
+    "□ 각 섹션의 모든 행을 추출했는가?\n"
+    "□ 각 행의 모든 열을 추출했는가?\n"
+    "□ 이미지 하단까지 확인했는가?\n\n"
+    "## 금지사항\n"
+    "- 설명이나 부연 작성 금지\n"
+    "- 섹션 제목(### )과 마크다운 표만 출력\n"
+    "- 이미지에 표가 없으면 'NO_TABLE'만 출력\n"
+    "- **일부만 추출하는 것 금지 - 반드시 전체를 완전히 추출**"
+)
+
+_TABLE_USER_PROMPT = (
+    "이 이미지의 표를 **완전히** 마크다운으로 변환하세요.\n\n"
+    "1. 이미지 전체를 위에서 아래까지 스캔하세요\n"
+    "2. 모든 섹션 헤더(예: 평가대상자, 평가항목, 감점사항 등)를 찾으세요\n"
+    "3. 각 섹션의 모든 내용을 별도 마크다운 표로 출력하세요\n"
+    "4. 설명 없이 ### 섹션명과 표만 출력하세요"
+)
+
+# 그림 설명 프롬프트
+_FIGURE_SYSTEM_PROMPT = (
+    "당신은 문서 내 그림을 분석하는 전문가입니다. "
+    "그림의 내용을 간결하고 정확하게 설명하세요.\n\n"
+    "규칙:\n"
+    "1. 그림의 핵심 내용을 1-3문장으로 요약\n"
+    "2. 차트/다이어그램의 경우 유형과 주요 데이터 명시\n"
+    "3. 조직도/프로세스도의 경우 구조와 흐름 설명\n"
+    "4. 불필요한 수식어 제거, 사실 중심 서술\n"
+    "5. 한국어로 작성"
+)
+
+_FIGURE_USER_PROMPT = "다음 이미지의 내용을 간결하게 설명해주세요:"
+
+# 여러 그림을 한 요청으로 설명할 때의 사용자 프롬프트 ({count}: 이미지 수, JSON 모드로 요청)
+# 설명 안에 번호 목록이 있어도 섞이지 않도록 이미지 번호를 JSON 필드로 분리
+_FIGURE_BATCH_USER_PROMPT = (
+    "다음 {count}개 이미지의 내용을 각각 간결하게 설명해주세요.\n"
+    "응답은 JSON만 작성하고, 이미지 순서대로 index 1부터 {count}까지 한 번씩 포함하세요:\n"
+    '{{"figures": [{{"index": 1, "description": "설명"}}, {{"index": 2, "description": "설명"}}]}}'
+)
+
+# 한 요청에 묶을 최대 그림 수 (요청 왕복/고정 지연을 여러 그림에 나눠 부담)
+FIGURE_BATCH_SIZE = 6
+
+# 이미지 스트림(제너레이터)을 나눠 처리할 때 한 번에 Vision 처리에 넘기는 이미지 수
+IMAGE_STREAM_BATCH_SIZE = 24
+
+# 표가 없는 이미지에 대한 모델 응답 (_TABLE_SYSTEM_PROMPT 금지사항 참고)
+_NO_TABLE = "NO_TABLE"
+
+# Vision API(detail=high)가 서버에서 축소하는 기준 (긴 변 2048px 이내 → 짧은 변 768px)
+# 이보다 큰 이미지는 미리 같은 크기로 줄여 보내도 모델이 보는 해상도는 같음
+VISION_MAX_EDGE = 2048
+VISION_MAX_SHORT_EDGE = 768
+
+# 축소한 그림(figure)을 다시 인코딩할 때 JPEG 품질
+VISION_JPEG_QUALITY = 85
+
+# 이미지 축소/base64 인코딩 전용 스레드 수
+# Pillow 디코딩/리사이즈/PNG 압축은 GIL을 놓으므로 프로세스 풀 없이도 이벤트 루프가 멈추지 않음
+# (프로세스 풀은 수 MB 이미지를 주고받는 pickle 비용 때문에 오히려 느림)
+ENCODE_WORKERS = 4
+
+_encode_executor = ThreadPoolExecutor(max_workers=ENCODE_WORKERS, thread_name_prefix="vision_encode")
+
+
+class _RateLimiter:
+    """
+    Vision API 요청 토큰 버킷 (asyncio 전용)
+
+    요청 수(분당 max_rpm)와 토큰 수(분당 max_tpm) 두 버킷을 함께 확인합니다.
+    max_tokens가 큰 표 요청은 그림 요청보다 토큰 버킷을 많이 소모하므로,
+    표 요청이 몰려도 TPM 한도를 넘기 전에 스스로 속도를 늦춥니다.
+    여유가 있으면 대기 없이 바로 요청하고, 부족하면 필요한 만큼 채워질 때까지 대기합니다.
+    429를 받으면 pause()로 모든 요청을 잠시 멈춰 다른 작업이 연달아 429를 받지 않게 합니다.
+    단일 이벤트 루프 스레드에서만 상태를 바꾸므로 Lock이 필요 없습니다.
+    """
+
+    def __init__(self, max_rpm: int, burst: int, max_tpm: int):
+        self._request_rate = max(1, max_rpm) / 60.0  # 초당 채워지는 요청 수
+        self._token_rate = max(1, max_tpm) / 60.0  # 초당 채워지는 토큰 수
+        self._request_capacity = float(max(1, burst))
+        self._token_capacity = float(max(1, max_tpm))
+        self._requests = self._request_capacity
+        self._tokens = self._token_capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float):
+        elapsed = now - self._updated
+        self._requests = min(self._request_capacity, self._requests + elapsed * self._request_rate)
+        self._tokens = min(self._token_capacity, self._tokens + elapsed * self._token_rate)
+        self._updated = now
+
+    async def acquire(self, tokens: int):
+        """요청 1건과 tokens만큼의 용량 확보 (부족하면 대기)"""
+        # 한 요청이 버킷 전체보다 크면 가득 찰 때까지만 대기 (무한 대기 방지)
+        tokens = min(float(tokens), self._token_capacity)
+        while True:
+            now = time.monotonic()
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                continue
+            self._refill(now)
+            if self._requests >= 1.0 and self._tokens >= tokens:
+                self._requests -= 1.0
+                self._tokens -= tokens
+                return
+            await asyncio.sleep(max(
+                (1.0 - self._requests) / self._request_rate,
+                (tokens - self._tokens) / self._token_rate,
+            ))
+
+    def pause(self, seconds: float):
+        """rate limit 응답 후 모든 요청을 seconds 동안 멈춤"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        # 멈춘 동안에는 요청 버킷을 채우지 않음 (재개 직후 한꺼번에 몰리지 않도록)
+        self._requests = 0.0
+        self._updated = self._paused_until
+
+
+_rate_limiter = _RateLimiter(VISION_MAX_RPM, VISION_RATE_BURST, VISION_MAX_TPM)
+
+
+async def _cache_get(key: str) -> Tuple[bool, Optional[str]]:
+    """vision_cache 조회 (SQLite 캐시면 이벤트 루프를 막지 않도록 스레드에서 조회)"""
+    if vision_cache.blocking:
+        return await asyncio.to_thread(vision_cache.get, key)
+    return vision_cache.get(key)
+
+
+async def _cache_set(key: str, value: Optional[str]):
+    """vision_cache 저장 (SQLite 캐시면 스레드에서 기록)"""
+    if vision_cache.blocking:
+        await asyncio.to_thread(vision_cache.set, key, value)
+    else:
+        vision_cache.set(key, value)
 
 
 def _encode_image_to_base64(image_data: bytes) -> str:
-    """이미지 바이트를 base64 문자열로 인코딩"""
-    return base64.b64encode(image_data).decode('utf-8')
+    """이미지 바이트를 base64 문자열로 인코딩 (base64 출력은 ASCII 전용)"""
+    return base64.b64encode(image_data).decode('ascii')
+
 
+def _image_data_url(image_data: bytes, image_format: str) -> str:
+    """Vision API image_url용 data URL 생성 (재시도 간 재사용하도록 호출 전 한 번만 생성)"""
+    return f"data:image/{image_format};base64,{_encode_image_to_base64(image_data)}"
 
-async def process_table_image(image: ExtractedImage, retry_count: int = 3) -> Optional[str]:
+
+def _normalize_image(image_data: bytes, image_format: str, lossy: bool = False) -> Tuple[bytes, str]:
     """
-    표 이미지를 마크다운 표로 변환
+    Vision API가 실제로 사용하는 해상도보다 큰 이미지를 미리 축소
 
-    Args:
-        image: 추출된 표 이미지
-        retry_count: 재시도 횟수 (rate limit 대응)
+    서버 축소 기준(VISION_MAX_EDGE, VISION_MAX_SHORT_EDGE) 이하인 이미지는 그대로 반환합니다.
+    축소한 표는 글자 경계가 깨지지 않도록 PNG로, 그림은 lossy=True면 JPEG로 다시 인코딩합니다.
 
     Returns:
-        마크다운 표 문자열, 실패 시 None
+        (이미지 바이트, 이미지 포맷)
+    """
+    try:
+        img = Image.open(BytesIO(image_data))
+        width, height = img.size
+        scale = min(1.0, VISION_MAX_EDGE / max(width, height))
+        scale *= min(1.0, VISION_MAX_SHORT_EDGE / (min(width, height) * scale))
+        if scale >= 1.0:
+            return image_data, image_format
+
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        # JPEG는 디코딩 단계에서 DCT 축소 (전체 해상도 디코딩 생략)
+        img.draft("RGB", size)
+        has_alpha = "A" in img.getbands() or "transparency" in img.info
+        use_jpeg = lossy and not has_alpha
+        keep_modes = ("RGB", "L") if use_jpeg else ("RGB", "RGBA", "L", "LA")
+        if img.mode not in keep_modes:
+            img = img.convert("RGBA" if has_alpha else "RGB")
+        img = img.resize(size, Image.Resampling.LANCZOS)
+
+        buf = BytesIO()
+        if use_jpeg:
+            img.save(buf, format="JPEG", quality=VISION_JPEG_QUALITY)
+            out_format = "jpeg"
+        else:
+            img.save(buf, format="PNG")
+            out_format = "png"
+        if buf.tell() >= len(image_data):
+            # 팔레트/흑백 원본 등은 축소 후 재인코딩이 오히려 커질 수 있음
+            return image_data, image_format
+        log.debug(
+            "Downscaled image for Vision: %dx%d -> %dx%d, %d -> %d bytes",
+            width, height, size[0], size[1], len(image_data), buf.tell(),
+        )
+        return buf.getvalue(), out_format
+    except Exception as e:
+        # 디코딩 실패 시 원본 그대로 전송 (판단은 API에 맡김)
+        log.warning(f"Failed to normalize image, sending original: {e}")
+        return image_data, image_format
+
+
+def _prepare_image_url(image_data: bytes, image_format: str, lossy: bool = False) -> str:
+    """축소/인코딩 후 data URL 반환 (CPU 작업이므로 _prepare_image_url_async로 호출)"""
+    image_data, image_format = _normalize_image(image_data, image_format, lossy)
+    return _image_data_url(image_data, image_format)
+
+
+async def _prepare_image_url_async(image_data: bytes, image_format: str, lossy: bool = False) -> str:
+    """
+    _prepare_image_url을 전용 스레드 풀에서 실행
 
-    Example output:
-        | 항목 | 1년차 | 2년차 | 3년차 |
-        |------|------|------|------|
-        | 연차 | 11일 | 15일 | 16일 |
+    기본 executor(asyncio.to_thread)는 DB 기록 등 다른 작업과 공유하므로 이미지 작업은 분리합니다.
     """
-    for attempt in range(retry_count):
-        try:
-            # 이미지를 base64로 인코딩
-            base64_image = _encode_image_to_base64(image.image_data)
-            image_url = f"data:image/{image.image_format};base64,{base64_image}"
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _encode_executor, _prepare_image_url, image_data, image_format, lossy
+    )
 
-            # Vision API 호출 (비동기)
-            client = get_async_client()
-            response = await client.chat.completions.create(
-                model=settings.openai_advanced_model,  # gpt-4o (Vision 정확도 향상)
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "당신은 한국어 문서의 복잡한 표를 완벽하게 추출하는 전문가입니다.\n\n"
-                            "## 핵심 원칙\n"
-                            "**표에 보이는 모든 텍스트를 누락 없이 추출해야 합니다.**\n"
-                            "이미지를 위에서 아래로, 왼쪽에서 오른쪽으로 **스캔하듯이** 모든 내용을 읽으세요.\n\n"
-                            "## 복합 표 처리 (매우 중요!)\n"
-                            "하나의 이미지에 여러 개의 논리적 섹션이 있을 수 있습니다:\n"
-                            "- 예: '평가대상자 예외적용', '평가항목 및 비율', '감점사항'이 한 이미지에 있음\n"
-                            "- 예: '업적평가', '역량평가', '공통지표'가 하위 섹션으로 존재\n"
-                            "**모든 섹션을 빠짐없이 별도의 마크다운 표로 추출하세요.**\n\n"
-                            "## 출력 형식\n"
-                            "### [섹션명]\n"
-                            "| 헤더1 | 헤더2 | 헤더3 |\n"
-                            "|-------|-------|-------|\n"
-                            "| 값1   | 값2   | 값3   |\n\n"
-                            "### [다음 섹션명]\n"
-                            "| 헤더1 | 헤더2 |\n"
-                            "|-------|-------|\n"
-                            "| 값1   | 값2   |\n\n"
-                            "## 상세 규칙\n"
-                            "1. **모든 섹션 추출**: 이미지 상단부터 하단까지 모든 섹션 헤더를 찾아 각각 별도 표로\n"
-                            "2. **모든 행 추출**: 각 섹션 내 모든 행을 누락 없이 추출\n"
-                            "3. **모든 열 추출**: 좌측부터 우측까지 모든 열의 값을 추출\n"
-                            "4. 중첩된 하위 항목은 들여쓰기 표현 (예: '└ 인당매출액' 또는 '- 인당매출액')\n"
-                            "5. 병합된 셀(rowspan/colspan)은 해당 범위의 모든 행에 값을 반복\n"
-                            "6. 숫자, 단위, 특수문자(%,원,일,점 등) 정확히 보존\n"
-                            "7. 빈 셀은 공백으로 유지\n"
-                            "8. 계층 구조가 있으면 부모-자식 관계를 명확히 표현\n\n"
-                            "## 체크리스트 (출력 전 확인)\n"
-                            "□ 이미지의 모든 섹션 헤더를 찾았는가?\n"
-                            "□ 각 섹션의 모든 행을 추출했는가?\n"
-                            "□ 각 행의 모든 열을 추출했는가?\n"
-                            "□ 이미지 하단까지 확인했는가?\n\n"
-                            "## 금지사항\n"
-                            "- 설명이나 부연 작성 금지\n"
-                            "- 섹션 제목(### )과 마크다운 표만 출력\n"
-                            "- 이미지에 표가 없으면 'NO_TABLE'만 출력\n"
-                            "- **일부만 추출하는 것 금지 - 반드시 전체를 완전히 추출**"
-                        )
-                    },
+
+def _vision_messages(system_prompt: str, user_prompt: str, *image_urls: str) -> list[dict]:
+    """Vision 요청 messages 구성 (프롬프트는 모듈 상수, 요청마다 달라지는 건 image_url뿐)"""
+    return [
+        {"role": "system", "content": system_prompt},
+        {
+            "role": "user",
+            "content": [
+                {"type": "text", "text": user_prompt},
+                *(
                     {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": (
-                                    "이 이미지의 표를 **완전히** 마크다운으로 변환하세요.\n\n"
-                                    "1. 이미지 전체를 위에서 아래까지 스캔하세요\n"
-                                    "2. 모든 섹션 헤더(예: 평가대상자, 평가항목, 감점사항 등)를 찾으세요\n"
-                                    "3. 각 섹션의 모든 내용을 별도 마크다운 표로 출력하세요\n"
-                                    "4. 설명 없이 ### 섹션명과 표만 출력하세요"
-                                )
-                            },
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": image_url,
-                                    "detail": "high"  # 고해상도 분석
-                                }
-                            }
-                        ]
+                        "type": "image_url",
+                        "image_url": {
+                            "url": image_url,
+                            "detail": "high",  # 고해상도 분석
+                        },
                     }
-                ],
-                max_tokens=8000,  # 복합 표 대응을 위해 더 증가
-                temperature=0.0,  # 최대 정확성
-            )
+                    for image_url in image_urls
+                ),
+            ],
+        },
+    ]
+
+
+def _strip_code_fence(text: str) -> str:
+    """
+    응답 전체를 감싼 ``` 코드 블록 제거
+
+    첫 줄(```markdown 등)과 마지막 줄(```)만 잘라내므로 응답 전체를 줄 단위로 나누지 않습니다.
+    """
+    if not text.startswith("```"):
+        return text
+    body = text.partition("\n")[2]
+    head, _, last = body.rpartition("\n")
+    if last.strip() == "```":
+        body = head
+    return body.strip()
 
-            markdown_table = response.choices[0].message.content.strip()
+
+async def _complete_table(client, image_url: str) -> str:
+    """
+    표 변환 요청을 스트리밍으로 받아 응답 전체를 반환
+
+    표가 없는 이미지는 응답이 NO_TABLE로 시작하므로, 확인되는 즉시 스트림을 닫고
+    나머지 생성을 기다리지 않습니다 (세마포어 슬롯을 실제 표 처리에 양보).
+    """
+    stream = await client.chat.completions.create(
+        model=settings.openai_advanced_model,  # gpt-4o (Vision 정확도 향상)
+        messages=_vision_messages(_TABLE_SYSTEM_PROMPT, _TABLE_USER_PROMPT, image_url),
+        max_tokens=TABLE_MAX_TOKENS,
+        temperature=0.0,  # 최대 정확성
+        stream=True,
+    )
+    parts: List[str] = []
+    checking = True  # 지금까지 받은 내용이 NO_TABLE의 앞부분인 동안만 검사
+    try:
+        async for chunk in stream:
+            if not chunk.choices or not chunk.choices[0].delta.content:
+                continue
+            parts.append(chunk.choices[0].delta.content)
+            if checking:
+                head = "".join(parts).lstrip()
+                if head.startswith(_NO_TABLE):
+                    return _NO_TABLE
+                checking = _NO_TABLE.startswith(head)
+    finally:
+        await stream.close()
+    return "".join(parts)
+
+
+async def _call_vision_table(
+    image_data: bytes,
+    image_format: str,
+    page_num: int,
+    image_index: Optional[int] = None,
+    log_tag: str = "",
+    retry_count: int = 3,
+    image_url: Optional[str] = None,
+    cache_key: Optional[str] = None,
+) -> Optional[str]:
+    """
+    표 이미지 → 마크다운 표 변환 공통 처리 (캐시 조회, 재시도, 응답 후처리)
+
+    process_table_image와 process_complex_table_from_image는 같은 프롬프트/후처리를 쓰므로
+    이 함수 하나를 공유하고 로그 위치 정보만 다르게 넘깁니다.
+    """
+    where = f"page={page_num}" if image_index is None else f"page={page_num}, index={image_index}"
+    prefix = f"{log_tag} " if log_tag else ""
+
+    if cache_key is None:
+        cache_key = make_key(image_data, "table", settings.openai_advanced_model)
+    hit, cached = await _cache_get(cache_key)
+    if hit:
+        log.debug("%sVision cache hit (table): %s", prefix, where)
+        return cached
+
+    # 이미지를 축소/base64 data URL로 인코딩 (재시도마다 다시 인코딩하지 않음)
+    if image_url is None:
+        image_url = await _prepare_image_url_async(image_data, image_format)
+
+    for attempt in range(retry_count):
+        try:
+            # Vision API 호출 (비동기, 이미지 이해는 복잡한 추론이 필요하므로 고급 모델 사용)
+            await _rate_limiter.acquire(TABLE_MAX_TOKENS + VISION_PROMPT_TOKENS)
+            client = get_async_client()
+            markdown_table = (await _complete_table(client, image_url)).strip()
 
             # NO_TABLE 응답 처리
-            if markdown_table == "NO_TABLE":
-                log.warning(f"No table found in image: page={image.page_num}, index={image.image_index}")
+            if markdown_table == _NO_TABLE:
+                log.warning(f"{prefix}No table found in image: {where}")
+                await _cache_set(cache_key, None)
                 return None
 
             # 마크다운 코드 블록 제거 (```markdown ... ``` 형태로 올 수 있음)
-            if markdown_table.startswith("```"):
-                lines = markdown_table.split("\n")
-                # 첫 줄과 마지막 줄의 ``` 제거
-                if lines[0].startswith("```"):
-                    lines = lines[1:]
-                if lines and lines[-1].strip() == "```":
-                    lines = lines[:-1]
-                markdown_table = "\n".join(lines).strip()
+            markdown_table = _strip_code_fence(markdown_table)
 
             # 마크다운 표 형식 검증
             if "|" not in markdown_table or "---" not in markdown_table:
                 log.warning(
-                    f"Invalid markdown table format: page={image.page_num}, index={image.image_index}, "
+                    f"{prefix}Invalid markdown table format: {where}, "
                     f"content_preview={markdown_table[:100]}"
                 )
+                await _cache_set(cache_key, None)
                 return None
 
-            log.info(
-                f"Converted table to markdown: page={image.page_num}, index={image.image_index}, "
-                f"length={len(markdown_table)}"
-            )
+            log.info(f"{prefix}Converted table to markdown: {where}, length={len(markdown_table)}")
+            await _cache_set(cache_key, markdown_table)
             return markdown_table
 
         except Exception as e:
@@ -161,28 +424,68 @@ async def process_table_image(image: ExtractedImage, retry_count: int = 3) -> Op
                 # Rate limit: 지수 백오프 대기
                 wait_time = (2 ** attempt) + 1  # 2, 3, 5초
                 log.warning(
-                    f"Rate limit hit for table image (page={image.page_num}), "
+                    f"{prefix}Rate limit hit for table image ({where}), "
                     f"waiting {wait_time}s before retry {attempt + 1}/{retry_count}"
                 )
+                _rate_limiter.pause(wait_time)
                 await asyncio.sleep(wait_time)
                 continue
             else:
-                log.error(
-                    f"Failed to process table image: page={image.page_num}, index={image.image_index}, error={e}"
-                )
+                log.error(f"{prefix}Failed to process table image: {where}, error={e}")
                 return None
 
-    log.error(f"Failed to process table image after {retry_count} retries: page={image.page_num}")
+    log.error(f"{prefix}Failed to process table image after {retry_count} retries: {where}")
     return None
 
 
-async def process_figure_image(image: ExtractedImage, retry_count: int = 3) -> Optional[str]:
+async def process_table_image(
+    image: ExtractedImage,
+    retry_count: int = 3,
+    image_url: Optional[str] = None,
+    cache_key: Optional[str] = None,
+) -> Optional[str]:
+    """
+    표 이미지를 마크다운 표로 변환
+
+    Args:
+        image: 추출된 표 이미지
+        retry_count: 재시도 횟수 (rate limit 대응)
+        image_url: 미리 준비한 data URL (batch_process_images 프리페치용, 없으면 여기서 인코딩)
+        cache_key: 미리 계산한 캐시 키 (없으면 이미지를 해시해 생성)
+
+    Returns:
+        마크다운 표 문자열, 실패 시 None
+
+    Example output:
+        | 항목 | 1년차 | 2년차 | 3년차 |
+        |------|------|------|------|
+        | 연차 | 11일 | 15일 | 16일 |
+    """
+    return await _call_vision_table(
+        image.image_data,
+        image.image_format,
+        image.page_num,
+        image_index=image.image_index,
+        retry_count=retry_count,
+        image_url=image_url,
+        cache_key=cache_key,
+    )
+
+
+async def process_figure_image(
+    image: ExtractedImage,
+    retry_count: int = 3,
+    image_url: Optional[str] = None,
+    cache_key: Optional[str] = None,
+) -> Optional[str]:
     """
     그림 이미지의 자연어 설명 생성
 
     Args:
         image: 추출된 그림 이미지
         retry_count: 재시도 횟수 (rate limit 대응)
+        image_url: 미리 준비한 data URL (batch_process_images 프리페치용, 없으면 여기서 인코딩)
+        cache_key: 미리 계산한 캐시 키 (없으면 이미지를 해시해 생성)
 
     Returns:
         그림 설명 문자열, 실패 시 None
@@ -190,48 +493,26 @@ async def process_figure_image(image: ExtractedImage, retry_count: int = 3) -> O
     Example output:
         "조직도: CEO 아래 3개 부서(개발, 마케팅, 인사)로 구성된 계층 구조"
     """
+    if cache_key is None:
+        cache_key = make_key(image.image_data, "figure", settings.openai_advanced_model)
+    hit, cached = await _cache_get(cache_key)
+    if hit:
+        log.debug("Vision cache hit (figure): page=%s, index=%s", image.page_num, image.image_index)
+        return cached
+
+    # 이미지를 축소/base64 data URL로 인코딩 (재시도마다 다시 인코딩하지 않음)
+    if image_url is None:
+        image_url = await _prepare_image_url_async(image.image_data, image.image_format, lossy=True)
+
     for attempt in range(retry_count):
         try:
-            # 이미지를 base64로 인코딩
-            base64_image = _encode_image_to_base64(image.image_data)
-            image_url = f"data:image/{image.image_format};base64,{base64_image}"
-
             # Vision API 호출 (비동기)
+            await _rate_limiter.acquire(FIGURE_MAX_TOKENS + VISION_PROMPT_TOKENS)
             client = get_async_client()
             response = await client.chat.completions.create(
                 model=settings.openai_advanced_model,  # gpt-4o (Vision 정확도 향상)
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "당신은 문서 내 그림을 분석하는 전문가입니다. "
-                            "그림의 내용을 간결하고 정확하게 설명하세요.\n\n"
-                            "규칙:\n"
-                            "1. 그림의 핵심 내용을 1-3문장으로 요약\n"
-                            "2. 차트/다이어그램의 경우 유형과 주요 데이터 명시\n"
-                            "3. 조직도/프로세스도의 경우 구조와 흐름 설명\n"
-                            "4. 불필요한 수식어 제거, 사실 중심 서술\n"
-                            "5. 한국어로 작성"
-                        )
-                    },
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": "다음 이미지의 내용을 간결하게 설명해주세요:"
-                            },
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": image_url,
-                                    "detail": "high"
-                                }
-                            }
-                        ]
-                    }
-                ],
-                max_tokens=500,
+                messages=_vision_messages(_FIGURE_SYSTEM_PROMPT, _FIGURE_USER_PROMPT, image_url),
+                max_tokens=FIGURE_MAX_TOKENS,
                 temperature=0.2,
             )
 
@@ -241,6 +522,8 @@ async def process_figure_image(image: ExtractedImage, retry_count: int = 3) -> O
                 f"Generated figure description: page={image.page_num}, index={image.image_index}, "
                 f"length={len(description)}"
             )
+            # 빈 설명은 음성 결과로 저장 (NEGATIVE_TTL 후 다시 시도)
+            await _cache_set(cache_key, description or None)
             return description
 
         except Exception as e:
@@ -252,6 +535,7 @@ async def process_figure_image(image: ExtractedImage, retry_count: int = 3) -> O
                     f"Rate limit hit for figure image (page={image.page_num}), "
                     f"waiting {wait_time}s before retry {attempt + 1}/{retry_count}"
                 )
+                _rate_limiter.pause(wait_time)
                 await asyncio.sleep(wait_time)
                 continue
             else:
@@ -264,6 +548,162 @@ async def process_figure_image(image: ExtractedImage, retry_count: int = 3) -> O
     return None
 
 
+def _parse_figure_descriptions(text: str, count: int) -> Optional[List[str]]:
+    """
+    묶음 그림 설명 JSON 응답 → 이미지 순서대로의 설명 리스트
+
+    index가 1..count로 한 번씩 순서대로 있고 설명이 모두 비어 있지 않을 때만 받아들입니다.
+    (개수/번호가 어긋나면 어떤 설명이 어느 그림의 것인지 믿을 수 없으므로 전체를 버림)
+
+    Returns:
+        설명 리스트, 형식이 맞지 않으면 None
+    """
+    try:
+        parsed = json.loads(text)
+    except ValueError:
+        return None
+
+    items = parsed.get("figures") if isinstance(parsed, dict) else None
+    if not isinstance(items, list) or len(items) != count:
+        return None
+
+    descriptions = []
+    for n, item in enumerate(items, start=1):
+        if not isinstance(item, dict) or item.get("index") != n:
+            return None
+        description = item.get("description")
+        if not isinstance(description, str) or not description.strip():
+            return None
+        descriptions.append(description.strip())
+    return descriptions
+
+
+async def _describe_figures(
+    images: List[ExtractedImage],
+    image_urls: List[str],
+    retry_count: int = 3,
+) -> Optional[List[str]]:
+    """
+    여러 그림을 한 번의 Vision 요청으로 설명 (JSON 모드)
+
+    Returns:
+        images와 같은 순서의 설명 리스트, 실패하거나 응답 형식이 맞지 않으면 None
+    """
+    count = len(image_urls)
+    pages = [img.page_num for img in images]
+    for attempt in range(retry_count):
+        try:
+            await _rate_limiter.acquire(count * (FIGURE_MAX_TOKENS + VISION_PROMPT_TOKENS))
+            client = get_async_client()
+            response = await client.chat.completions.create(
+                model=settings.openai_advanced_model,  # gpt-4o (Vision 정확도 향상)
+                messages=_vision_messages(
+                    _FIGURE_SYSTEM_PROMPT,
+                    _FIGURE_BATCH_USER_PROMPT.format(count=count),
+                    *image_urls,
+                ),
+                max_tokens=count * FIGURE_MAX_TOKENS,
+                temperature=0.2,
+                response_format={"type": "json_object"},
+            )
+            descriptions = _parse_figure_descriptions(response.choices[0].message.content or "", count)
+            if descriptions is None:
+                log.warning(f"Invalid figure batch response, falling back to single requests: pages={pages}")
+                return None
+            log.info(f"Generated {count} figure descriptions in one request: pages={pages}")
+            return descriptions
+
+        except Exception as e:
+            error_str = str(e)
+            if "429" in error_str or "rate_limit" in error_str.lower():
+                wait_time = (2 ** attempt) + 1  # 2, 3, 5초
+                log.warning(
+                    f"Rate limit hit for figure batch (pages={pages}), "
+                    f"waiting {wait_time}s before retry {attempt + 1}/{retry_count}"
+                )
+                _rate_limiter.pause(wait_time)
+                await asyncio.sleep(wait_time)
+                continue
+            else:
+                log.error(f"Failed to process figure batch: pages={pages}, error={e}")
+                return None
+
+    log.error(f"Failed to process figure batch after {retry_count} retries: pages={pages}")
+    return None
+
+
+async def process_figure_images_batched(
+    images: List[ExtractedImage],
+    retry_count: int = 3,
+    image_urls: Optional[List[Optional[str]]] = None,
+    cache_keys: Optional[List[str]] = None,
+) -> List[Optional[str]]:
+    """
+    그림 여러 개(최대 FIGURE_BATCH_SIZE)의 설명을 한 요청으로 생성
+
+    캐시에 없는 그림만 한 요청에 담고, 요청이 실패하거나 응답 형식(개수/번호)이 맞지 않으면
+    묶음 전체를 process_figure_image로 개별 처리합니다. 남은 그림이 하나면 바로 개별 처리합니다.
+
+    Args:
+        images: 추출된 그림 이미지 리스트
+        retry_count: 재시도 횟수 (rate limit 대응)
+        image_urls: 이미지별로 미리 준비한 data URL (없는 항목은 여기서 인코딩)
+        cache_keys: 이미지별로 미리 계산한 캐시 키 (없으면 이미지를 해시해 생성)
+
+    Returns:
+        images와 같은 순서의 설명 리스트 (실패한 항목은 None)
+    """
+    results: List[Optional[str]] = [None] * len(images)
+    keys = cache_keys or [make_key(img.image_data, "figure", settings.openai_advanced_model) for img in images]
+    urls = list(image_urls) if image_urls else [None] * len(images)
+
+    pending = []
+    for i, key in enumerate(keys):
+        hit, cached = await _cache_get(key)
+        if hit:
+            results[i] = cached
+        else:
+            pending.append(i)
+
+    if len(pending) > 1:
+        for i in pending:
+            if urls[i] is None:
+                urls[i] = await _prepare_image_url_async(
+                    images[i].image_data, images[i].image_format, lossy=True
+                )
+        described = await _describe_figures(
+            [images[i] for i in pending], [urls[i] for i in pending], retry_count
+        )
+        if described is not None:
+            for i, description in zip(pending, described):
+                await _cache_set(keys[i], description)
+                results[i] = description
+            pending = []
+
+    # 단일 그림, 또는 묶음 요청이 실패한 그림은 개별 요청
+    for i in pending:
+        results[i] = await process_figure_image(
+            images[i], retry_count, image_url=urls[i], cache_key=keys[i]
+        )
+
+    return results
+
+
+def _unique_by_content(
+    images: List[ExtractedImage],
+) -> Tuple[List[Tuple[str, str]], Dict[Tuple[str, str], ExtractedImage]]:
+    """
+    이미지별 (타입, 내용 해시) 키와 키별 대표 이미지(첫 등장) 반환
+
+    반복되는 머리글/바닥글 표나 여러 페이지에 삽입된 같은 그림은 Vision API를 한 번만 호출합니다.
+    """
+    keys = [(img.image_type, image_digest(img.image_data)) for img in images]
+    unique: Dict[Tuple[str, str], ExtractedImage] = {}
+    for key, img in zip(keys, images):
+        unique.setdefault(key, img)
+    return keys, unique
+
+
 async def batch_process_images(
     images: list[ExtractedImage],
     max_concurrent: int = 2,  # Rate limit 방지를 위해 낮춤
@@ -288,53 +728,72 @@ async def batch_process_images(
         "failed": []
     }
 
-    # 이미지 타입별 분류
-    table_images = [img for img in images if img.image_type == "table"]
-    figure_images = [img for img in images if img.image_type == "figure"]
+    targets = [img for img in images if img.image_type in ("table", "figure")]
 
     # 세마포어를 사용하여 동시 요청 수 제한
     semaphore = asyncio.Semaphore(max_concurrent)
 
-    async def process_with_semaphore(img: ExtractedImage, processor):
-        async with semaphore:
-            # 요청 간 지연 추가 (rate limit 방지)
-            await asyncio.sleep(REQUEST_DELAY)
-            result = await processor(img)
-            return img, result
-
-    # 표 처리
-    log.info(f"Processing {len(table_images)} table images (max_concurrent={max_concurrent})...")
-    table_tasks = [
-        process_with_semaphore(img, process_table_image)
-        for img in table_images
+    # 세마포어를 기다리는 동안 미리 인코딩할 수 있는 요청 수 (data URL 메모리 상한)
+    prefetch = asyncio.Semaphore(max_concurrent * 2)
+
+    async def process_with_semaphore(group: List[Tuple[str, str]]):
+        images = [unique[key] for key in group]
+        # 내용 해시는 _unique_by_content에서 한 번만 계산하고 캐시 키로 재사용
+        # (캐시 작업 이름은 image_type과 같음)
+        cache_keys = [
+            make_key_from_digest(digest, image_type, settings.openai_advanced_model)
+            for image_type, digest in group
+        ]
+        async with prefetch:
+            # 앞선 요청이 응답을 기다리는 동안 이 요청의 이미지 축소/인코딩을 미리 시작
+            # (캐시에 있는 이미지는 인코딩하지 않음)
+            url_tasks = []
+            for img, cache_key in zip(images, cache_keys):
+                hit, _ = await _cache_get(cache_key)
+                url_tasks.append(None if hit else asyncio.create_task(_prepare_image_url_async(
+                    img.image_data, img.image_format, lossy=img.image_type == "figure"
+                )))
+            async with semaphore:
+                # 요청 속도는 각 processor 안의 _rate_limiter가 제한 (캐시 hit는 대기 없음)
+                image_urls = [await task if task else None for task in url_tasks]
+                if images[0].image_type == "figure":
+                    outputs = await process_figure_images_batched(
+                        images, image_urls=image_urls, cache_keys=cache_keys
+                    )
+                else:
+                    outputs = [await process_table_image(
+                        images[0], image_url=image_urls[0], cache_key=cache_keys[0]
+                    )]
+                return list(zip(images, outputs))
+
+    # 표/그림을 한 번에 gather (한쪽이 먼저 끝나도 세마포어가 놀지 않도록)
+    # 같은 내용의 이미지는 대표 이미지만 호출하고 결과를 원본 순서대로 펼침
+    keys, unique = _unique_by_content(targets)
+    # 표는 이미지당 한 요청, 그림은 FIGURE_BATCH_SIZE개씩 묶어 한 요청
+    table_keys = [key for key in unique if key[0] == "table"]
+    figure_keys = [key for key in unique if key[0] == "figure"]
+    groups = [[key] for key in table_keys] + [
+        figure_keys[i:i + FIGURE_BATCH_SIZE]
+        for i in range(0, len(figure_keys), FIGURE_BATCH_SIZE)
     ]
-    table_results = await asyncio.gather(*table_tasks, return_exceptions=True)
-
-    for item in table_results:
-        if isinstance(item, Exception):
-            log.error(f"Table processing exception: {item}")
-            continue
-        img, markdown = item
-        if markdown:
-            results["tables"].append((img, markdown))
-        else:
-            results["failed"].append(img)
-
-    # 그림 처리
-    log.info(f"Processing {len(figure_images)} figure images (max_concurrent={max_concurrent})...")
-    figure_tasks = [
-        process_with_semaphore(img, process_figure_image)
-        for img in figure_images
-    ]
-    figure_results = await asyncio.gather(*figure_tasks, return_exceptions=True)
-
-    for item in figure_results:
+    log.info(
+        f"Processing {len(targets)} images ({len(unique)} unique, {len(groups)} requests, "
+        f"max_concurrent={max_concurrent})..."
+    )
+    tasks = [process_with_semaphore(group) for group in groups]
+    outcomes = {}
+    for group, item in zip(groups, await asyncio.gather(*tasks, return_exceptions=True)):
+        for n, key in enumerate(group):
+            outcomes[key] = item if isinstance(item, Exception) else item[n]
+
+    for img, key in zip(targets, keys):
+        item = outcomes[key]
         if isinstance(item, Exception):
-            log.error(f"Figure processing exception: {item}")
+            log.error(f"{img.image_type.capitalize()} processing exception: {item}")
             continue
-        img, description = item
-        if description:
-            results["figures"].append((img, description))
+        _, output = item
+        if output:
+            results["tables" if img.image_type == "table" else "figures"].append((img, output))
         else:
             results["failed"].append(img)
 
@@ -346,6 +805,36 @@ async def batch_process_images(
     return results
 
 
+async def batch_process_image_stream(
+    images: Iterable[ExtractedImage],
+    max_concurrent: int = 2,
+    batch_size: int = IMAGE_STREAM_BATCH_SIZE,
+) -> Dict[str, Any]:
+    """
+    이미지 이터러블을 batch_size개씩 나눠 batch_process_images로 처리
+
+    추출 제너레이터를 끝까지 리스트로 만들지 않고 배치 단위로 소비하므로,
+    처리 중인 이미지/data URL은 한 배치 분량으로 제한됩니다.
+    (배치 간 같은 이미지는 vision_cache로 재호출 없이 처리)
+
+    Returns:
+        batch_process_images와 같은 형태 (배치 결과를 입력 순서대로 합침)
+    """
+    results = {
+        "tables": [],
+        "figures": [],
+        "failed": []
+    }
+
+    iterator = iter(images)
+    while batch := list(islice(iterator, batch_size)):
+        batch_results = await batch_process_images(batch, max_concurrent=max_concurrent)
+        for key, items in results.items():
+            items.extend(batch_results[key])
+
+    return results
+
+
 # ===========================================================================
 # 방안 B: 복잡한 표 Vision API 폴백
 # ===========================================================================
@@ -370,123 +859,10 @@ async def process_complex_table_from_image(
     Returns:
         마크다운 표 문자열, 실패 시 None
     """
-    for attempt in range(retry_count):
-        try:
-            base64_image = _encode_image_to_base64(image_data)
-            image_url = f"data:image/{image_format};base64,{base64_image}"
-
-            # 이미지 이해는 복잡한 추론이 필요하므로 고급 모델 사용
-            client = get_async_client()
-            response = await client.chat.completions.create(
-                model=settings.openai_advanced_model,  # gpt-4o (Vision 정확도 향상)
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "당신은 한국어 문서의 복잡한 표를 완벽하게 추출하는 전문가입니다.\n\n"
-                            "## 핵심 원칙\n"
-                            "**표에 보이는 모든 텍스트를 누락 없이 추출해야 합니다.**\n"
-                            "이미지를 위에서 아래로, 왼쪽에서 오른쪽으로 **스캔하듯이** 모든 내용을 읽으세요.\n\n"
-                            "## 복합 표 처리 (매우 중요!)\n"
-                            "하나의 이미지에 여러 개의 논리적 섹션이 있을 수 있습니다:\n"
-                            "- 예: '평가대상자 예외적용', '평가항목 및 비율', '감점사항'이 한 이미지에 있음\n"
-                            "- 예: '업적평가', '역량평가', '공통지표'가 하위 섹션으로 존재\n"
-                            "**모든 섹션을 빠짐없이 별도의 마크다운 표로 추출하세요.**\n\n"
-                            "## 출력 형식\n"
-                            "### [섹션명]\n"
-                            "| 헤더1 | 헤더2 | 헤더3 |\n"
-                            "|-------|-------|-------|\n"
-                            "| 값1   | 값2   | 값3   |\n\n"
-                            "### [다음 섹션명]\n"
-                            "| 헤더1 | 헤더2 |\n"
-                            "|-------|-------|\n"
-                            "| 값1   | 값2   |\n\n"
-                            "## 상세 규칙\n"
-                            "1. **모든 섹션 추출**: 이미지 상단부터 하단까지 모든 섹션 헤더를 찾아 각각 별도 표로\n"
-                            "2. **모든 행 추출**: 각 섹션 내 모든 행을 누락 없이 추출\n"
-                            "3. **모든 열 추출**: 좌측부터 우측까지 모든 열의 값을 추출\n"
-                            "4. 중첩된 하위 항목은 들여쓰기 표현 (예: '└ 인당매출액' 또는 '- 인당매출액')\n"
-                            "5. 병합된 셀(rowspan/colspan)은 해당 범위의 모든 행에 값을 반복\n"
-                            "6. 숫자, 단위, 특수문자(%,원,일,점 등) 정확히 보존\n"
-                            "7. 빈 셀은 공백으로 유지\n"
-                            "8. 계층 구조가 있으면 부모-자식 관계를 명확히 표현\n\n"
-                            "## 체크리스트 (출력 전 확인)\n"
-                            "□ 이미지의 모든 섹션 헤더를 찾았는가?\n"
-                            "□ 각 섹션의 모든 행을 추출했는가?\n"
-                            "□ 각 행의 모든 열을 추출했는가?\n"
-                            "□ 이미지 하단까지 확인했는가?\n\n"
-                            "## 금지사항\n"
-                            "- 설명이나 부연 작성 금지\n"
-                            "- 섹션 제목(### )과 마크다운 표만 출력\n"
-                            "- 이미지에 표가 없으면 'NO_TABLE'만 출력\n"
-                            "- **일부만 추출하는 것 금지 - 반드시 전체를 완전히 추출**"
-                        )
-                    },
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": (
-                                    "이 이미지의 표를 **완전히** 마크다운으로 변환하세요.\n\n"
-                                    "1. 이미지 전체를 위에서 아래까지 스캔하세요\n"
-                                    "2. 모든 섹션 헤더(예: 평가대상자, 평가항목, 감점사항 등)를 찾으세요\n"
-                                    "3. 각 섹션의 모든 내용을 별도 마크다운 표로 출력하세요\n"
-                                    "4. 설명 없이 ### 섹션명과 표만 출력하세요"
-                                )
-                            },
-                            {
-                                "type": "image_url",
-                                "image_url": {
-                                    "url": image_url,
-                                    "detail": "high"
-                                }
-                            }
-                        ]
-                    }
-                ],
-                max_tokens=8000,
-                temperature=0.0,
-            )
-
-            markdown_table = response.choices[0].message.content.strip()
-
-            if markdown_table == "NO_TABLE":
-                log.warning(f"[VISION_FALLBACK] No table found: page={page_num}")
-                return None
-
-            # 마크다운 코드 블록 제거
-            if markdown_table.startswith("```"):
-                lines = markdown_table.split("\n")
-                if lines[0].startswith("```"):
-                    lines = lines[1:]
-                if lines and lines[-1].strip() == "```":
-                    lines = lines[:-1]
-                markdown_table = "\n".join(lines).strip()
-
-            # 마크다운 표 형식 검증
-            if "|" not in markdown_table or "---" not in markdown_table:
-                log.warning(f"[VISION_FALLBACK] Invalid format: page={page_num}")
-                return None
-
-            log.info(
-                f"[VISION_FALLBACK] Success: page={page_num}, length={len(markdown_table)}"
-            )
-            return markdown_table
-
-        except Exception as e:
-            error_str = str(e)
-            if "429" in error_str or "rate_limit" in error_str.lower():
-                wait_time = (2 ** attempt) + 1
-                log.warning(
-                    f"[VISION_FALLBACK] Rate limit: page={page_num}, "
-                    f"waiting {wait_time}s, retry {attempt + 1}/{retry_count}"
-                )
-                await asyncio.sleep(wait_time)
-                continue
-            else:
-                log.error(f"[VISION_FALLBACK] Error: page={page_num}, error={e}")
-                return None
-
-    log.error(f"[VISION_FALLBACK] Failed after {retry_count} retries: page={page_num}")
-    return None
+    return await _call_vision_table(
+        image_data,
+        image_format,
+        page_num,
+        log_tag="[VISION_FALLBACK]",
+        retry_count=retry_count,
+    )
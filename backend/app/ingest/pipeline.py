@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Iterable, List, Optional, Tuple, Dict
+import asyncio
 import re
 import os
 from hashlib import sha256
@@ -23,7 +24,7 @@ from app.ingest.parsers.docx import parse_docx
 from app.ingest.parsers.txt import parse_txt
 from app.ingest.parsers.html import parse_html
 from app.ingest.parsers.image_extractor import extract_images_from_pdf, extract_images_with_full_tables
-from app.ingest.parsers.vision_processor import batch_process_images
+from app.ingest.parsers.vision_processor import batch_process_image_stream
 
 # 표 추출 모듈 (pdfplumber)
 try:
@@ -210,6 +211,7 @@ async def _extract_tables_hybrid(
 
     # 1단계: pdfplumber로 추출
     if HAS_PDFPLUMBER and TABLE_EXTRACTION_MODE in ("pdfplumber", "hybrid"):
+        pdf_doc = None  # 3~5단계에서 공유하는 PyMuPDF 문서 (파일을 한 번만 열어 재사용)
         try:
             log.info(f"[TABLE] Step 1: Extracting tables with pdfplumber from {file_path.name}")
             tables = extract_tables_pdfplumber(file_path)
@@ -228,16 +230,21 @@ async def _extract_tables_hybrid(
                 # x_overlap_ratio=0.1: 10%만 겹쳐도 인접으로 간주
                 tables = merge_adjacent_tables_on_page(tables, y_threshold=100.0, x_overlap_ratio=0.1)
 
+            try:
+                import fitz
+                pdf_doc = fitz.open(file_path)
+            except Exception as e:
+                log.warning(f"[TABLE] Failed to open PDF with PyMuPDF: {e}")
+
             # 3단계: 연속 페이지 표 병합
             if merge_continuation_tables and len(tables) > 1:
                 log.info(f"[TABLE] Step 3: Checking for multi-page tables...")
                 page_heights = {}
                 try:
-                    import fitz
-                    doc = fitz.open(file_path)
-                    for i in range(len(doc)):
-                        page_heights[i + 1] = doc[i].rect.height
-                    doc.close()
+                    if pdf_doc is None:
+                        raise RuntimeError("PDF not opened")
+                    for i in range(len(pdf_doc)):
+                        page_heights[i + 1] = pdf_doc[i].rect.height
                 except Exception as e:
                     log.warning(f"[TABLE] Failed to get page heights: {e}")
                     for t in tables:
@@ -248,9 +255,13 @@ async def _extract_tables_hybrid(
             # 4단계: PyMuPDF로 표 영역 이미지 캡처
             log.info(f"[TABLE] Step 4: Capturing table images...")
             if tables and capture_merged_table_images:
-                tables = capture_merged_table_images(file_path, tables, dpi=150, padding=10)
+                tables = await asyncio.to_thread(
+                    capture_merged_table_images, file_path, tables, dpi=150, padding=10, doc=pdf_doc
+                )
             elif tables and capture_table_images:
-                tables = capture_table_images(file_path, tables, dpi=150, padding=10)
+                tables = await asyncio.to_thread(
+                    capture_table_images, file_path, tables, dpi=150, padding=10, doc=pdf_doc
+                )
 
             # 5단계: 방안 B/C - 복잡한 표는 Vision API 폴백
             log.info(f"[TABLE] Step 5: Checking for complex tables (Vision fallback)...")
@@ -277,8 +288,10 @@ async def _extract_tables_hybrid(
 
                             # 방안 C: 고해상도 이미지 캡처
                             if capture_full_table_region:
-                                high_res_image = capture_full_table_region(
-                                    file_path, table.page_num, table.bbox, dpi=200, padding=15
+                                high_res_image = await asyncio.to_thread(
+                                    capture_full_table_region,
+                                    file_path, table.page_num, table.bbox, dpi=200, padding=15,
+                                    doc=pdf_doc,
                                 )
                                 if high_res_image:
                                     final_image_data = high_res_image
@@ -330,6 +343,9 @@ async def _extract_tables_hybrid(
             log.warning(f"[TABLE] Table extraction failed: {e}")
             import traceback
             log.debug(traceback.format_exc())
+        finally:
+            if pdf_doc is not None:
+                pdf_doc.close()
 
     return table_chunks
 
@@ -362,28 +378,35 @@ async def _process_pdf_images(
         # 1) 이미지 추출 (표 이미지는 전체 영역으로 확장 캡처)
         log.info(f"[IMAGE] Extracting images from {file_path.name}")
         # extract_images_with_full_tables: 표 이미지를 페이지 렌더링으로 전체 영역 캡처
-        extracted_images = extract_images_with_full_tables(file_path)
+        # 제너레이터를 배치 단위로 소비하므로 전체 이미지 목록을 한 번에 메모리에 올리지 않음
+        counts = {"total": 0, "kept": 0}
+
+        def _target_images():
+            for img in extract_images_with_full_tables(file_path):
+                counts["total"] += 1
+                # skip_tables 옵션: 표 이미지 제외 (pdfplumber로 이미 처리한 경우)
+                if skip_tables and img.image_type == "table":
+                    continue
+                counts["kept"] += 1
+                yield img
+
+        # 2) Vision API로 배치 처리 (추출과 처리를 IMAGE_STREAM_BATCH_SIZE개씩 번갈아 수행)
+        log.info(f"[IMAGE] Processing images with Vision API...")
+        results = await batch_process_image_stream(_target_images(), max_concurrent=3)
 
-        if not extracted_images:
+        if not counts["total"]:
             log.info(f"[IMAGE] No images found in {file_path.name}")
             return []
 
-        # skip_tables 옵션: 표 이미지 제외 (pdfplumber로 이미 처리한 경우)
         if skip_tables:
-            original_count = len(extracted_images)
-            extracted_images = [img for img in extracted_images if img.image_type != "table"]
             log.info(
-                f"[IMAGE] Skipping table images: {original_count} -> {len(extracted_images)} images"
+                f"[IMAGE] Skipping table images: {counts['total']} -> {counts['kept']} images"
             )
 
-        if not extracted_images:
+        if not counts["kept"]:
             return []
 
-        log.info(f"[IMAGE] Found {len(extracted_images)} images in {file_path.name}")
-
-        # 2) Vision API로 배치 처리
-        log.info(f"[IMAGE] Processing images with Vision API...")
-        results = await batch_process_images(extracted_images, max_concurrent=3)
+        log.info(f"[IMAGE] Found {counts['kept']} images in {file_path.name}")
 
         # 3) 결과 변환 (이미지 바이너리 데이터 포함)
         image_chunks = []
@@ -663,7 +686,7 @@ async def process_job(
                     job_store.inc(job_id)
                     had_error = True
                     continue
-                chunks_text = merge_blocks_to_chunks(blocks)
+                chunks_text = list(merge_blocks_to_chunks(blocks))
                 page_ranges = [(None, None)] * len(chunks_text)
                 image_metadata = {}  # 비-PDF는 이미지 없음
 
@@ -875,7 +898,7 @@ def quick_upsert_plaintext(
     단일 대용량 텍스트를 청크로 쪼개 즉시 벡터DB에 업서트. (동기)
     """
     blocks = [b for b in text.splitlines() if b.strip()]
-    chunks_text = merge_blocks_to_chunks(blocks)
+    chunks_text = list(merge_blocks_to_chunks(blocks))
     if not chunks_text:
         return 0
 
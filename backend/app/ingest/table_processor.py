@@ -5,6 +5,7 @@ pdfplumber + Vision API 폴백을 사용한 PDF 표 추출 기능 제공.
 """
 from __future__ import annotations
 
+import asyncio
 import os
 from pathlib import Path
 from typing import List, Optional, Tuple
@@ -73,6 +74,7 @@ async def extract_tables_hybrid(
 
     # 1단계: pdfplumber로 추출
     if HAS_PDFPLUMBER and TABLE_EXTRACTION_MODE in ("pdfplumber", "hybrid"):
+        pdf_doc = None  # 3~5단계에서 공유하는 PyMuPDF 문서 (파일을 한 번만 열어 재사용)
         try:
             log.info(f"[TABLE] Step 1: Extracting tables with pdfplumber from {file_path.name}")
             tables = extract_tables_pdfplumber(file_path)
@@ -88,16 +90,21 @@ async def extract_tables_hybrid(
                 log.info(f"[TABLE] Step 2: Merging adjacent tables on same page (found {len(tables)} tables)...")
                 tables = merge_adjacent_tables_on_page(tables, y_threshold=100.0, x_overlap_ratio=0.1)
 
+            try:
+                import fitz
+                pdf_doc = fitz.open(file_path)
+            except Exception as e:
+                log.warning(f"[TABLE] Failed to open PDF with PyMuPDF: {e}")
+
             # 3단계: 연속 페이지 표 병합
             if merge_continuation_tables and len(tables) > 1:
                 log.info(f"[TABLE] Step 3: Checking for multi-page tables...")
                 page_heights = {}
                 try:
-                    import fitz
-                    doc = fitz.open(file_path)
-                    for i in range(len(doc)):
-                        page_heights[i + 1] = doc[i].rect.height
-                    doc.close()
+                    if pdf_doc is None:
+                        raise RuntimeError("PDF not opened")
+                    for i in range(len(pdf_doc)):
+                        page_heights[i + 1] = pdf_doc[i].rect.height
                 except Exception as e:
                     log.warning(f"[TABLE] Failed to get page heights: {e}")
                     for t in tables:
@@ -108,9 +115,13 @@ async def extract_tables_hybrid(
             # 4단계: PyMuPDF로 표 영역 이미지 캡처
             log.info(f"[TABLE] Step 4: Capturing table images...")
             if tables and capture_merged_table_images:
-                tables = capture_merged_table_images(file_path, tables, dpi=150, padding=10)
+                tables = await asyncio.to_thread(
+                    capture_merged_table_images, file_path, tables, dpi=150, padding=10, doc=pdf_doc
+                )
             elif tables and capture_table_images:
-                tables = capture_table_images(file_path, tables, dpi=150, padding=10)
+                tables = await asyncio.to_thread(
+                    capture_table_images, file_path, tables, dpi=150, padding=10, doc=pdf_doc
+                )
 
             # 5단계: 방안 B/C - 복잡한 표는 Vision API 폴백
             log.info(f"[TABLE] Step 5: Checking for complex tables (Vision fallback)...")
@@ -137,8 +148,10 @@ async def extract_tables_hybrid(
 
                             # 방안 C: 고해상도 이미지 캡처
                             if capture_full_table_region:
-                                high_res_image = capture_full_table_region(
-                                    file_path, table.page_num, table.bbox, dpi=200, padding=15
+                                high_res_image = await asyncio.to_thread(
+                                    capture_full_table_region,
+                                    file_path, table.page_num, table.bbox, dpi=200, padding=15,
+                                    doc=pdf_doc,
                                 )
                                 if high_res_image:
                                     final_image_data = high_res_image
@@ -190,5 +203,8 @@ async def extract_tables_hybrid(
             log.warning(f"[TABLE] Table extraction failed: {e}")
             import traceback
             log.debug(traceback.format_exc())
+        finally:
+            if pdf_doc is not None:
+                pdf_doc.close()
 
     return table_chunks
@@ -12,6 +12,7 @@ from app.router.docs import router as docs_router
 from app.router.faq import router as faq_router
 from app.router.feedback import router as feedback_router
 from app.services.logging import setup_logging
+from app.services.query_log_writer import start_query_log_writer, stop_query_log_writer
 from app.services.scheduler import start_scheduler, stop_scheduler
 
 
@@ -34,14 +35,16 @@ app.add_middleware(
 
 
 @app.on_event("startup")
-def _startup():
+async def _startup():
     validate_on_startup()
     start_scheduler()
+    start_query_log_writer()
 
 
 @app.on_event("shutdown")
-def _shutdown():
+async def _shutdown():
     stop_scheduler()
+    await stop_query_log_writer()
 
 
 @app.get("/health")
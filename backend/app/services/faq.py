@@ -22,6 +22,7 @@ from sklearn.cluster import DBSCAN
 
 from app.services.embedding import embed_texts
 from app.services.redis_client import get_redis_client, is_redis_available
+from app.services.query_log_writer import enqueue_query_log
 from app.services.logging import get_logger
 from app.db.database import SessionLocal
 from app.db.models import QueryLog
@@ -62,28 +63,16 @@ async def log_question(
     """
     질문을 DB에 저장합니다.
 
+    요청 경로에서 바로 COMMIT 하지 않고 query_log_writer 큐에 넣어
+    백그라운드에서 배치로 저장합니다.
+
     Args:
         question: 사용자 질문
         answer_id: 답변 ID (선택)
         user_id: 사용자 ID (선택)
     """
-    db = SessionLocal()
-    try:
-        query_log = QueryLog(
-            question=question,
-            answer_id=answer_id,
-            user_id=user_id
-        )
-        db.add(query_log)
-        db.commit()
-
-        logger.debug(f"질문 로그 저장: {question[:30]}...")
-
-    except Exception as e:
-        logger.error(f"질문 로그 저장 실패: {e}")
-        db.rollback()
-    finally:
-        db.close()
+    await enqueue_query_log(question, answer_id=answer_id, user_id=user_id)
+    logger.debug(f"질문 로그 큐 적재: {question[:30]}...")
 
 
 def _load_questions_sync(days: int) -> tuple[List[str], List[List[float]]]:
@@ -94,20 +83,20 @@ def _load_questions_sync(days: int) -> tuple[List[str], List[List[float]]]:
     try:
         cutoff_time = datetime.utcnow() - timedelta(days=days)
 
-        # DB에서 최근 질문 조회
-        query_logs = (
-            db.query(QueryLog)
+        # DB에서 최근 질문 조회 (question 컬럼만 읽어 커버링 인덱스로 처리)
+        rows = (
+            db.query(QueryLog.question)
             .filter(QueryLog.created_at >= cutoff_time)
             .order_by(QueryLog.created_at.desc())
             .all()
         )
 
-        if not query_logs:
+        if not rows:
             logger.debug(f"최근 {days}일 질문 없음")
             return [], []
 
         # 질문 텍스트 추출
-        questions = [log.question for log in query_logs]
+        questions = [row.question for row in rows]
 
         # 임베딩 생성 (배치 처리) - CPU-bound
         logger.debug(f"FAQ 임베딩 생성 중: {len(questions)}개")
@@ -24,10 +24,18 @@ OpenAI 클라이언트 관리 - P0-7 라운드로빈 + 동시성 제어
 
 from __future__ import annotations
 import asyncio
+import itertools
 import threading
-from typing import Dict, Any, Optional, Callable, TypeVar
+from typing import Dict, Any, Optional, Callable, Sequence, TypeVar
 from functools import wraps
-from openai import OpenAI, AsyncOpenAI
+import httpx
+from openai import OpenAI, AsyncOpenAI, DefaultAsyncHttpxClient
+
+try:
+    import h2  # noqa: F401  (httpx HTTP/2 지원, 설치된 경우에만 사용)
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
 
 from app.config import settings
 from app.services.logging import get_logger
@@ -81,14 +89,13 @@ class OpenAIClientPool:
     - 질문4 → 키1 (순환)
     """
 
-    def __init__(self, api_keys: list[str], base_url: str | None = None):
+    def __init__(self, api_keys: Sequence[str], base_url: str | None = None):
         if not api_keys:
             raise ValueError("At least one API key is required")
 
-        self.api_keys = api_keys
+        self.api_keys = tuple(api_keys)
         self.base_url = base_url
-        self.current_index = 0
-        self.lock = threading.Lock()
+        self.lock = threading.Lock()  # 사용량 통계 보호용
 
         # 키별 사용량 통계
         self.usage_stats: Dict[str, Dict[str, int]] = {
@@ -102,6 +109,9 @@ class OpenAIClientPool:
             for key in api_keys
         ]
 
+        # 라운드로빈 순환자: next()는 C 구현이라 GIL 하에서 원자적 → 선택에 Lock 불필요
+        self._rr = itertools.cycle(tuple(zip(self.clients, self.api_keys)))
+
         log.info(
             f"[OpenAIClientPool] Initialized with {len(api_keys)} API keys "
             f"(base_url={base_url or 'default'})"
@@ -114,22 +124,15 @@ class OpenAIClientPool:
         Returns:
             OpenAI 클라이언트
         """
-        with self.lock:
-            client = self.clients[self.current_index]
-            key_suffix = self.api_keys[self.current_index][-8:]  # 마지막 8자리만
+        client, key = next(self._rr)
 
-            # 사용량 증가
-            self.usage_stats[self.api_keys[self.current_index]]["requests"] += 1
-
-            # 다음 인덱스로 이동 (순환)
-            self.current_index = (self.current_index + 1) % len(self.clients)
+        # 사용량 증가
+        with self.lock:
+            self.usage_stats[key]["requests"] += 1
 
-            log.debug(
-                f"[OpenAIClientPool] Serving client with key ...{key_suffix} "
-                f"(next: {self.current_index})"
-            )
+        log.debug(f"[OpenAIClientPool] Serving client with key ...{key[-8:]}")  # 마지막 8자리만
 
-            return client
+        return client
 
     def record_error(self, client: OpenAI, is_rate_limit: bool = False):
         """
@@ -201,9 +204,14 @@ def get_pool() -> OpenAIClientPool:
     return _pool
 
 
+# 비동기 클라이언트 공용 커넥션 풀 크기
+# 키별 클라이언트가 하나의 httpx 풀을 공유해 연결(TCP+TLS)을 재사용
+ASYNC_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "64"))
+ASYNC_MAX_KEEPALIVE = int(os.getenv("OPENAI_MAX_KEEPALIVE", "32"))
+
 # 비동기 클라이언트 (vision_processor 등에서 사용)
 _async_clients: list[AsyncOpenAI] = []
-_async_index = 0
+_async_rr: Optional[itertools.cycle] = None
 _async_lock = threading.Lock()
 
 
@@ -214,24 +222,34 @@ def get_async_client() -> AsyncOpenAI:
     Returns:
         AsyncOpenAI 클라이언트 (자동 순환)
     """
-    global _async_clients, _async_index
+    global _async_clients, _async_rr
 
-    # 지연 초기화
-    if not _async_clients:
+    # 지연 초기화 (Lock은 최초 1회만)
+    if _async_rr is None:
         with _async_lock:
-            if not _async_clients:
+            if _async_rr is None:
+                # API 키는 요청 헤더로 전달되므로 키가 달라도 같은 커넥션 풀 사용 가능
+                # HTTP/2(h2 설치 시)는 동시 요청을 한 연결에 다중화해 핸드셰이크를 줄임
+                http_client = DefaultAsyncHttpxClient(
+                    http2=HAS_H2,
+                    limits=httpx.Limits(
+                        max_connections=ASYNC_MAX_CONNECTIONS,
+                        max_keepalive_connections=ASYNC_MAX_KEEPALIVE,
+                    ),
+                )
                 _async_clients = [
-                    AsyncOpenAI(api_key=key, base_url=settings.openai_base_url)
+                    AsyncOpenAI(api_key=key, base_url=settings.openai_base_url, http_client=http_client)
                     if settings.openai_base_url
-                    else AsyncOpenAI(api_key=key)
+                    else AsyncOpenAI(api_key=key, http_client=http_client)
                     for key in settings.openai_api_keys
                 ]
-                log.info(f"[AsyncOpenAI] Initialized {len(_async_clients)} async clients")
+                _async_rr = itertools.cycle(tuple(_async_clients))
+                log.info(
+                    f"[AsyncOpenAI] Initialized {len(_async_clients)} async clients "
+                    f"(shared pool, http2={HAS_H2})"
+                )
 
-    with _async_lock:
-        client = _async_clients[_async_index]
-        _async_index = (_async_index + 1) % len(_async_clients)
-        return client
+    return next(_async_rr)
 
 
 # =============================================================================
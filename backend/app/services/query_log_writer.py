@@ -0,0 +1,124 @@
+# backend/app/services/query_log_writer.py
+"""
+질문 로그 배치 저장기
+
+요청마다 세션을 열고 INSERT/COMMIT 하는 대신, 질문 로그를 asyncio.Queue에 쌓아 두고
+백그라운드 태스크가 일정 개수/시간 단위로 모아 한 번에 저장합니다.
+
+Note: DB I/O는 run_in_executor로 스레드에서 실행하여 이벤트 루프 블로킹을 방지합니다.
+      writer가 시작되지 않은 환경(스크립트 등)에서는 즉시 저장으로 폴백합니다.
+"""
+import asyncio
+from typing import Dict, List, Optional
+
+from app.db.database import SessionLocal
+from app.db.models import QueryLog
+from app.services.logging import get_logger
+
+logger = get_logger(__name__)
+
+BATCH_SIZE = 500  # 한 번에 저장할 최대 행 수
+FLUSH_INTERVAL = 1.0  # 최대 대기 시간 (초)
+QUEUE_MAXSIZE = 10000  # 큐가 가득 차면 즉시 저장으로 폴백
+
+_queue: Optional[asyncio.Queue] = None
+_task: Optional[asyncio.Task] = None
+
+
+def _insert_batch(rows: List[Dict]) -> None:
+    """동기 함수: 질문 로그 묶음을 한 트랜잭션으로 저장 (스레드에서 실행)"""
+    db = SessionLocal()
+    try:
+        db.bulk_insert_mappings(QueryLog, rows)
+        db.commit()
+        logger.debug(f"질문 로그 배치 저장: {len(rows)}건")
+    except Exception as e:
+        logger.error(f"질문 로그 배치 저장 실패 ({len(rows)}건): {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
+async def _flush(rows: List[Dict]) -> None:
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, _insert_batch, rows)
+
+
+async def _flusher(queue: asyncio.Queue) -> None:
+    """큐에서 로그를 꺼내 BATCH_SIZE개 또는 FLUSH_INTERVAL초 단위로 저장"""
+    loop = asyncio.get_running_loop()
+    while True:
+        row = await queue.get()
+        batch = [row]
+        deadline = loop.time() + FLUSH_INTERVAL
+        try:
+            while len(batch) < BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout=timeout))
+                except asyncio.TimeoutError:
+                    break
+        finally:
+            # 취소(종료) 중이어도 이미 꺼낸 로그는 저장
+            await asyncio.shield(_flush(batch))
+
+
+def start_query_log_writer() -> None:
+    """
+    질문 로그 writer를 시작합니다. (FastAPI startup에서 호출)
+    """
+    global _queue, _task
+
+    if _task is not None:
+        return
+
+    _queue = asyncio.Queue(maxsize=QUEUE_MAXSIZE)
+    _task = asyncio.get_running_loop().create_task(_flusher(_queue))
+    logger.debug("질문 로그 writer 시작")
+
+
+async def stop_query_log_writer() -> None:
+    """
+    writer를 종료하고 큐에 남은 로그를 모두 저장합니다. (FastAPI shutdown에서 호출)
+    """
+    global _queue, _task
+
+    if _task is None:
+        return
+
+    _task.cancel()
+    try:
+        await _task
+    except asyncio.CancelledError:
+        pass
+
+    remaining: List[Dict] = []
+    while not _queue.empty():
+        remaining.append(_queue.get_nowait())
+    if remaining:
+        await _flush(remaining)
+
+    _queue, _task = None, None
+    logger.debug("질문 로그 writer 종료")
+
+
+async def enqueue_query_log(
+    question: str,
+    answer_id: Optional[str] = None,
+    user_id: Optional[int] = None,
+) -> None:
+    """
+    질문 로그를 저장 큐에 넣습니다.
+
+    writer가 실행 중이 아니거나 큐가 가득 찬 경우 즉시 저장합니다.
+    """
+    row = {"question": question, "answer_id": answer_id, "user_id": user_id}
+    if _queue is not None:
+        try:
+            _queue.put_nowait(row)
+            return
+        except asyncio.QueueFull:
+            logger.warning("질문 로그 큐 포화 - 즉시 저장으로 폴백")
+    await _flush([row])
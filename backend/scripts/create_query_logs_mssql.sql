@@ -19,8 +19,8 @@ CREATE TABLE query_logs (
 );
 
 -- 인덱스 생성 (성능 향상)
-CREATE INDEX idx_query_logs_created_at ON query_logs(created_at);
-CREATE INDEX idx_query_logs_user_id ON query_logs(user_id);
+CREATE INDEX idx_query_logs_created_at ON query_logs(created_at) INCLUDE (question);
+CREATE INDEX idx_query_logs_user_created ON query_logs(user_id, created_at);
 
 -- 생성 확인
 SELECT
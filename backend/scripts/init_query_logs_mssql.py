@@ -97,7 +97,7 @@ def main():
         print("\n테이블 정보:")
         print("  - 테이블명: query_logs")
         print("  - 컬럼: id, question, answer_id, user_id, created_at")
-        print("  - 인덱스: idx_query_logs_created_at, idx_query_logs_user_id")
+        print("  - 인덱스: idx_query_logs_created_at, idx_query_logs_user_created")
         print("  - Foreign Key: user_id -> users(id)")
 
     except Exception as e:
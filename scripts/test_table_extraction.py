@@ -81,7 +81,7 @@ def test_vision_extraction():
     print("=" * 60)
 
     # 이미지 추출
-    images = extract_images_from_pdf(test_file)
+    images = list(extract_images_from_pdf(test_file))
     table_images = [img for img in images if img.image_type == "table"]
 
     print(f"\n✅ 추출된 이미지: 총 {len(images)}개, 표 {len(table_images)}개")
@@ -148,7 +148,7 @@ def test_hybrid_extraction():
     print("\n[2단계] 이미지 기반 표 감지")
     print("-" * 40)
 
-    images = extract_images_from_pdf(test_file)
+    images = list(extract_images_from_pdf(test_file))
     table_images = [img for img in images if img.image_type == "table"]
     print(f"전체 이미지: {len(images)}개")
     print(f"표 이미지: {len(table_images)}개")